@@ -1,15 +1,15 @@
-import sys
-
-# Set a higher recursion limit for deep trees
-sys.setrecursionlimit(2000)
-
 class Node:
     """
     A single Node in the AVL Tree.
-    Adds a 'height' attribute crucial for balance calculation.
+    Adds a 'height' attribute crucial for balance calculation, and a 'size'
+    attribute (number of nodes in this subtree) for order statistics.
+    __slots__ keeps every node small: no per-instance __dict__.
     """
-    def __init__(self, value):
-        # The data stored in the node
+    __slots__ = ("key", "value", "left", "right", "height", "size")
+
+    def __init__(self, key, value=None):
+        # The key the tree is ordered by, and the value mapped to it
+        self.key = key
         self.value = value
         # Pointer to the left child node (initially None)
         self.left = None
@@ -17,24 +17,73 @@ class Node:
         self.right = None
         # Height of the node. A single node has height 1.
         self.height = 1
+        # Number of nodes in the subtree rooted here, including this one
+        self.size = 1
 
 class AVLTree:
     """
-    Represents the entire AVL Tree structure.
-    Implements self-balancing through rotation methods upon insertion.
+    Represents the entire AVL Tree structure, used as a sorted map.
+    Implements self-balancing through rotation methods upon insertion and deletion.
+
+    Insertion and deletion walk down the tree in a loop, remember the path,
+    and rebalance on the way back up, so no operation recurses or depends on
+    the recursion limit. Subtree sizes, kept up to date by the rotations,
+    give rank, select, count_range and percentile in O(log n).
     """
     def __init__(self):
         # Initialize the root of the tree to be empty
         self.root = None
 
+    @classmethod
+    def from_sorted(cls, keys, values=None):
+        """
+        Builds a perfectly balanced tree from strictly increasing keys in O(n),
+        without any rotations.
+
+        Args:
+            keys (iterable): The keys, in strictly increasing order.
+            values (iterable, optional): The matching values. Defaults to None for every key.
+        """
+        keys = list(keys)
+        values = [None] * len(keys) if values is None else list(values)
+        if len(values) != len(keys):
+            raise ValueError("keys and values must have the same length")
+        for previous, key in zip(keys, keys[1:]):
+            if not previous < key:
+                raise ValueError("keys must be strictly increasing")
+
+        def build(lo, hi):
+            # Recursion depth is the tree height, about log2(n)
+            if lo >= hi:
+                return None
+            mid = (lo + hi) // 2
+            node = Node(keys[mid], values[mid])
+            node.left = build(lo, mid)
+            node.right = build(mid + 1, hi)
+            node.height = 1 + max(cls._get_height(node.left), cls._get_height(node.right))
+            node.size = hi - lo
+            return node
+
+        tree = cls()
+        tree.root = build(0, len(keys))
+        return tree
+
     # --- Height and Balance Helpers ---
 
-    def _get_height(self, node):
+    @staticmethod
+    def _get_height(node):
         """Safely returns the height of the node, or 0 if the node is None."""
         if not node:
             return 0
         return node.height
 
+    @staticmethod
+    def _get_size(node):
+        """Safely returns the subtree size of the node, or 0 if the node is None."""
+        if not node:
+            return 0
+        return node.size
+
     def _get_balance(self, node):
         """
         Calculates the Balance Factor (BF) of a node.
@@ -45,6 +94,14 @@ class AVLTree:
             return 0
         return self._get_height(node.left) - self._get_height(node.right)
 
+    def _update(self, node):
+        """Recomputes the height and size of a node from its children."""
+        left, right = node.left, node.right
+        left_height, left_size = (left.height, left.size) if left is not None else (0, 0)
+        right_height, right_size = (right.height, right.size) if right is not None else (0, 0)
+        node.height = 1 + (left_height if left_height > right_height else right_height)
+        node.size = 1 + left_size + right_size
+
     # --- Rotation Methods ---
 
     def _right_rotate(self, y):
@@ -56,10 +113,10 @@ class AVLTree:
         x.right = y
         y.left = T2
 
-        # Update heights (MUST be done bottom-up: y's height first, then x's height)
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
-        x.height = 1 + max(self._get_height(x.left), self._get_height(x.right))
-        
+        # Update heights and sizes (MUST be done bottom-up: y first, then x)
+        self._update(y)
+        self._update(x)
+
         # Return the new root of the subtree
         return x
 
@@ -72,108 +129,316 @@ class AVLTree:
         y.left = x
         x.right = T2
 
-        # Update heights (MUST be done bottom-up: x's height first, then y's height)
-        x.height = 1 + max(self._get_height(x.left), self._get_height(x.right))
-        y.height = 1 + max(self._get_height(y.left), self._get_height(y.right))
+        # Update heights and sizes (MUST be done bottom-up: x first, then y)
+        self._update(x)
+        self._update(y)
 
         # Return the new root of the subtree
         return y
 
-    # --- Insertion Method ---
+    def _rebalance(self, node):
+        """
+        Updates a node whose subtree changed and rotates it if it became
+        unbalanced. Returns the root of the (potentially new) subtree.
+        """
+        self._update(node)
+        left, right = node.left, node.right
+        balance = (left.height if left is not None else 0) - (right.height if right is not None else 0)
+
+        if balance > 1:
+            # Left Right (LR): rotate the left child first
+            if self._get_balance(node.left) < 0:
+                node.left = self._left_rotate(node.left)
+            # Left Left (LL)
+            return self._right_rotate(node)
 
-    def insert(self, root, value):
+        if balance < -1:
+            # Right Left (RL): rotate the right child first
+            if self._get_balance(node.right) > 0:
+                node.right = self._right_rotate(node.right)
+            # Right Right (RR)
+            return self._left_rotate(node)
+
+        return node
+
+    def _retrace(self, path):
+        """
+        Rebalances every node on a root-to-leaf path, deepest first, and
+        re-links each rotated subtree to its parent.
         """
-        Inserts a new value into the tree and performs rebalancing if needed.
-        This method returns the root of the (potentially new) subtree.
+        child = None
+        for depth in range(len(path) - 1, -1, -1):
+            node = path[depth]
+            if child is not None:
+                # The child below may have been replaced by a rotation
+                if node.left is path[depth + 1]:
+                    node.left = child
+                else:
+                    node.right = child
+            child = self._rebalance(node)
+        self.root = child
+
+    # --- Insertion and Deletion ---
+
+    def insert(self, key, value=None):
         """
-        # 1. Standard BST Insertion
-        if not root:
-            return Node(value)
-        
-        if value < root.value:
-            root.left = self.insert(root.left, value)
-        elif value > root.value:
-            root.right = self.insert(root.right, value)
+        Inserts key with the given value, or replaces the value if the key is present.
+
+        Returns:
+            bool: True if a new key was added, False if an existing one was updated.
+        """
+        if self.root is None:
+            self.root = Node(key, value)
+            return True
+
+        # 1. Standard BST descent, remembering the path
+        path = []
+        node = self.root
+        while node is not None:
+            if key == node.key:
+                node.value = value
+                return False
+            path.append(node)
+            node = node.left if key < node.key else node.right
+
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = Node(key, value)
+        else:
+            parent.right = Node(key, value)
+
+        # 2. Update heights and sizes bottom-up, rotating where needed
+        self._retrace(path)
+        return True
+
+    def delete(self, key):
+        """
+        Removes key from the tree.
+
+        Returns:
+            bool: True if the key was removed, False if it was not present.
+        """
+        path = []
+        node = self.root
+        while node is not None and key != node.key:
+            path.append(node)
+            node = node.left if key < node.key else node.right
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            # Two children: move the in-order successor's entry here and
+            # delete the successor node instead (it has no left child)
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.key, node.value = successor.key, successor.value
+            node = successor
+
+        # node has at most one child, which takes its place
+        child = node.left if node.left is not None else node.right
+        if not path:
+            self.root = child
+            return True
+        parent = path[-1]
+        if parent.left is node:
+            parent.left = child
         else:
-            # Value is a duplicate, return the node (skip insertion)
-            return root
-
-        # 2. Update height of the current node
-        root.height = 1 + max(self._get_height(root.left), self._get_height(root.right))
-
-        # 3. Get the balance factor
-        balance = self._get_balance(root)
-
-        # 4. Check for imbalance and perform rotations
-        
-        # Case 1: Left Left (LL) - Right Rotation
-        # Balance > 1 means heavy left, and new node inserted in the left of the left child.
-        if balance > 1 and value < root.left.value:
-            print(f"-> Rebalance at {root.value}: LL Case, Performing Right Rotate.")
-            return self._right_rotate(root)
-
-        # Case 2: Right Right (RR) - Left Rotation
-        # Balance < -1 means heavy right, and new node inserted in the right of the right child.
-        if balance < -1 and value > root.right.value:
-            print(f"-> Rebalance at {root.value}: RR Case, Performing Left Rotate.")
-            return self._left_rotate(root)
-
-        # Case 3: Left Right (LR) - Left then Right Rotation
-        # Balance > 1 means heavy left, but new node inserted in the right of the left child.
-        if balance > 1 and value > root.left.value:
-            print(f"-> Rebalance at {root.value}: LR Case, Performing Left then Right Rotate.")
-            root.left = self._left_rotate(root.left)
-            return self._right_rotate(root)
-
-        # Case 4: Right Left (RL) - Right then Left Rotation
-        # Balance < -1 means heavy right, but new node inserted in the left of the right child.
-        if balance < -1 and value < root.right.value:
-            print(f"-> Rebalance at {root.value}: RL Case, Performing Right then Left Rotate.")
-            root.right = self._right_rotate(root.right)
-            return self._left_rotate(root)
-
-        # If no rotation is needed, return the current root
-        return root
+            parent.right = child
+
+        self._retrace(path)
+        return True
+
+    # --- Lookup ---
+
+    def _find(self, key):
+        node = self.root
+        while node is not None and key != node.key:
+            node = node.left if key < node.key else node.right
+        return node
+
+    def get(self, key, default=None):
+        """Returns the value mapped to key, or default if the key is not present."""
+        node = self._find(key)
+        return default if node is None else node.value
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __getitem__(self, key):
+        node = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.value
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    def __delitem__(self, key):
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def __len__(self):
+        return self._get_size(self.root)
+
+    # --- Order Statistics ---
+
+    def rank(self, key):
+        """Returns the number of keys strictly smaller than key, in O(log n)."""
+        rank = 0
+        node = self.root
+        while node is not None:
+            if key <= node.key:
+                node = node.left
+            else:
+                rank += self._get_size(node.left) + 1
+                node = node.right
+        return rank
+
+    def select(self, k):
+        """Returns the k-th smallest key (0-based), in O(log n)."""
+        if not 0 <= k < len(self):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = self._get_size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.key
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def count_range(self, lo=None, hi=None):
+        """
+        Returns the number of keys with lo <= key < hi, in O(log n), as the
+        difference of two ranks. Either bound may be None for an open end.
+        """
+        below_hi = len(self) if hi is None else self.rank(hi)
+        below_lo = 0 if lo is None else self.rank(lo)
+        return max(below_hi - below_lo, 0)
+
+    def percentile(self, p):
+        """
+        Returns the p-th percentile key (0 <= p <= 100) by the nearest-rank
+        method: the smallest key with at least p percent of the keys at or
+        below it. One select, so O(log n).
+        """
+        if not 0 <= p <= 100:
+            raise ValueError("percentile must be between 0 and 100")
+        n = len(self)
+        if n == 0:
+            raise ValueError("percentile of an empty tree")
+        # ceil(p * n / 100) - 1, in integer arithmetic for integer p
+        k = max(-(-p * n // 100) - 1, 0)
+        return self.select(int(k))
+
+    def range(self, lo=None, hi=None):
+        """
+        Yields the (key, value) pairs with lo <= key < hi in sorted order.
+        Either bound may be None for an open end. Only the subtrees that can
+        hold keys in range are visited, so this costs O(log n + output).
+        """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                if lo is not None and node.key < lo:
+                    # Everything on the left is below the range too
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            else:
+                node = stack.pop()
+                if hi is not None and not node.key < hi:
+                    return
+                yield node.key, node.value
+                node = node.right
 
     # --- Traversal Methods (Standard for all Binary Trees) ---
-    
-    def __inorder_recursive(self, node):
-        """Helper for Inorder Traversal: Left -> Root -> Right (yields sorted output)"""
-        if node:
-            self.__inorder_recursive(node.left)
-            print(f"{node.value}(h={node.height})", end=" ")
-            self.__inorder_recursive(node.right)
+
+    def __iter__(self):
+        """Yields the keys in sorted order."""
+        for key, _ in self.range():
+            yield key
+
+    def items(self):
+        """Yields the (key, value) pairs in sorted order."""
+        return self.range()
 
     def inorder_traversal(self):
         """Performs Inorder Traversal (Left, Root, Right)."""
-        print("Inorder Traversal (L-R-R) [Value(Height)]:", end=" ")
-        self.__inorder_recursive(self.root)
+        print("Inorder Traversal (L-R-R) [Key(Height)]:", end=" ")
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                print(f"{node.key}(h={node.height})", end=" ")
+                node = node.right
         print("\n")
 
 
 # --- Example Usage ---
 
 if __name__ == "__main__":
-    
+
     # 1. Initialize the AVL Tree
     avl_tree = AVLTree()
-    
-    # Values inserted in this order. 
+
+    # Values inserted in this order.
     # This sequence forces several rebalancing rotations (e.g., insertion of 40 forces RL).
     values = [30, 20, 10, 25, 23, 27, 40]
-    
+
     print("--- AVL Tree Construction and Self-Balancing Operations ---")
-    
-    # 2. Insert all values sequentially and observe rotations
+
+    # 2. Insert all values sequentially; rotations happen silently
     for val in values:
-        print(f"Attempting to insert: {val}")
-        avl_tree.root = avl_tree.insert(avl_tree.root, val)
-    
+        avl_tree.insert(val, f"item {val}")
+
     print("\n--- Final Tree State ---")
-    
+
     # 3. Demonstrate Traversal (Inorder should be sorted, showing node heights)
     # The final tree should be short and balanced, ensuring O(log n) efficiency.
-    avl_tree.inorder_traversal() 
-    
+    avl_tree.inorder_traversal()
+
     print("Final Tree Height:", avl_tree._get_height(avl_tree.root))
     print("\nFinal structure is fully balanced (height difference is max 1 at all nodes).")
+
+    # 4. Map operations and order statistics
+    print(f"\nValue at 25: {avl_tree[25]}")
+    print(f"Keys below 26: {avl_tree.rank(26)}")           # Expected: 4
+    print(f"Third smallest key: {avl_tree.select(2)}")     # Expected: 23
+    print(f"Keys in [20, 30): {[k for k, _ in avl_tree.range(20, 30)]}")
+
+    avl_tree.delete(20)
+    avl_tree.delete(25)
+    print(f"After deleting 20 and 25: {list(avl_tree)}")
+
+    # 5. Bulk build from sorted keys in O(n)
+    big_tree = AVLTree.from_sorted(range(1_000_000))
+    print(f"\nBulk-built {len(big_tree)} keys, height {big_tree._get_height(big_tree.root)}")
+    print(f"Median key: {big_tree.select(len(big_tree) // 2)}")
+
+    # 6. Sliding window of latencies: keys are (latency, sequence number) so
+    # equal latencies stay distinct, and old samples are deleted as they expire
+    import random
+    from collections import deque
+    rng = random.Random(7)
+    window, samples = AVLTree(), deque()
+    for seq in range(10_000):
+        sample = (round(rng.lognormvariate(4, 0.5)), seq)
+        window.insert(sample)
+        samples.append(sample)
+        if len(samples) > 1000:
+            window.delete(samples.popleft())
+    print(f"\nLast {len(window)} latencies: p50 {window.percentile(50)[0]} ms, "
+          f"p99 {window.percentile(99)[0]} ms")
+    print(f"Samples below 100 ms: {window.rank((100,))}, in [50, 80) ms: {window.count_range((50,), (80,))}")
@@ -0,0 +1,329 @@
+from collections import deque
+
+from graphs import CSRGraph
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for engine="numpy"
+    np = None
+
+def bellman_ford(vertices, edges, start_node, engine="classic"):
+    """
+    Finds the shortest path distance from a start_node to all other nodes 
+    in a weighted graph, potentially containing negative edge weights, 
+    using the Bellman-Ford algorithm.
+
+    Args:
+        vertices (list or CSRGraph): A list of all vertex IDs (e.g., [0, 1, 2, 3]),
+                      or a compiled graphs.CSRGraph, in which case edges is ignored.
+        edges (list): A list of all edges as tuples (u, v, weight).
+                      Example: [(0, 1, 6), (0, 2, 7), ...]
+        start_node (int/str): The node to start the shortest path calculation from.
+        engine (str, optional): How the edges are relaxed.
+                      "classic" (default) sweeps every edge up to V-1 times.
+                      "queue" (SPFA) only relaxes edges out of vertices whose distance
+                      changed, using a FIFO queue with the Small Label First rule.
+                      "numpy" relaxes all edges per pass at once with np.minimum.at;
+                      its distances are returned as floats.
+
+    Returns:
+        tuple: (distances, predecessors) dictionaries if no negative cycle is found,
+               or (False, cycle) if a negative cycle is reachable from start_node,
+               where cycle lists its vertices in edge order (the last vertex has
+               an edge back to the first).
+        bool: False if the graph is empty or start_node is missing.
+    """
+    if engine not in ("classic", "queue", "numpy"):
+        raise ValueError(f"Unknown Bellman-Ford engine: {engine!r}")
+
+    if isinstance(vertices, CSRGraph):
+        graph = vertices
+    elif engine != "classic":
+        # The faster engines work on dense integer ids
+        if not vertices or start_node not in vertices:
+            return False
+        adjacency = {node: [] for node in vertices}
+        for u, v, weight in edges:
+            adjacency[u].append((v, weight))
+        graph = CSRGraph.from_adjacency(adjacency, directed=True)
+    else:
+        graph = None
+
+    if graph is not None:
+        if engine == "queue":
+            return _bellman_ford_queue(graph, start_node)
+        if engine == "numpy":
+            return _bellman_ford_numpy(graph, start_node)
+        return _bellman_ford_csr(graph, start_node)
+
+    # Check if the graph is empty or the start node is missing
+    if not vertices or start_node not in vertices:
+        return False # Or raise an exception
+        
+    # 1. Initialization
+    
+    # Distance map: Stores the shortest distance from start_node to each node.
+    # Initialize all distances to infinity, except for the start node (distance 0).
+    inf = float('inf')
+    distances = {node: inf for node in vertices}
+    distances[start_node] = 0
+    
+    # Predecessor map (optional, but useful for path reconstruction)
+    predecessors = {node: None for node in vertices}
+
+    V = len(vertices)
+
+    # 2. Main Relaxation Loop
+    # Relax all edges |V| - 1 times. After i-th iteration, the shortest path 
+    # using at most i edges is found. Since a simple path has at most V-1 edges, 
+    # V-1 iterations are sufficient to find all shortest paths.
+    for i in range(V - 1):
+        # We assume the graph is represented by a list of edges (u, v, weight)
+        updated = False
+        for u, v, weight in edges:
+            # Relaxation step: D[v] = min(D[v], D[u] + W(u, v))
+            if distances[u] != inf and distances[u] + weight < distances[v]:
+                distances[v] = distances[u] + weight
+                predecessors[v] = u
+                updated = True
+        
+        # Optimization: If no distance was updated in a full pass, 
+        # we can terminate early.
+        if not updated:
+            break
+
+    # 3. Negative Cycle Detection
+    # Perform one more relaxation pass (the V-th pass). If any distance is 
+    # still reduced, it means a negative cycle exists. The pass keeps relaxing
+    # so that the cycle shows up in the predecessor graph.
+    cycle_found = False
+    for u, v, weight in edges:
+        if distances[u] != inf and distances[u] + weight < distances[v]:
+            distances[v] = distances[u] + weight
+            predecessors[v] = u
+            cycle_found = True
+
+    if cycle_found:
+        return _negative_cycle(vertices, predecessors)
+
+    # If no negative cycle is found, return the shortest distances
+    return distances, predecessors
+
+def _find_predecessor_cycle(nodes, predecessors):
+    """
+    Returns the vertices of a cycle in the predecessor graph, in edge order,
+    or None if it is a forest. Any such cycle is a negative cycle.
+    Each vertex is walked over once, so this runs in O(V).
+    """
+    walk = {}
+    for start in nodes:
+        if start in walk:
+            continue
+        node = start
+        while node is not None and node not in walk:
+            walk[node] = start
+            node = predecessors[node]
+        if node is not None and walk[node] == start:
+            # The walk ran into itself: node lies on a cycle
+            cycle = [node]
+            current = predecessors[node]
+            while current != node:
+                cycle.append(current)
+                current = predecessors[current]
+            cycle.reverse()
+            return cycle
+    return None
+
+def _negative_cycle(nodes, predecessors, labels=None):
+    """Builds the (False, cycle) result, translating ids to labels if given."""
+    print("\n!!! Negative Cycle Detected !!!")
+    cycle = _find_predecessor_cycle(nodes, predecessors) or []
+    if labels is not None:
+        cycle = [labels[i] for i in cycle]
+    return False, cycle
+
+def _csr_result(graph, dist, pred):
+    """Converts id-indexed distance and predecessor lists back to label-keyed dicts."""
+    labels = graph.labels
+    distances = dict(zip(labels, dist))
+    predecessors = {labels[i]: (labels[p] if p is not None else None) for i, p in enumerate(pred)}
+    return distances, predecessors
+
+def _bellman_ford_csr(graph, start_node):
+    """
+    Bellman-Ford over the dense integer ids of a CSRGraph.
+    Edges are swept row by row, so each source distance is read once per row.
+    """
+    source = graph.index.get(start_node)
+    if source is None:
+        return False
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph.labels)
+    inf = float('inf')
+    dist = [inf] * n
+    pred = [None] * n
+    dist[source] = 0
+
+    # The n-th pass only happens if something still changes, i.e. a negative cycle
+    for i in range(n):
+        updated = False
+        for u in range(n):
+            du = dist[u]
+            if du == inf:
+                continue
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if du + weights[k] < dist[v]:
+                    dist[v] = du + weights[k]
+                    pred[v] = u
+                    updated = True
+        if not updated:
+            return _csr_result(graph, dist, pred)
+
+    return _negative_cycle(range(n), pred, graph.labels)
+
+def _bellman_ford_queue(graph, start_node):
+    """
+    Queue-based Bellman-Ford (SPFA) with the Small Label First (SLF) rule.
+
+    Only vertices whose distance dropped are queued, and a vertex whose new
+    distance beats the queue's front goes to the front. Every V relaxations
+    the predecessor graph is checked for a cycle, which keeps negative cycle
+    detection at O(1) amortized cost per relaxation.
+    """
+    source = graph.index.get(start_node)
+    if source is None:
+        return False
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph.labels)
+    dist = [float('inf')] * n
+    pred = [None] * n
+    dist[source] = 0
+
+    queue = deque([source])
+    in_queue = bytearray(n)
+    in_queue[source] = 1
+    relaxations = 0
+
+    while queue:
+        u = queue.popleft()
+        in_queue[u] = 0
+        du = dist[u]
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            distance_through_u = du + weights[k]
+            if distance_through_u < dist[v]:
+                dist[v] = distance_through_u
+                pred[v] = u
+                relaxations += 1
+                if relaxations % n == 0 and _find_predecessor_cycle(range(n), pred):
+                    return _negative_cycle(range(n), pred, graph.labels)
+                if not in_queue[v]:
+                    in_queue[v] = 1
+                    if queue and distance_through_u < dist[queue[0]]:
+                        queue.appendleft(v)
+                    else:
+                        queue.append(v)
+
+    return _csr_result(graph, dist, pred)
+
+def _bellman_ford_numpy(graph, start_node):
+    """
+    Vectorized Bellman-Ford: each pass relaxes every edge at once with NumPy.
+
+    The CSR buffers are wrapped without copying; each pass computes all
+    candidate distances dist[src] + w and folds them into the targets with
+    np.minimum.at. A change in the V-th pass means a negative cycle.
+    """
+    if np is None:
+        raise ImportError("engine='numpy' requires NumPy to be installed")
+
+    source = graph.index.get(start_node)
+    if source is None:
+        return False
+
+    n = len(graph.labels)
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    dst = np.frombuffer(graph.targets, dtype=np.int64)
+    src = np.repeat(np.arange(n, dtype=np.int64), np.diff(offsets))
+    w = np.asarray(graph.weights, dtype=np.float64)
+
+    dist = np.full(n, np.inf)
+    dist[source] = 0.0
+    pred = np.full(n, -1, dtype=np.int64)
+
+    for i in range(n):
+        candidates = dist[src] + w
+        new_dist = dist.copy()
+        np.minimum.at(new_dist, dst, candidates)
+        improved = new_dist < dist
+        if not improved.any():
+            pred_list = [p if p >= 0 else None for p in pred.tolist()]
+            return _csr_result(graph, dist.tolist(), pred_list)
+        # Any edge that achieves an improved distance is a valid predecessor
+        winners = improved[dst] & (candidates == new_dist[dst])
+        pred[dst[winners]] = src[winners]
+        dist = new_dist
+
+    pred_list = [p if p >= 0 else None for p in pred.tolist()]
+    if _find_predecessor_cycle(range(n), pred_list) is None:
+        # Synchronous passes need not leave the cycle in the predecessor graph;
+        # the sequential engine always does.
+        return _bellman_ford_csr(graph, start_node)
+    return _negative_cycle(range(n), pred_list, graph.labels)
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+    # --- Example 1: Standard Graph (No Negative Cycle) ---
+    print("--- Example 1: Standard Graph ---")
+    # Vertices (V=5): 0, 1, 2, 3, 4
+    V1 = [0, 1, 2, 3, 4]
+    E1 = [
+        (0, 1, 6), (0, 3, 7),
+        (1, 2, 5), (1, 4, -4),
+        (2, 1, -2), 
+        (3, 2, -3), (3, 4, 9),
+        (4, 0, 2), (4, 3, 0)
+    ]
+    start1 = 0
+
+    dist1, pred1 = bellman_ford(V1, E1, start1)
+
+    if dist1:
+        print(f"Shortest Distances from node {start1}:")
+        for node, dist in dist1.items():
+            print(f"Node {node}: {dist}")
+    else:
+        print(f"Negative cycle: {pred1}")
+
+    # --- Example 2: Graph with Negative Cycle ---
+    print("\n--- Example 2: Negative Cycle Graph ---")
+    V2 = [0, 1, 2]
+    E2 = [
+        (0, 1, 4),
+        (1, 2, -3),
+        (2, 0, -2) # This edge creates the negative cycle: 0 -> 1 -> 2 -> 0 with cost 4 - 3 - 2 = -1
+    ]
+    start2 = 0
+
+    dist2, pred2 = bellman_ford(V2, E2, start2)
+
+    if dist2:
+        print(f"Shortest Distances from node {start2}:")
+        for node, dist in dist2.items():
+            print(f"Node {node}: {dist}")
+    else:
+        print(f"Negative cycle: {pred2}")
+
+    # --- Example 3: Faster Engines ---
+    print("\n--- Example 3: Queue-Based and Vectorized Engines ---")
+    E3 = [(0, 1, 6), (0, 3, 7), (1, 2, 5), (1, 4, -4), (3, 2, -3), (3, 4, 9), (4, 2, 7)]
+    print(f"Classic: {bellman_ford(V1, E3, 0)[0]}")
+    print(f"Queue (SPFA): {bellman_ford(V1, E3, 0, engine='queue')[0]}")
+    if np is not None:
+        print(f"NumPy: {bellman_ford(V1, E3, 0, engine='numpy')[0]}")
+    print(f"Negative cycle via SPFA: {bellman_ford(V2, E2, start2, engine='queue')[1]}")
@@ -1,11 +1,16 @@
+from array import array
+
 class Node:
     """
     A single Node in the Binary Search Tree.
     Each node stores a comparable value and references to its left and right children.
+    In map mode the node also carries the data mapped to its value (the key).
     """
-    def __init__(self, value):
+    def __init__(self, value, data=None):
         # The data stored in the node
         self.value = value
+        # The mapped value, or a posting list (array) in duplicates mode
+        self.data = data
         # Pointer to the left child node (initially None)
         self.left = None
         # Pointer to the right child node (initially None)
@@ -15,35 +20,104 @@ class BinarySearchTree:
     """
     Represents the entire Binary Search Tree structure, starting from the root node.
     Implements efficient insertion and search operations by maintaining the BST property.
+
+    put/get/pop/setdefault use the tree as a sorted map. With duplicates=True,
+    put() appends the value to the key's posting list, an array of the given
+    typecode kept in the key's node, instead of dropping the duplicate.
+
+    Every structural change goes through _add and _remove, so the balanced
+    variants (redblacktree.RedBlackTree, treap.Treap) only replace those two
+    and share everything else.
     """
-    def __init__(self):
+    def __init__(self, duplicates=False, typecode='q'):
         # Initialize the root of the tree to be empty
         self.root = None
+        # Map mode: keep every value of a key in a posting list of this typecode
+        self.duplicates = duplicates
+        self.typecode = typecode
+        # Number of nodes (distinct keys)
+        self._size = 0
 
-    # --- Insertion Methods ---
+    # --- Insertion and Deletion ---
 
     def insert(self, value):
-        """Public method to insert a new value while maintaining the BST property."""
-        if self.root is None:
-            self.root = Node(value)
+        """
+        Public method to insert a new value while maintaining the BST property.
+        A value that is already present is skipped (handling duplicates).
+
+        Returns:
+            bool: True if the value was added, False if it was already present.
+        """
+        return self._add(value)[1]
+
+    def _add(self, key):
+        """
+        Walks down to key in a loop and attaches a new leaf node if it is missing.
+        Returns (node, added): the key's node, and whether it was just created.
+        """
+        parent = None
+        node = self.root
+        while node is not None:
+            if key == node.value:
+                return node, False
+            parent = node
+            node = node.left if key < node.value else node.right
+
+        node = Node(key)
+        self._size += 1
+        if parent is None:
+            self.root = node
+        elif key < parent.value:
+            parent.left = node
         else:
-            self.__insert_recursive(self.root, value)
-
-    def __insert_recursive(self, current_node, value):
-        """Helper for recursive insertion."""
-        if value < current_node.value:
-            # Go left
-            if current_node.left is None:
-                current_node.left = Node(value)
-            else:
-                self.__insert_recursive(current_node.left, value)
-        elif value > current_node.value:
-            # Go right
-            if current_node.right is None:
-                current_node.right = Node(value)
-            else:
-                self.__insert_recursive(current_node.right, value)
-        # If value == current_node.value, we skip insertion (handling duplicates)
+            parent.right = node
+        return node, True
+
+    def delete(self, value):
+        """
+        Removes value from the tree.
+
+        Returns:
+            bool: True if the value was removed, False if it was not present.
+        """
+        node, parent = self._find(value)
+        if node is None:
+            return False
+        self._remove(node, parent)
+        return True
+
+    def _find(self, key):
+        """Returns (node, parent) for key, where node is None if key is not present."""
+        parent = None
+        node = self.root
+        while node is not None and node.value != key:
+            parent = node
+            node = node.left if key < node.value else node.right
+        return node, parent
+
+    def _remove(self, node, parent):
+        """Unlinks a node found by _find and returns its data."""
+        data = node.data
+        if node.left is not None and node.right is not None:
+            # Two children: move the in-order successor's entry here and
+            # unlink the successor instead (it has no left child)
+            parent = node
+            successor = node.right
+            while successor.left is not None:
+                parent = successor
+                successor = successor.left
+            node.value, node.data = successor.value, successor.data
+            node = successor
+        # node has at most one child, which takes its place
+        child = node.left if node.left is not None else node.right
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+        self._size -= 1
+        return data
 
     # --- Search Methods ---
 
@@ -52,61 +126,258 @@ class BinarySearchTree:
         Searches for a value in the tree.
         Returns the Node object if found, otherwise returns None.
         """
-        return self.__search_recursive(self.root, value)
+        return self._find(value)[0]
+
+    def floor(self, value):
+        """Returns the largest value <= value in the tree, or None if there is none."""
+        best = None
+        node = self.root
+        while node is not None:
+            if node.value == value:
+                return node.value
+            if node.value < value:
+                # A candidate; anything closer lies to its right
+                best = node.value
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    def ceiling(self, value):
+        """Returns the smallest value >= value in the tree, or None if there is none."""
+        best = None
+        node = self.root
+        while node is not None:
+            if node.value == value:
+                return node.value
+            if node.value > value:
+                best = node.value
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def successor(self, value):
+        """Returns the smallest value > value in the tree, or None if there is none."""
+        best = None
+        node = self.root
+        while node is not None:
+            if node.value > value:
+                best = node.value
+                node = node.left
+            else:
+                node = node.right
+        return best
+
+    def predecessor(self, value):
+        """Returns the largest value < value in the tree, or None if there is none."""
+        best = None
+        node = self.root
+        while node is not None:
+            if node.value < value:
+                best = node.value
+                node = node.right
+            else:
+                node = node.left
+        return best
+
+    # --- Sorted Map Operations ---
 
-    def __search_recursive(self, current_node, value):
-        """Helper for recursive searching."""
-        if current_node is None or current_node.value == value:
-            return current_node
-        
-        if value < current_node.value:
-            # Search in the left subtree
-            return self.__search_recursive(current_node.left, value)
+    def put(self, key, value):
+        """
+        Maps key to value, replacing an existing value. In duplicates mode the
+        value is appended to the key's posting list instead.
+        """
+        node, added = self._add(key)
+        if not self.duplicates:
+            node.data = value
+        elif added or node.data is None:
+            # A key added with insert() has no posting list yet
+            node.data = array(self.typecode, (value,))
         else:
-            # Search in the right subtree
-            return self.__search_recursive(current_node.right, value)
+            node.data.append(value)
+
+    def get(self, key, default=None):
+        """Returns the value (or posting list) of key, or default if it is not present."""
+        node, _ = self._find(key)
+        return default if node is None else node.data
+
+    def pop(self, key, *default):
+        """
+        Removes key and returns its value (or its whole posting list). If key is
+        not present, returns default when given and raises KeyError otherwise.
+        """
+        node, parent = self._find(key)
+        if node is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return self._remove(node, parent)
+
+    def setdefault(self, key, default=None):
+        """
+        Returns the value of key, inserting default first if key is not present.
+        In duplicates mode the posting list is returned, created from default
+        (an iterable of values, or None for an empty list) if needed.
+        """
+        node, added = self._add(key)
+        if added or (self.duplicates and node.data is None):
+            if self.duplicates:
+                default = array(self.typecode, () if default is None else default)
+            node.data = default
+        return node.data
+
+    def count(self, key):
+        """Returns the number of values stored under key (0 if it is not present)."""
+        node, _ = self._find(key)
+        if node is None:
+            return 0
+        if not self.duplicates:
+            return 1
+        return 0 if node.data is None else len(node.data)
+
+    def __contains__(self, key):
+        return self._find(key)[0] is not None
+
+    def __getitem__(self, key):
+        node, _ = self._find(key)
+        if node is None:
+            raise KeyError(key)
+        return node.data
+
+    def __setitem__(self, key, value):
+        self.put(key, value)
+
+    def __delitem__(self, key):
+        self.pop(key)
+
+    def __len__(self):
+        return self._size
 
     # --- Traversal Methods (Standard for all Binary Trees) ---
-    
-    def __inorder_recursive(self, node):
-        """Helper for Inorder Traversal: Left -> Root -> Right (yields sorted output in BST)"""
-        if node:
-            self.__inorder_recursive(node.left)
-            print(f"{node.value}", end=" ")
-            self.__inorder_recursive(node.right)
-
-    def __preorder_recursive(self, node):
-        """Helper for Preorder Traversal: Root -> Left -> Right"""
-        if node:
-            print(f"{node.value}", end=" ")
-            self.__preorder_recursive(node.left)
-            self.__preorder_recursive(node.right)
-
-    def __postorder_recursive(self, node):
-        """Helper for Postorder Traversal: Left -> Right -> Root"""
-        if node:
-            self.__postorder_recursive(node.left)
-            self.__postorder_recursive(node.right)
-            print(f"{node.value}", end=" ")
+    # The generators keep an explicit stack of at most h nodes (h = tree height),
+    # so even a degenerate tree built from sorted input streams without recursion.
+    # The tree must not be modified while a traversal is running.
+
+    def _inorder_nodes(self):
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+            else:
+                node = stack.pop()
+                yield node
+                node = node.right
+
+    def inorder(self):
+        """Lazily yields the values Left -> Root -> Right (sorted order in a BST)."""
+        for node in self._inorder_nodes():
+            yield node.value
+
+    def items(self):
+        """Lazily yields the (key, value) pairs in sorted order."""
+        for node in self._inorder_nodes():
+            yield node.value, node.data
+
+    def __iter__(self):
+        return self.inorder()
+
+    def preorder(self):
+        """Lazily yields the values Root -> Left -> Right."""
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            # Right is pushed first so the left subtree comes out first
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+    def postorder(self):
+        """Lazily yields the values Left -> Right -> Root."""
+        stack = []
+        last = None
+        node = self.root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            if top.right is not None and top.right is not last:
+                # Right subtree not done yet
+                node = top.right
+            else:
+                last = stack.pop()
+                yield last.value
+
+    def _morris_nodes(self):
+        node = self.root
+        while node is not None:
+            if node.left is None:
+                yield node
+                node = node.right
+                continue
+            # Find the in-order predecessor: the rightmost node of the left subtree
+            predecessor = node.left
+            while predecessor.right is not None and predecessor.right is not node:
+                predecessor = predecessor.right
+            if predecessor.right is None:
+                # Thread it back to node, then walk the left subtree
+                predecessor.right = node
+                node = node.left
+            else:
+                # Left subtree done: remove the thread
+                predecessor.right = None
+                yield node
+                node = node.right
+
+    def morris_inorder(self):
+        """
+        Lazily yields the values in sorted order with O(1) extra memory (Morris
+        traversal): instead of a stack, the rightmost node of each left subtree
+        is temporarily threaded back to its ancestor. Every thread is removed
+        by the time the walk ends. If the generator is closed early, the rest of
+        the walk runs silently so the tree is always restored.
+        """
+        walk = self._morris_nodes()
+        try:
+            for node in walk:
+                yield node.value
+        finally:
+            for _ in walk:
+                pass
 
     def inorder_traversal(self):
         """Performs Inorder Traversal (Left, Root, Right)."""
         print("Inorder Traversal (L-R-R) [Sorted]:", end=" ")
-        self.__inorder_recursive(self.root)
+        for value in self.inorder():
+            print(f"{value}", end=" ")
         print()
 
     def preorder_traversal(self):
         """Performs Preorder Traversal (Root, Left, Right)."""
         print("Preorder Traversal (R-L-R):", end=" ")
-        self.__preorder_recursive(self.root)
+        for value in self.preorder():
+            print(f"{value}", end=" ")
         print()
 
     def postorder_traversal(self):
         """Performs Postorder Traversal (Left, Right, Root)."""
         print("Postorder Traversal (L-R-R):", end=" ")
-        self.__postorder_recursive(self.root)
+        for value in self.postorder():
+            print(f"{value}", end=" ")
         print()
 
+def _benchmark_memory(num_rows=200_000, num_keys=20_000, seed=0):
+    """Runs the btree memory-per-entry benchmark against BinarySearchTree."""
+    from btree import _benchmark_memory as benchmark_memory
+    benchmark_memory(lambda duplicates: BinarySearchTree(duplicates=duplicates),
+                     num_rows=num_rows, num_keys=num_keys, seed=seed)
+
 # --- Example Usage ---
 
 if __name__ == "__main__":
@@ -151,3 +422,37 @@ if __name__ == "__main__":
         print(f"Search for {search_value_not_found}: Found node with value {result_not_found.value}.")
     else:
         print(f"Search for {search_value_not_found}: Not Found.")
+
+    print("\n--- Neighbour Queries and Deletion ---")
+
+    # 5. Nearest keys around values that are not in the tree
+    print(f"Floor of 45: {bst.floor(45)}, ceiling of 45: {bst.ceiling(45)}")    # Expected: 40, 50
+    print(f"Successor of 50: {bst.successor(50)}, predecessor of 50: {bst.predecessor(50)}")  # 60, 40
+    bst.delete(30)
+    bst.delete(50)
+    print(f"After deleting 30 and 50: {list(bst.inorder())}")
+
+    # 6. Sorted input degenerates the tree into a chain, which no longer
+    # overflows the recursion limit: every operation is a loop
+    chain = BinarySearchTree()
+    for val in range(5_000):
+        chain.insert(val)
+    print(f"Chain of {len(chain)} keys, sum via Morris traversal: {sum(chain.morris_inorder())}")
+    print(f"First postorder values: {[v for v, _ in zip(chain.postorder(), range(3))]}")
+
+    print("\n--- Sorted Map with Duplicate Keys ---")
+
+    # 7. A secondary index: city -> row ids, duplicates kept in posting lists
+    index = BinarySearchTree(duplicates=True)
+    for row, city in enumerate(['Oslo', 'Lima', 'Oslo', 'Pune', 'Lima', 'Oslo']):
+        index.put(city, row)
+    print(f"Rows in Oslo: {index.get('Oslo').tolist()}")   # Expected: [0, 2, 5]
+    print(f"Rows in Lima: {index.count('Lima')}")           # Expected: 2
+    print(f"Removed Pune: {index.pop('Pune').tolist()}, {len(index)} keys left")
+    index.insert('Rome')                # a bare key: no posting list yet
+    print(f"Rows in Rome: {index.count('Rome')}")           # Expected: 0
+    index.put('Rome', 6)
+    print(f"Rows in Rome after put: {index.get('Rome').tolist()}")  # Expected: [6]
+
+    # The memory-per-entry benchmark is slow; run it explicitly with
+    # python -c "import binarysearchtree; binarysearchtree._benchmark_memory()"
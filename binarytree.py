@@ -1,3 +1,10 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy buffers are accepted when it is installed
+    np = None
+
 class Node:
     """
     A single Node in the Binary Tree.
@@ -63,6 +70,213 @@ class BinaryTree:
         self.__postorder_recursive(self.root)
         print()
 
+class ImplicitBinaryTree:
+    """
+    A binary tree stored without nodes or pointers, in level order in one flat
+    buffer: the root is at index 0 and the children of index i are at 2i + 1
+    and 2i + 2 (its parent is at (i - 1) // 2).
+
+    A complete tree (heaps, segment trees, tournament brackets) fills the
+    buffer without gaps, so an array('d') costs 8 bytes per value instead of
+    a Node object per value. Trees with missing positions keep a presence mask
+    next to the buffer and hold a fill value in the gaps.
+
+    The buffer is a list, an array.array, or a NumPy array, used as given.
+    """
+    def __init__(self, values=(), typecode=None):
+        """
+        Args:
+            values (iterable): The values in level order.
+            typecode (str, optional): Store the values in array(typecode). By default an
+                          array.array or NumPy array is used as the buffer
+                          directly and anything else is copied into a list.
+        """
+        if typecode is not None:
+            values = array(typecode, values)
+        elif not (isinstance(values, array) or (np is not None and isinstance(values, np.ndarray))):
+            values = list(values)
+        self.values = values
+        # presence[i] is 1 if position i holds a node; None means every position does
+        self.presence = None
+
+    # --- Index Arithmetic ---
+
+    @staticmethod
+    def left(i):
+        return 2 * i + 1
+
+    @staticmethod
+    def right(i):
+        return 2 * i + 2
+
+    @staticmethod
+    def parent(i):
+        return (i - 1) // 2
+
+    def has(self, i):
+        """Returns True if position i holds a node."""
+        return 0 <= i < len(self.values) and (self.presence is None or self.presence[i] == 1)
+
+    def __getitem__(self, i):
+        if not self.has(i):
+            raise IndexError("no node at this position")
+        return self.values[i]
+
+    def __len__(self):
+        """Returns the number of nodes."""
+        if self.presence is None:
+            return len(self.values)
+        return self.presence.count(1)
+
+    def height(self):
+        """Returns the number of levels."""
+        return len(self.values).bit_length()
+
+    # --- Traversal Methods ---
+    # All traversals are generators over index arithmetic. Depth-first ones
+    # keep a stack of at most height() indices.
+
+    def inorder(self):
+        """Lazily yields the values Left -> Root -> Right."""
+        values, has = self.values, self.has
+        stack = []
+        i = 0
+        while True:
+            while has(i):
+                stack.append(i)
+                i = 2 * i + 1
+            if not stack:
+                return
+            i = stack.pop()
+            yield values[i]
+            i = 2 * i + 2
+
+    def preorder(self):
+        """Lazily yields the values Root -> Left -> Right."""
+        values, has = self.values, self.has
+        stack = [0] if has(0) else []
+        while stack:
+            i = stack.pop()
+            yield values[i]
+            # Right is pushed first so the left subtree comes out first
+            if has(2 * i + 2):
+                stack.append(2 * i + 2)
+            if has(2 * i + 1):
+                stack.append(2 * i + 1)
+
+    def postorder(self):
+        """Lazily yields the values Left -> Right -> Root."""
+        values, has = self.values, self.has
+        stack = []
+        last = -1
+        i = 0
+        while True:
+            while has(i):
+                stack.append(i)
+                i = 2 * i + 1
+            # Climb until an ancestor has an unvisited right subtree
+            while stack:
+                top = stack[-1]
+                right = 2 * top + 2
+                if has(right) and right != last:
+                    i = right
+                    break
+                last = stack.pop()
+                yield values[last]
+            else:
+                return
+
+    def level_order(self):
+        """
+        Yields the tree one level at a time, each level as one contiguous slice
+        of the buffer (a view for NumPy buffers). Gaps hold the fill value.
+        """
+        values = self.values
+        start, width = 0, 1
+        while start < len(values):
+            yield values[start:start + width]
+            start += width
+            width *= 2
+
+    def __iter__(self):
+        """Yields the values in level order, skipping gaps."""
+        if self.presence is None:
+            return iter(self.values)
+        return (value for value, present in zip(self.values, self.presence) if present)
+
+    # --- Conversion ---
+
+    @classmethod
+    def from_binary_tree(cls, tree, typecode=None, fill=None, max_slots=None):
+        """
+        Lays out a pointer-based BinaryTree in level order.
+
+        Args:
+            tree (BinaryTree): The tree to convert.
+            typecode (str, optional): Store the values in array(typecode).
+            fill: The value stored in positions without a node. Defaults to None,
+                          or 0 when a typecode is given.
+            max_slots (int, optional): The largest buffer to allocate. A chain of depth
+                          d needs 2**d slots, so by default trees needing more
+                          than 4 slots per node are rejected with ValueError.
+        """
+        # Breadth-first walk that numbers every node by its implicit position
+        positions = []
+        level = [(0, tree.root)] if tree.root is not None else []
+        while level:
+            positions.extend(level)
+            next_level = []
+            for i, node in level:
+                if node.left is not None:
+                    next_level.append((2 * i + 1, node.left))
+                if node.right is not None:
+                    next_level.append((2 * i + 2, node.right))
+            level = next_level
+
+        slots = positions[-1][0] + 1 if positions else 0
+        if max_slots is None:
+            max_slots = 4 * len(positions)
+        if slots > max_slots:
+            raise ValueError(f"tree needs {slots} slots for {len(positions)} nodes; too sparse for an implicit layout")
+
+        if fill is None and typecode is not None:
+            fill = 0
+        values = [fill] * slots
+        for i, node in positions:
+            values[i] = node.value
+        implicit = cls(values, typecode)
+        if len(positions) < slots:
+            presence = bytearray(slots)
+            for i, _ in positions:
+                presence[i] = 1
+            implicit.presence = presence
+        return implicit
+
+    def to_binary_tree(self):
+        """Builds the equivalent pointer-based BinaryTree."""
+        tree = BinaryTree()
+        nodes = [None] * len(self.values)
+        for i in range(len(self.values)):
+            if not self.has(i):
+                continue
+            # Plain Python values, also for array and NumPy buffers
+            value = self.values[i]
+            node = nodes[i] = Node(value.item() if hasattr(value, "item") else value)
+            if i == 0:
+                tree.root = node
+            elif i % 2:
+                nodes[(i - 1) // 2].left = node
+            else:
+                nodes[(i - 1) // 2].right = node
+        return tree
+
+    def inorder_traversal(self):
+        """Performs Inorder Traversal (Left, Root, Right) starting from the root."""
+        print("Inorder Traversal (L-R-R):", end=" ")
+        for value in self.inorder():
+            print(f"{value}", end=" ")
+        print()
+
 # --- Example Usage ---
 
 if __name__ == "__main__":
@@ -106,3 +320,17 @@ if __name__ == "__main__":
     
     # Expected: 2 7 5 12 15 10
     tree.postorder_traversal()
+
+    # 4. The same tree without any Node objects: values in one level-order buffer.
+    # The tree is complete (only the last position is missing), so there are no gaps
+    implicit = ImplicitBinaryTree.from_binary_tree(tree, typecode='q')
+    print(f"\nImplicit buffer: {implicit.values.tolist()}, levels: {[level.tolist() for level in implicit.level_order()]}")
+    implicit.inorder_traversal()
+    print(f"Preorder: {list(implicit.preorder())}, postorder: {list(implicit.postorder())}")
+    print(f"Children of 5 (index 1): {implicit[ImplicitBinaryTree.left(1)]}, {implicit[ImplicitBinaryTree.right(1)]}")
+
+    # 5. A complete tree straight from a level-order array, and back to nodes
+    heap_like = ImplicitBinaryTree(range(1, 8), typecode='d')
+    print(f"\nComplete tree of {len(heap_like)} values, height {heap_like.height()}")
+    print(f"Inorder: {list(heap_like.inorder())}")
+    heap_like.to_binary_tree().preorder_traversal()
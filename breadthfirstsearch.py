@@ -1,5 +1,8 @@
+from array import array
 from collections import deque
 
+from graphs import CSRGraph, Graph
+
 def breadth_first_search(graph, start_node):
     """
     Performs the Breadth-First Search (BFS) algorithm starting from a given node.
@@ -7,11 +10,15 @@ def breadth_first_search(graph, start_node):
     Args:
         graph (dict): The graph represented as an adjacency list.
                       e.g., {'A': ['B', 'C'], 'B': ['D'], 'C': ['E'], ...}
+                      A compiled graphs.CSRGraph is also accepted.
         start_node (str): The node to start the traversal from.
 
     Returns:
         list: A list of nodes in the order they were visited.
     """
+    if isinstance(graph, CSRGraph):
+        return _breadth_first_search_csr(graph, start_node)
+
     if start_node not in graph:
         return [] # Return empty list if start node isn't in the graph
 
@@ -42,22 +49,192 @@ def breadth_first_search(graph, start_node):
 
     return traversal_order
 
+def _breadth_first_search_csr(graph, start_node):
+    """
+    BFS over the dense integer ids of a CSRGraph.
+    The traversal order is itself the queue: a read index walks it from the front.
+    """
+    source = graph.index.get(start_node)
+    if source is None:
+        return []
+
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph.labels))
+    visited[source] = 1
+    order = [source]
+
+    head = 0
+    while head < len(order):
+        current_node = order[head]
+        head += 1
+        for k in range(offsets[current_node], offsets[current_node + 1]):
+            neighbor = targets[k]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                order.append(neighbor)
+
+    labels = graph.labels
+    return [labels[i] for i in order]
+
+def multi_source_bfs(graph, sources, direction_optimizing=True, alpha=14, beta=24):
+    """
+    Runs one BFS per source node, up to 64 sources at a time, in a single
+    level-synchronous sweep (multi-source BFS).
+
+    Every vertex carries two 64-bit masks: 'seen' (bit i set once source i has
+    reached it) and 'visit' (bit i set while it is on source i's frontier).
+    One scan of a frontier vertex's edges therefore advances every source that
+    has it on its frontier at once.
+
+    With direction_optimizing, a level is expanded bottom-up instead of
+    top-down once the frontier's edges exceed 1/alpha of the edges still to
+    explore: every vertex not yet seen by all sources scans its in-neighbors
+    for frontier bits and stops as soon as it has all the bits it is missing.
+    It switches back when the frontier shrinks below 1/beta of the vertices.
+
+    Args:
+        graph (CSRGraph or dict): A compiled graphs.CSRGraph, or an adjacency list
+                      (which is compiled first).
+        sources (list): Start nodes. More than 64 are processed in batches of 64.
+        direction_optimizing (bool, optional): Enable bottom-up levels.
+        alpha, beta (int, optional): The top-down/bottom-up switching thresholds.
+
+    Returns:
+        list: One array('i') per source with the hop distance to every vertex
+              (indexed by the CSRGraph vertex id, see graph.labels), or -1 where
+              unreachable. A source that is not in the graph gets a row of -1.
+    """
+    if not isinstance(graph, CSRGraph):
+        graph = CSRGraph.from_adjacency(graph)
+
+    # Bottom-up levels walk edges backwards
+    reverse = None
+    if direction_optimizing:
+        reverse = graph if not graph.directed else graph.transpose()
+
+    ids = [graph.index.get(source) for source in sources]
+    rows = []
+    for start in range(0, len(ids), 64):
+        rows.extend(_bfs_batch(graph, reverse, ids[start:start + 64], alpha, beta))
+    return rows
+
+def _bfs_batch(graph, reverse, batch, alpha, beta):
+    """Level-synchronous BFS from up to 64 source ids using per-vertex bitmasks."""
+    offsets, targets = graph.offsets, graph.targets
+    n = len(graph.labels)
+    distances = [array('i', [-1]) * n for _ in batch]
+
+    seen = array('Q', bytes(8 * n))
+    visit = array('Q', bytes(8 * n))
+    next_visit = array('Q', bytes(8 * n))
+
+    frontier = []
+    full = 0
+    for i, s in enumerate(batch):
+        if s is None:
+            continue
+        bit = 1 << i
+        full |= bit
+        if not visit[s]:
+            frontier.append(s)
+        visit[s] |= bit
+        seen[s] |= bit
+        distances[i][s] = 0
+
+    unexplored_edges = len(targets)
+    bottom_up = False
+    level = 0
+
+    while frontier:
+        level += 1
+        next_frontier = []
+
+        if bottom_up:
+            reverse_offsets, reverse_targets = reverse.offsets, reverse.targets
+            for u in range(n):
+                missing = full & ~seen[u]
+                if not missing:
+                    continue
+                found = 0
+                for k in range(reverse_offsets[u], reverse_offsets[u + 1]):
+                    found |= visit[reverse_targets[k]]
+                    if found & missing == missing:
+                        break
+                found &= missing
+                if found:
+                    next_visit[u] = found
+                    next_frontier.append(u)
+        else:
+            for v in frontier:
+                bits = visit[v]
+                for k in range(offsets[v], offsets[v + 1]):
+                    u = targets[k]
+                    new_bits = bits & ~seen[u]
+                    if new_bits:
+                        if not next_visit[u]:
+                            next_frontier.append(u)
+                        next_visit[u] |= new_bits
+
+        # Record the level for every (source, vertex) pair reached for the first time
+        for u in next_frontier:
+            reached = next_visit[u]
+            seen[u] |= reached
+            while reached:
+                bit = reached & -reached
+                distances[bit.bit_length() - 1][u] = level
+                reached ^= bit
+
+        # Clear the old frontier so its array can hold the level after next
+        frontier_edges = 0
+        for v in frontier:
+            visit[v] = 0
+            frontier_edges += offsets[v + 1] - offsets[v]
+        visit, next_visit = next_visit, visit
+        frontier = next_frontier
+
+        # Direction-optimizing switch (Beamer et al.)
+        if reverse is not None:
+            unexplored_edges -= frontier_edges
+            next_edges = sum(offsets[v + 1] - offsets[v] for v in frontier)
+            if not bottom_up and next_edges * alpha > unexplored_edges:
+                bottom_up = True
+            elif bottom_up and len(frontier) * beta < n:
+                bottom_up = False
+
+    return distances
+
 # --- Example Usage ---
 
-# Define a sample graph (Adjacency List)
-graph_example = {
-    'A': ['B', 'C'],
-    'B': ['D', 'E'],
-    'C': ['F'],
-    'D': [],
-    'E': ['F'],
-    'F': []
-}
-
-start_node = 'A'
-bfs_result = breadth_first_search(graph_example, start_node)
-
-print(f"Graph: {graph_example}")
-print(f"Starting Node: {start_node}")
-print(f"BFS Traversal Order: {bfs_result}")
-# Expected Output: ['A', 'B', 'C', 'D', 'E', 'F']
+if __name__ == "__main__":
+
+    # Define a sample graph (Adjacency List)
+    graph_example = {
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['F'],
+        'D': [],
+        'E': ['F'],
+        'F': []
+    }
+
+    start_node = 'A'
+    bfs_result = breadth_first_search(graph_example, start_node)
+
+    print(f"Graph: {graph_example}")
+    print(f"Starting Node: {start_node}")
+    print(f"BFS Traversal Order: {bfs_result}")
+    # Expected Output: ['A', 'B', 'C', 'D', 'E', 'F']
+
+    # --- Multi-Source BFS Example ---
+
+    # An undirected ring of 8 nodes with one chord
+    ring = Graph(directed=False)
+    for i in range(8):
+        ring.add_edge(i, (i + 1) % 8)
+    ring.add_edge(0, 4)
+    compiled_ring = ring.to_csr()
+
+    hop_rows = multi_source_bfs(compiled_ring, [0, 2, 5])
+    print(f"\nVertex order: {compiled_ring.labels}")
+    for source, hops in zip([0, 2, 5], hop_rows):
+        print(f"Hops from {source}: {list(hops)}")
@@ -1,3 +1,10 @@
+import bisect
+import mmap
+import os
+import struct
+from array import array
+from collections import OrderedDict
+
 class BTreeNode:
     """
     Represents a single node in the B-Tree.
@@ -8,6 +15,9 @@ class BTreeNode:
         self.t = t
         # List of keys stored in the node. Max size is 2*t - 1.
         self.keys = []
+        # values[i] belongs to keys[i]: None for a bare key, the mapped value,
+        # or a posting list (array) of values in duplicates mode
+        self.values = []
         # List of child nodes. Max size is 2*t. Only used if not a leaf.
         self.children = []
         # Boolean, true if the node is a leaf (has no children).
@@ -17,14 +27,26 @@ class BTree:
     """
     Represents the B-Tree structure.
     Implements search and the complex insertion logic involving node splitting.
+
+    insert() stores bare keys (duplicates allowed). put/get/pop/setdefault use
+    the tree as a sorted map with one entry per key. With duplicates=True, put()
+    appends to the key's posting list, an array of the given typecode stored in
+    the node next to the key, so a key with many values is still one entry.
     """
-    def __init__(self, t=3):
+    def __init__(self, t=3, duplicates=False, typecode='q'):
         # Minimum degree t. (e.g., t=3 means max 5 keys, max 6 children per node)
         self.t = t
+        # Map mode: keep every value of a key in a posting list of this typecode
+        self.duplicates = duplicates
+        self.typecode = typecode
+        # Number of keys stored
+        self._size = 0
         # Root is initially None
         self.root = None
         # Root height is always 1 when initialized
         self.root = BTreeNode(t, True)
+        # Bumped by every modification, so open cursors can detect them
+        self._version = 0
 
     # --- Search Operation ---
 
@@ -35,22 +57,20 @@ class BTree:
         """
         if node is None:
             node = self.root
-            
-        i = 0
-        # Find the smallest index i such that k <= node.keys[i]
-        while i < len(node.keys) and k > node.keys[i]:
-            i += 1
 
-        # Check if the key is found at index i
-        if i < len(node.keys) and k == node.keys[i]:
-            return (node, i)
+        while True:
+            # Binary search for the smallest index i such that k <= node.keys[i]
+            i = bisect.bisect_left(node.keys, k)
 
-        # If it's a leaf and not found, the key is not in the tree
-        if node.is_leaf:
-            return None
-        else:
-            # Recurse into the appropriate child
-            return self.search(k, node.children[i])
+            # Check if the key is found at index i
+            if i < len(node.keys) and k == node.keys[i]:
+                return (node, i)
+
+            # If it's a leaf and not found, the key is not in the tree
+            if node.is_leaf:
+                return None
+            # Descend into the appropriate child
+            node = node.children[i]
 
     # --- Insertion Operation ---
 
@@ -59,6 +79,12 @@ class BTree:
         Inserts a new key k into the B-Tree.
         Handles the case where the root needs to be split.
         """
+        self._insert_entry(k, None)
+
+    def _insert_entry(self, k, value):
+        """Inserts key k with its value slot, splitting full nodes on the way down."""
+        self._version += 1
+        self._size += 1
         r = self.root
         # Check if the root is full (2*t - 1 keys)
         if len(r.keys) == (2 * self.t) - 1:
@@ -69,43 +95,36 @@ class BTree:
             
             # The new root becomes 's'
             self.root = s
-            self._insert_non_full(s, k)
+            self._insert_non_full(s, k, value)
         else:
             # Root is not full, proceed with standard insertion
-            self._insert_non_full(r, k)
+            self._insert_non_full(r, k, value)
 
-    def _insert_non_full(self, x, k):
+    def _insert_non_full(self, x, k, value=None):
         """
-        Helper method to insert key k into a non-full node x.
+        Helper method to insert key k (and its value) into a non-full node x.
         If a child is full, it is split first.
         """
-        i = len(x.keys) - 1
-        
-        if x.is_leaf:
-            # If it's a leaf, insert the key directly
-            x.keys.append(0) # Make space
-            while i >= 0 and k < x.keys[i]:
-                x.keys[i + 1] = x.keys[i]
-                i -= 1
-            x.keys[i + 1] = k
-            
-        else:
+        while not x.is_leaf:
             # Find the child where k should be inserted
-            while i >= 0 and k < x.keys[i]:
-                i -= 1
-            i += 1 # i is the index of the child pointer
+            i = bisect.bisect_right(x.keys, k)
 
             # If the chosen child is full, split it
             if len(x.children[i].keys) == (2 * self.t) - 1:
                 self._split_child(x, i, x.children[i])
-                
-                # After splitting, x.keys[i] contains the median. 
+
+                # After splitting, x.keys[i] contains the median.
                 # Determine which of the two new children k belongs to.
                 if k > x.keys[i]:
                     i += 1
-            
-            # Recurse into the appropriate (now non-full) child
-            self._insert_non_full(x.children[i], k)
+
+            # Descend into the appropriate (now non-full) child
+            x = x.children[i]
+
+        # In a leaf, insert the key directly (one list.insert, no slot-by-slot shifting)
+        i = bisect.bisect_right(x.keys, k)
+        x.keys.insert(i, k)
+        x.values.insert(i, value)
 
     def _split_child(self, x, i, y):
         """
@@ -119,15 +138,18 @@ class BTree:
         
         # 1. Promote median key y.keys[t-1] to x.
         x.keys.insert(i, y.keys[t - 1])
+        x.values.insert(i, y.values[t - 1])
         
         # 2. Insert new child z into x's children list
         x.children.insert(i + 1, z)
         
         # 3. Move the upper half of keys from y to z
         z.keys = y.keys[t:]
+        z.values = y.values[t:]
         
         # 4. Trim the keys list of y (keep only the lower half)
         y.keys = y.keys[:t - 1] 
+        y.values = y.values[:t - 1]
 
         # 5. If y is not a leaf, move the upper half of children from y to z
         if not y.is_leaf:
@@ -135,6 +157,312 @@ class BTree:
             # 6. Trim the children list of y (keep only the lower half)
             y.children = y.children[:t]
 
+    # --- Bulk Insertion ---
+
+    def insert_many(self, sorted_keys):
+        """
+        Inserts keys given in non-decreasing order.
+
+        Keys at or above the current maximum are appended along the rightmost
+        path without any root-to-leaf descent or median split: the rightmost
+        leaf is filled a whole slice at a time, a full rightmost node is simply
+        left behind full, and a new empty node is started next to it. The new
+        nodes on the rightmost path are topped up to the minimum fill from
+        their (full) left siblings at the end. Keys below the current maximum
+        fall back to insert().
+        """
+        keys = list(sorted_keys)
+        if keys != sorted(keys):
+            raise ValueError("insert_many requires keys in non-decreasing order")
+        self._version += 1
+        t = self.t
+        max_keys = 2 * t - 1
+        # The rightmost path, root first
+        spine = [self.root]
+        while not spine[-1].is_leaf:
+            spine.append(spine[-1].children[-1])
+        leaf = spine[-1]
+
+        # Keys below the current maximum cannot be appended
+        stragglers = []
+        pos = 0
+        if leaf.keys:
+            pos = bisect.bisect_left(keys, leaf.keys[-1])
+            stragglers = keys[:pos]
+        self._size += len(keys) - pos
+
+        while pos < len(keys):
+            room = max_keys - len(leaf.keys)
+            if room:
+                chunk = keys[pos:pos + room]
+                leaf.keys.extend(chunk)
+                leaf.values.extend([None] * len(chunk))
+                pos += room
+                continue
+
+            # Leaf full: the next key becomes a separator in the lowest ancestor with room
+            level = len(spine) - 2
+            while level >= 0 and len(spine[level].keys) == max_keys:
+                level -= 1
+            if level < 0:
+                # Every node on the path is full: the tree grows by one level
+                root = BTreeNode(t, False)
+                root.children.append(self.root)
+                self.root = root
+                spine.insert(0, root)
+                level = 0
+            spine[level].keys.append(keys[pos])
+            spine[level].values.append(None)
+            pos += 1
+
+            # Start a fresh (empty) rightmost path below it
+            for depth in range(level + 1, len(spine)):
+                node = BTreeNode(t, depth == len(spine) - 1)
+                spine[depth - 1].children.append(node)
+                spine[depth] = node
+            leaf = spine[-1]
+
+        # Top up underfull nodes on the rightmost path from their left siblings
+        for depth in range(1, len(spine)):
+            node, parent = spine[depth], spine[depth - 1]
+            while len(node.keys) < t - 1:
+                left = parent.children[-2]
+                # Rotate one key right through the parent
+                node.keys.insert(0, parent.keys[-1])
+                node.values.insert(0, parent.values[-1])
+                parent.keys[-1] = left.keys.pop()
+                parent.values[-1] = left.values.pop()
+                if not node.is_leaf:
+                    node.children.insert(0, left.children.pop())
+
+        for k in stragglers:
+            self.insert(k)
+
+    # --- Deletion ---
+
+    def _delete(self, k):
+        """
+        Removes one entry with key k top-down in a single pass and returns its
+        value. Before descending into a child with only t - 1 keys, the child
+        borrows a key from a sibling (rotating it through the parent) or is
+        merged with one, so the leaf that finally loses the key never
+        underflows. Raises KeyError if k is not present.
+        """
+        t = self.t
+        node = self.root
+        removed = missing = object()
+        while True:
+            keys = node.keys
+            i = bisect.bisect_left(keys, k)
+            found = i < len(keys) and keys[i] == k
+            if node.is_leaf:
+                if not found:
+                    raise KeyError(k)
+                del keys[i]
+                value = node.values.pop(i)
+                break
+
+            if found:
+                left, right = node.children[i], node.children[i + 1]
+                if removed is missing:
+                    removed = node.values[i]
+                if len(left.keys) >= t:
+                    # Replace the key with its predecessor, then delete that from the left subtree
+                    last = left
+                    while not last.is_leaf:
+                        last = last.children[-1]
+                    k = last.keys[-1]
+                    keys[i], node.values[i] = k, last.values[-1]
+                    node = left
+                    continue
+                if len(right.keys) >= t:
+                    # Symmetric: replace it with its successor
+                    first = right
+                    while not first.is_leaf:
+                        first = first.children[0]
+                    k = first.keys[0]
+                    keys[i], node.values[i] = k, first.values[0]
+                    node = right
+                    continue
+                # Both neighbours are minimal: merge them around the key and delete it there
+                self._merge_children(node, i)
+                node = left
+                continue
+
+            child = node.children[i]
+            if len(child.keys) < t:
+                child = self._fill_child(node, i)
+            node = child
+
+        if not self.root.keys and not self.root.is_leaf:
+            # The root's last key moved down in a merge: the tree shrinks by one level
+            self.root = self.root.children[0]
+        self._version += 1
+        self._size -= 1
+        return value if removed is missing else removed
+
+    def _merge_children(self, node, i):
+        """Merges child i + 1 and the separator node.keys[i] into child i."""
+        left = node.children[i]
+        right = node.children.pop(i + 1)
+        left.keys.append(node.keys.pop(i))
+        left.values.append(node.values.pop(i))
+        left.keys.extend(right.keys)
+        left.values.extend(right.values)
+        left.children.extend(right.children)
+
+    def _fill_child(self, node, i):
+        """
+        Gives node.children[i], which has t - 1 keys, at least t keys by borrowing
+        from a sibling or merging with one. Returns the child to descend into.
+        """
+        t = self.t
+        child = node.children[i]
+        if i > 0 and len(node.children[i - 1].keys) >= t:
+            left = node.children[i - 1]
+            child.keys.insert(0, node.keys[i - 1])
+            child.values.insert(0, node.values[i - 1])
+            node.keys[i - 1] = left.keys.pop()
+            node.values[i - 1] = left.values.pop()
+            if not child.is_leaf:
+                child.children.insert(0, left.children.pop())
+            return child
+        if i < len(node.keys) and len(node.children[i + 1].keys) >= t:
+            right = node.children[i + 1]
+            child.keys.append(node.keys[i])
+            child.values.append(node.values[i])
+            node.keys[i] = right.keys.pop(0)
+            node.values[i] = right.values.pop(0)
+            if not child.is_leaf:
+                child.children.append(right.children.pop(0))
+            return child
+        if i < len(node.keys):
+            self._merge_children(node, i)
+            return child
+        self._merge_children(node, i - 1)
+        return node.children[i - 1]
+
+    # --- Sorted Map Operations ---
+
+    def put(self, key, value):
+        """
+        Maps key to value, replacing an existing value. In duplicates mode the
+        value is appended to the key's posting list instead.
+        """
+        found = self.search(key)
+        if found is None:
+            self._insert_entry(key, array(self.typecode, (value,)) if self.duplicates else value)
+        elif self.duplicates:
+            node, i = found
+            # A key added with insert() has no posting list yet
+            if node.values[i] is None:
+                node.values[i] = array(self.typecode)
+            node.values[i].append(value)
+        else:
+            node, i = found
+            node.values[i] = value
+
+    def get(self, key, default=None):
+        """Returns the value (or posting list) of key, or default if it is not present."""
+        found = self.search(key)
+        if found is None:
+            return default
+        node, i = found
+        return node.values[i]
+
+    def pop(self, key, *default):
+        """
+        Removes key and returns its value (or its whole posting list). If key is
+        not present, returns default when given and raises KeyError otherwise.
+        """
+        if self.search(key) is None:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        return self._delete(key)
+
+    def setdefault(self, key, default=None):
+        """
+        Returns the value of key, inserting default first if key is not present.
+        In duplicates mode the posting list is returned, created from default
+        (an iterable of values, or None for an empty list) if needed.
+        """
+        found = self.search(key)
+        if found is not None:
+            node, i = found
+            if self.duplicates and node.values[i] is None:
+                node.values[i] = array(self.typecode, () if default is None else default)
+            return node.values[i]
+        if self.duplicates:
+            default = array(self.typecode, () if default is None else default)
+        self._insert_entry(key, default)
+        return default
+
+    def count(self, key):
+        """Returns the number of values stored under key (0 if it is not present)."""
+        found = self.search(key)
+        if found is None:
+            return 0
+        node, i = found
+        if not self.duplicates:
+            return 1
+        return 0 if node.values[i] is None else len(node.values[i])
+
+    def __contains__(self, key):
+        return self.search(key) is not None
+
+    def __len__(self):
+        return self._size
+
+    # --- Ordered Iteration ---
+
+    def cursor(self):
+        """Returns a cursor positioned on the smallest key (or exhausted if empty)."""
+        return BTreeCursor(self).seek_first()
+
+    def seek(self, k):
+        """Returns a cursor positioned on the first key >= k."""
+        return BTreeCursor(self).seek(k)
+
+    def iter_range(self, lo=None, hi=None, reverse=False):
+        """
+        Lazily yields the keys with lo <= key < hi in sorted order (descending
+        if reverse is True). Either bound may be None for an open end. No list
+        is built: the generator walks the tree with a cursor.
+        """
+        cursor = BTreeCursor(self)
+        if not reverse:
+            key = cursor.seek_first().key if lo is None else cursor.seek(lo).key
+            while cursor.valid and (hi is None or key < hi):
+                yield key
+                key = cursor.next()
+        else:
+            if hi is None:
+                key = cursor.seek_last().key
+            else:
+                # The last key below hi sits just before the first key >= hi
+                key = cursor.prev() if cursor.seek(hi).valid else cursor.seek_last().key
+            while cursor.valid and (lo is None or not key < lo):
+                yield key
+                key = cursor.prev()
+
+    def __iter__(self):
+        return self.iter_range()
+
+    def items(self, lo=None, hi=None):
+        """Lazily yields the (key, value) pairs with lo <= key < hi in sorted order."""
+        cursor = BTreeCursor(self)
+        if lo is None:
+            cursor.seek_first()
+        else:
+            cursor.seek(lo)
+        while cursor.valid:
+            key = cursor.key
+            if hi is not None and not key < hi:
+                return
+            yield key, cursor.value
+            cursor.next()
+
     # --- Traversal/Visualization (Simplified Preorder for Demonstration) ---
     
     def _print_tree(self, node, level=0):
@@ -158,6 +486,793 @@ class BTree:
         print("---------------------------------")
 
 
+class BTreeCursor:
+    """
+    A position in a BTree's key order that can move in both directions.
+
+    The cursor keeps the path from the root as a stack of (node, i) frames.
+    The top frame is the current key node.keys[i]; every frame below it records
+    that the search went into child i, so the key after that subtree is
+    node.keys[i] and the one before it is node.keys[i - 1]. Each step is
+    O(1) amortized and O(log n) at worst.
+
+    Modifying the tree invalidates the cursor; using it afterwards raises
+    RuntimeError.
+    """
+    def __init__(self, tree):
+        self.tree = tree
+        self._stack = []
+        self._version = tree._version
+
+    @property
+    def valid(self):
+        """True while the cursor is on a key (not past either end)."""
+        return bool(self._stack)
+
+    @property
+    def key(self):
+        """The current key, or None if the cursor is past either end."""
+        if not self._stack:
+            return None
+        node, i = self._stack[-1]
+        return node.keys[i]
+
+    @property
+    def value(self):
+        """The value (or posting list) of the current key, or None past either end."""
+        if not self._stack:
+            return None
+        node, i = self._stack[-1]
+        return node.values[i]
+
+    def _check(self):
+        if self._version != self.tree._version:
+            raise RuntimeError("BTree changed while a cursor was open")
+
+    def _descend_leftmost(self, node):
+        stack = self._stack
+        while not node.is_leaf:
+            stack.append((node, 0))
+            node = node.children[0]
+        if node.keys:
+            stack.append((node, 0))
+        else:
+            # Only an empty root leaf has no keys
+            stack.clear()
+
+    def _descend_rightmost(self, node):
+        stack = self._stack
+        while not node.is_leaf:
+            stack.append((node, len(node.keys)))
+            node = node.children[-1]
+        if node.keys:
+            stack.append((node, len(node.keys) - 1))
+        else:
+            stack.clear()
+
+    def seek_first(self):
+        """Moves to the smallest key. Returns the cursor."""
+        self._version = self.tree._version
+        self._stack = []
+        self._descend_leftmost(self.tree.root)
+        return self
+
+    def seek_last(self):
+        """Moves to the largest key. Returns the cursor."""
+        self._version = self.tree._version
+        self._stack = []
+        self._descend_rightmost(self.tree.root)
+        return self
+
+    def seek(self, k):
+        """Moves to the first key >= k (past the end if there is none). Returns the cursor."""
+        self._version = self.tree._version
+        stack = self._stack = []
+        node = self.tree.root
+        while True:
+            i = bisect.bisect_left(node.keys, k)
+            if node.is_leaf:
+                if i < len(node.keys):
+                    stack.append((node, i))
+                else:
+                    self._climb_forward()
+                return self
+            # Even when node.keys[i] == k, an equal key may sit further left in
+            # child i; if the child has nothing >= k, climbing returns here
+            stack.append((node, i))
+            node = node.children[i]
+
+    def _climb_forward(self):
+        """Pops finished subtrees until a frame whose next key exists, and moves onto it."""
+        stack = self._stack
+        while stack:
+            node, i = stack[-1]
+            if i < len(node.keys):
+                return
+            stack.pop()
+
+    def next(self):
+        """Moves to the next key and returns it, or None when past the end."""
+        self._check()
+        stack = self._stack
+        if not stack:
+            return None
+        node, i = stack.pop()
+        if not node.is_leaf:
+            stack.append((node, i + 1))
+            self._descend_leftmost(node.children[i + 1])
+        elif i + 1 < len(node.keys):
+            stack.append((node, i + 1))
+        else:
+            self._climb_forward()
+        return self.key
+
+    def prev(self):
+        """Moves to the previous key and returns it, or None when before the start."""
+        self._check()
+        stack = self._stack
+        if not stack:
+            return None
+        node, i = stack.pop()
+        if not node.is_leaf:
+            stack.append((node, i))
+            self._descend_rightmost(node.children[i])
+        elif i > 0:
+            stack.append((node, i - 1))
+        else:
+            # Climb to the first ancestor that has a key before the subtree
+            while stack:
+                node, i = stack.pop()
+                if i > 0:
+                    stack.append((node, i - 1))
+                    break
+        return self.key
+
+    def __iter__(self):
+        """Lazily yields the current key and every key after it."""
+        while self.valid:
+            key = self.key
+            yield key
+            self.next()
+
+# --- Disk-Backed B+Tree ---
+
+# Page types
+_PAGE_FREE = 0
+_PAGE_LEAF = 1
+_PAGE_INTERNAL = 2
+# Page header: type, number of keys, next leaf (or next free page), previous leaf
+_PAGE_HEADER = struct.Struct("<BxxxIqq")
+# Page 0: magic, version, page size, root, first leaf, pages, free list head,
+# entries, key format, value format
+_META = struct.Struct("<8sIIqqqqq16s16s")
+_MAGIC = b"BPLUSTRE"
+_VERSION = 1
+_NO_PAGE = -1
+
+class BPlusPage:
+    """
+    A decoded B+Tree page.
+    Leaves hold sorted keys with their values and links to both neighbouring
+    leaves. Internal pages hold n keys and n + 1 child page ids: children[i]
+    covers the keys below keys[i], children[i + 1] the keys from keys[i] on.
+    """
+    __slots__ = ("page_id", "is_leaf", "keys", "values", "children", "next", "prev")
+
+    def __init__(self, page_id, is_leaf):
+        self.page_id = page_id
+        self.is_leaf = is_leaf
+        self.keys = []
+        # Leaf only: values[i] belongs to keys[i]
+        self.values = []
+        # Internal only: child page ids
+        self.children = []
+        # Leaf only: page ids of the neighbouring leaves
+        self.next = _NO_PAGE
+        self.prev = _NO_PAGE
+
+class BufferPool:
+    """
+    An LRU cache of decoded pages in front of a memory-mapped file.
+
+    Pages are decoded on first access and kept as BPlusPage objects. Modified
+    pages are only marked dirty; they are encoded and written back into the
+    mapping when they are evicted as least recently used, or on flush().
+    """
+    def __init__(self, mapping, page_size, capacity, decode, encode):
+        self.mapping = mapping
+        self.page_size = page_size
+        self.capacity = capacity
+        self._decode = decode
+        self._encode = encode
+        # page id -> BPlusPage, least recently used first
+        self._pages = OrderedDict()
+        self._dirty = set()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    def get(self, page_id):
+        """Returns the decoded page, reading it from the file on a cache miss."""
+        page = self._pages.get(page_id)
+        if page is not None:
+            self._pages.move_to_end(page_id)
+            self.hits += 1
+            return page
+        self.misses += 1
+        start = page_id * self.page_size
+        page = self._decode(page_id, self.mapping[start:start + self.page_size])
+        self._admit(page)
+        return page
+
+    def mark_dirty(self, page):
+        """Records that a page was modified (or created) and must be written back."""
+        self._pages[page.page_id] = page
+        self._pages.move_to_end(page.page_id)
+        self._dirty.add(page.page_id)
+        self._evict()
+
+    def discard(self, page_id):
+        """Drops a page from the cache without writing it (e.g. a freed page)."""
+        self._pages.pop(page_id, None)
+        self._dirty.discard(page_id)
+
+    def flush(self):
+        """Writes every dirty page back into the mapping."""
+        for page_id in self._dirty:
+            self._write(self._pages[page_id])
+        self._dirty.clear()
+
+    def _admit(self, page):
+        self._pages[page.page_id] = page
+        self._evict()
+
+    def _evict(self):
+        while len(self._pages) > self.capacity:
+            page_id, page = self._pages.popitem(last=False)
+            if page_id in self._dirty:
+                self._write(page)
+                self._dirty.discard(page_id)
+
+    def _write(self, page):
+        start = page.page_id * self.page_size
+        data = self._encode(page)
+        self.mapping[start:start + len(data)] = data
+        self.writes += 1
+
+class BPlusTree:
+    """
+    A persistent B+Tree map stored in a file of fixed-size pages.
+
+    Keys and values are fixed-width struct formats ("q" = 64-bit int by default,
+    "d" = double, "16s" = 16 NUL-padded bytes, ...). Page 0 holds the metadata;
+    every other page is a leaf, an internal node or a free page. The file is
+    accessed through mmap, and pages go through an LRU BufferPool, so only
+    recently used pages are decoded in memory.
+
+    Only leaves store values, and leaves are linked in both directions, so a
+    range scan descends once and then walks the leaf chain. In-page lookups
+    use bisect. Deletion keeps every page at least half full by borrowing from
+    or merging with a sibling; merged pages go on a free list for reuse.
+    """
+    def __init__(self, path, page_size=4096, cache_pages=256, key_format="q", value_format="q"):
+        """
+        Opens the tree stored at path, creating it if the file is missing or empty.
+        For an existing file, page_size and the formats are read from the file.
+
+        Args:
+            path (str): The index file.
+            page_size (int, optional): Bytes per page for a new file.
+            cache_pages (int, optional): Pages held by the buffer pool (at least 64,
+                                         so the pages of one operation stay cached).
+            key_format (str, optional): struct format of one key, for a new file.
+            value_format (str, optional): struct format of one value, for a new file.
+        """
+        self.path = path
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        self._file = open(path, "r+b" if exists else "w+b")
+
+        if exists:
+            (magic, version, page_size, self._root, self._first_leaf, self._num_pages,
+             self._free_head, self._count, key_format, value_format) = _META.unpack(self._file.read(_META.size))
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError(f"{path} is not a B+Tree file")
+            key_format = key_format.rstrip(b"\0").decode()
+            value_format = value_format.rstrip(b"\0").decode()
+        else:
+            self._file.truncate(2 * page_size)
+
+        self.page_size = page_size
+        self.key_format = key_format
+        self.value_format = value_format
+        self._key = struct.Struct("<" + key_format)
+        self._value = struct.Struct("<" + value_format)
+        self._child = struct.Struct("<q")
+        # Padded bytes keys and values come back without their NUL padding
+        self._strip_keys = key_format.endswith("s")
+        self._strip_values = value_format.endswith("s")
+
+        body = page_size - _PAGE_HEADER.size
+        # Leaves: n keys and n values; internal pages: n keys and n + 1 children
+        self.leaf_capacity = body // (self._key.size + self._value.size)
+        self.internal_capacity = (body - self._child.size) // (self._key.size + self._child.size)
+        if self.leaf_capacity < 3 or self.internal_capacity < 3:
+            raise ValueError("page_size is too small for the key and value formats")
+
+        self._mmap = mmap.mmap(self._file.fileno(), 0)
+        self._pool = BufferPool(self._mmap, page_size, max(64, cache_pages), self._decode, self._encode)
+
+        if not exists:
+            self._num_pages = 1
+            self._free_head = _NO_PAGE
+            self._count = 0
+            root = self._allocate(True)
+            self._root = self._first_leaf = root.page_id
+            self.flush()
+
+    # --- Page Encoding ---
+
+    def _decode(self, page_id, data):
+        kind, count, next_page, prev_page = _PAGE_HEADER.unpack_from(data)
+        page = BPlusPage(page_id, kind == _PAGE_LEAF)
+        offset = _PAGE_HEADER.size
+        keys_end = offset + count * self._key.size
+        page.keys = [key for (key,) in self._key.iter_unpack(data[offset:keys_end])]
+        if self._strip_keys:
+            page.keys = [key.rstrip(b"\0") for key in page.keys]
+        if page.is_leaf:
+            values_end = keys_end + count * self._value.size
+            page.values = [value for (value,) in self._value.iter_unpack(data[keys_end:values_end])]
+            if self._strip_values:
+                page.values = [value.rstrip(b"\0") for value in page.values]
+            page.next, page.prev = next_page, prev_page
+        else:
+            children_end = keys_end + (count + 1) * self._child.size
+            page.children = [child for (child,) in self._child.iter_unpack(data[keys_end:children_end])]
+        return page
+
+    def _encode(self, page):
+        kind = _PAGE_LEAF if page.is_leaf else _PAGE_INTERNAL
+        parts = [_PAGE_HEADER.pack(kind, len(page.keys), page.next, page.prev)]
+        parts += map(self._key.pack, page.keys)
+        if page.is_leaf:
+            parts += map(self._value.pack, page.values)
+        else:
+            parts += map(self._child.pack, page.children)
+        return b"".join(parts)
+
+    # --- Page Allocation ---
+
+    def _allocate(self, is_leaf):
+        """Returns a new empty page, reusing a freed page when there is one."""
+        if self._free_head != _NO_PAGE:
+            page_id = self._free_head
+            start = page_id * self.page_size
+            self._free_head = _PAGE_HEADER.unpack_from(self._mmap, start)[2]
+        else:
+            page_id = self._num_pages
+            self._num_pages += 1
+            needed = self._num_pages * self.page_size
+            if needed > len(self._mmap):
+                # Grow the file geometrically so appends stay cheap
+                self._mmap.resize(max(needed, 2 * len(self._mmap)))
+        page = BPlusPage(page_id, is_leaf)
+        self._pool.mark_dirty(page)
+        return page
+
+    def _free(self, page):
+        """Puts a page on the free list."""
+        self._pool.discard(page.page_id)
+        start = page.page_id * self.page_size
+        _PAGE_HEADER.pack_into(self._mmap, start, _PAGE_FREE, 0, self._free_head, _NO_PAGE)
+        self._free_head = page.page_id
+
+    # --- Lookup ---
+
+    def _find_leaf(self, key, path=None):
+        """Descends to the leaf that holds key, recording (page, child index) pairs in path."""
+        page = self._pool.get(self._root)
+        while not page.is_leaf:
+            i = bisect.bisect_right(page.keys, key)
+            if path is not None:
+                path.append((page, i))
+            page = self._pool.get(page.children[i])
+        return page
+
+    def get(self, key, default=None):
+        """Returns the value stored for key, or default if the key is not present."""
+        leaf = self._find_leaf(key)
+        i = bisect.bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        return default
+
+    def __contains__(self, key):
+        leaf = self._find_leaf(key)
+        i = bisect.bisect_left(leaf.keys, key)
+        return i < len(leaf.keys) and leaf.keys[i] == key
+
+    def __getitem__(self, key):
+        leaf = self._find_leaf(key)
+        i = bisect.bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            return leaf.values[i]
+        raise KeyError(key)
+
+    def __len__(self):
+        return self._count
+
+    def range(self, lo=None, hi=None):
+        """
+        Yields the (key, value) pairs with lo <= key < hi in sorted order,
+        following the leaf links. Either bound may be None for an open end.
+        The tree must not be modified while the generator is in use.
+        """
+        if lo is None:
+            leaf = self._pool.get(self._first_leaf)
+            i = 0
+        else:
+            leaf = self._find_leaf(lo)
+            i = bisect.bisect_left(leaf.keys, lo)
+        while True:
+            keys, values = leaf.keys, leaf.values
+            while i < len(keys):
+                if hi is not None and not keys[i] < hi:
+                    return
+                yield keys[i], values[i]
+                i += 1
+            if leaf.next == _NO_PAGE:
+                return
+            leaf = self._pool.get(leaf.next)
+            i = 0
+
+    def items(self):
+        """Yields every (key, value) pair in key order."""
+        return self.range()
+
+    def __iter__(self):
+        for key, _ in self.range():
+            yield key
+
+    # --- Insertion ---
+
+    def insert(self, key, value):
+        """
+        Stores value under key, replacing any previous value.
+
+        Returns:
+            bool: True if a new key was added, False if an existing one was updated.
+        """
+        path = []
+        leaf = self._find_leaf(key, path)
+        i = bisect.bisect_left(leaf.keys, key)
+        if i < len(leaf.keys) and leaf.keys[i] == key:
+            leaf.values[i] = value
+            self._pool.mark_dirty(leaf)
+            return False
+
+        leaf.keys.insert(i, key)
+        leaf.values.insert(i, value)
+        self._count += 1
+        self._pool.mark_dirty(leaf)
+        if len(leaf.keys) <= self.leaf_capacity:
+            return True
+
+        # Split the overflowing leaf; the right half's first key goes up
+        right = self._allocate(True)
+        mid = len(leaf.keys) // 2
+        right.keys, leaf.keys = leaf.keys[mid:], leaf.keys[:mid]
+        right.values, leaf.values = leaf.values[mid:], leaf.values[:mid]
+        right.prev, right.next = leaf.page_id, leaf.next
+        if leaf.next != _NO_PAGE:
+            following = self._pool.get(leaf.next)
+            following.prev = right.page_id
+            self._pool.mark_dirty(following)
+        leaf.next = right.page_id
+        self._pool.mark_dirty(leaf)
+        self._pool.mark_dirty(right)
+        separator, new_page = right.keys[0], right.page_id
+
+        # Insert the separator into the parents, splitting them as needed
+        while path:
+            parent, i = path.pop()
+            parent.keys.insert(i, separator)
+            parent.children.insert(i + 1, new_page)
+            self._pool.mark_dirty(parent)
+            if len(parent.keys) <= self.internal_capacity:
+                return True
+            right = self._allocate(False)
+            mid = len(parent.keys) // 2
+            # The middle key moves up instead of being copied
+            separator = parent.keys[mid]
+            right.keys, parent.keys = parent.keys[mid + 1:], parent.keys[:mid]
+            right.children, parent.children = parent.children[mid + 1:], parent.children[:mid + 1]
+            self._pool.mark_dirty(parent)
+            self._pool.mark_dirty(right)
+            new_page = right.page_id
+
+        # The root itself was split: the tree grows by one level
+        root = self._allocate(False)
+        root.keys = [separator]
+        root.children = [self._root, new_page]
+        self._pool.mark_dirty(root)
+        self._root = root.page_id
+        return True
+
+    def __setitem__(self, key, value):
+        self.insert(key, value)
+
+    # --- Deletion ---
+
+    def delete(self, key):
+        """
+        Removes key from the tree.
+
+        Returns:
+            bool: True if the key was removed, False if it was not present.
+        """
+        path = []
+        leaf = self._find_leaf(key, path)
+        i = bisect.bisect_left(leaf.keys, key)
+        if i == len(leaf.keys) or leaf.keys[i] != key:
+            return False
+
+        del leaf.keys[i]
+        del leaf.values[i]
+        self._count -= 1
+        self._pool.mark_dirty(leaf)
+
+        # Repair underfull pages bottom-up
+        page = leaf
+        while path and len(page.keys) < self._min_keys(page):
+            parent, i = path.pop()
+            self._fix_underflow(parent, i, page)
+            page = parent
+
+        # An internal root left without keys is replaced by its only child
+        root = self._pool.get(self._root)
+        if not root.is_leaf and not root.keys:
+            self._root = root.children[0]
+            self._free(root)
+        return True
+
+    def __delitem__(self, key):
+        if not self.delete(key):
+            raise KeyError(key)
+
+    def _min_keys(self, page):
+        return (self.leaf_capacity if page.is_leaf else self.internal_capacity) // 2
+
+    def _fix_underflow(self, parent, i, page):
+        """
+        page (child i of parent) has too few keys: borrow one from a sibling
+        that can spare it, or else merge it with a sibling.
+        """
+        pool = self._pool
+        left = pool.get(parent.children[i - 1]) if i > 0 else None
+        right = pool.get(parent.children[i + 1]) if i + 1 < len(parent.children) else None
+
+        if left is not None and len(left.keys) > self._min_keys(left):
+            # Redistribute: the largest entry of the left sibling moves over
+            if page.is_leaf:
+                page.keys.insert(0, left.keys.pop())
+                page.values.insert(0, left.values.pop())
+                parent.keys[i - 1] = page.keys[0]
+            else:
+                page.keys.insert(0, parent.keys[i - 1])
+                page.children.insert(0, left.children.pop())
+                parent.keys[i - 1] = left.keys.pop()
+            for changed in (left, page, parent):
+                pool.mark_dirty(changed)
+            return
+
+        if right is not None and len(right.keys) > self._min_keys(right):
+            # Redistribute: the smallest entry of the right sibling moves over
+            if page.is_leaf:
+                page.keys.append(right.keys.pop(0))
+                page.values.append(right.values.pop(0))
+                parent.keys[i] = right.keys[0]
+            else:
+                page.keys.append(parent.keys[i])
+                page.children.append(right.children.pop(0))
+                parent.keys[i] = right.keys.pop(0)
+            for changed in (right, page, parent):
+                pool.mark_dirty(changed)
+            return
+
+        # Merge: always fold the right page of the pair into the left one,
+        # so the first leaf of the chain is never freed
+        if left is not None:
+            target, source, separator_index = left, page, i - 1
+        else:
+            target, source, separator_index = page, right, i
+        if target.is_leaf:
+            target.keys += source.keys
+            target.values += source.values
+            target.next = source.next
+            if source.next != _NO_PAGE:
+                following = pool.get(source.next)
+                following.prev = target.page_id
+                pool.mark_dirty(following)
+        else:
+            target.keys += [parent.keys[separator_index]] + source.keys
+            target.children += source.children
+        del parent.keys[separator_index]
+        del parent.children[separator_index + 1]
+        pool.mark_dirty(target)
+        pool.mark_dirty(parent)
+        self._free(source)
+
+    # --- Bulk Loading ---
+
+    def bulk_load(self, items, fill_factor=0.9):
+        """
+        Builds the tree bottom-up from (key, value) pairs with strictly increasing
+        keys, in O(n) page writes and without any splits. Pages are filled to
+        fill_factor of their capacity, leaving room for later inserts
+        (never below half full). The tree must be empty.
+        """
+        if self._count:
+            raise ValueError("bulk_load requires an empty tree")
+        if not 0 < fill_factor <= 1:
+            raise ValueError("fill_factor must be in (0, 1]")
+
+        pool = self._pool
+        per_leaf = min(self.leaf_capacity, max(self.leaf_capacity // 2, int(self.leaf_capacity * fill_factor), 1))
+        leaf = pool.get(self._root)
+        # (first key, page id) of every page on the level being built
+        level = []
+        previous_key = None
+        for key, value in items:
+            if previous_key is not None and not previous_key < key:
+                raise ValueError("bulk_load keys must be strictly increasing")
+            previous_key = key
+            if len(leaf.keys) == per_leaf:
+                pool.mark_dirty(leaf)
+                level.append((leaf.keys[0], leaf.page_id))
+                following = self._allocate(True)
+                following.prev = leaf.page_id
+                leaf.next = following.page_id
+                pool.mark_dirty(leaf)
+                leaf = following
+            leaf.keys.append(key)
+            leaf.values.append(value)
+            self._count += 1
+        pool.mark_dirty(leaf)
+        if not leaf.keys:
+            return
+        level.append((leaf.keys[0], leaf.page_id))
+
+        # An underfull last leaf is evened out with (or folded into) its neighbour
+        if len(level) > 1 and len(leaf.keys) < self.leaf_capacity // 2:
+            previous = pool.get(leaf.prev)
+            keys, values = previous.keys + leaf.keys, previous.values + leaf.values
+            if len(keys) <= self.leaf_capacity:
+                previous.keys, previous.values = keys, values
+                previous.next = _NO_PAGE
+                self._free(leaf)
+                level.pop()
+            else:
+                half = len(keys) // 2
+                previous.keys, leaf.keys = keys[:half], keys[half:]
+                previous.values, leaf.values = values[:half], values[half:]
+                pool.mark_dirty(leaf)
+                level[-1] = (leaf.keys[0], leaf.page_id)
+            pool.mark_dirty(previous)
+
+        # Internal levels, each built from the (first key, page) list of the one below
+        per_node = min(self.internal_capacity + 1,
+                       max(self.internal_capacity // 2 + 1, int((self.internal_capacity + 1) * fill_factor)))
+        while len(level) > 1:
+            groups = [level[i:i + per_node] for i in range(0, len(level), per_node)]
+            if len(groups) > 1 and len(groups[-1]) < self.internal_capacity // 2 + 1:
+                combined = groups[-2] + groups.pop()
+                if len(combined) <= self.internal_capacity + 1:
+                    groups[-1] = combined
+                else:
+                    half = len(combined) // 2
+                    groups[-1:] = [combined[:half], combined[half:]]
+            next_level = []
+            for group in groups:
+                node = self._allocate(False)
+                node.keys = [first_key for first_key, _ in group[1:]]
+                node.children = [page_id for _, page_id in group]
+                pool.mark_dirty(node)
+                next_level.append((group[0][0], node.page_id))
+            level = next_level
+        self._root = level[0][1]
+
+    # --- Persistence ---
+
+    def flush(self):
+        """Writes all dirty pages and the metadata to the file."""
+        self._pool.flush()
+        _META.pack_into(self._mmap, 0, _MAGIC, _VERSION, self.page_size, self._root, self._first_leaf,
+                        self._num_pages, self._free_head, self._count,
+                        self.key_format.encode(), self.value_format.encode())
+        self._mmap.flush()
+
+    def close(self):
+        """Flushes and closes the file."""
+        if self._mmap is not None:
+            self.flush()
+            self._mmap.close()
+            self._mmap = None
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def height(self):
+        """Returns the number of levels (1 for a single leaf)."""
+        levels = 1
+        page = self._pool.get(self._root)
+        while not page.is_leaf:
+            page = self._pool.get(page.children[0])
+            levels += 1
+        return levels
+
+    def cache_stats(self):
+        """Returns the buffer pool's hit, miss and write-back counters."""
+        return {"hits": self._pool.hits, "misses": self._pool.misses, "writes": self._pool.writes}
+
+def _benchmark_memory(make_tree=None, num_rows=200_000, num_keys=20_000, seed=0):
+    """
+    Reports the bytes allocated per entry (measured with tracemalloc) when a
+    tree indexes num_rows row ids under num_keys keys, comparing a key-only
+    tree plus a parallel dict of lists with map mode and posting lists.
+
+    make_tree(duplicates) returns an empty tree; it defaults to BTree(16).
+    """
+    import random
+    import tracemalloc
+
+    if make_tree is None:
+        make_tree = lambda duplicates: BTree(16, duplicates=duplicates)
+
+    rng = random.Random(seed)
+    keys = [rng.randrange(num_keys) for _ in range(num_rows)]
+    rows = list(range(num_rows))
+    unique_keys = rng.sample(range(num_keys), num_keys)
+
+    def measure(build):
+        tracemalloc.start()
+        try:
+            structure = build()
+            return tracemalloc.get_traced_memory()[0], structure
+        finally:
+            tracemalloc.stop()
+
+    def tree_and_dict(duplicates):
+        tree, index = make_tree(False), {}
+        if duplicates:
+            for key, row in zip(keys, rows):
+                index.setdefault(key, []).append(row)
+        else:
+            index = dict(zip(unique_keys, rows))
+        # Keys go in in first-seen (random) order so an unbalanced tree stays shallow
+        for key in index:
+            tree.insert(key)
+        return tree, index
+
+    def map_mode(duplicates):
+        tree = make_tree(duplicates)
+        for key, row in zip(keys, rows) if duplicates else zip(unique_keys, rows):
+            tree.put(key, row)
+        return tree
+
+    print(f"{type(make_tree(False)).__name__}: {num_rows} rows under {num_keys} keys, bytes per entry:")
+    for label, build, entries in (
+            ("unique keys, tree + dict", lambda: tree_and_dict(False), num_keys),
+            ("unique keys, map mode", lambda: map_mode(False), num_keys),
+            ("duplicate keys, tree + dict of lists", lambda: tree_and_dict(True), num_rows),
+            ("duplicate keys, posting lists", lambda: map_mode(True), num_rows)):
+        size, _ = measure(build)
+        print(f"  {label}: {size / entries:.1f}")
+
 # --- Example Usage ---
 
 if __name__ == "__main__":
@@ -202,3 +1317,47 @@ if __name__ == "__main__":
         print(f"Search for {search_key_not_found}: Found in node keys {node.keys} at index {index}.")
     else:
         print(f"Search for {search_key_not_found}: Not Found.")
+
+    # 5. Ordered iteration with cursors
+    print("\n--- Range Scans ---")
+    print(f"Keys in [25, 60): {list(b_tree.iter_range(25, 60))}")
+    print(f"Keys below 30, descending: {list(b_tree.iter_range(hi=30, reverse=True))}")
+    cursor = b_tree.seek(42)
+    print(f"Seek 42 -> {cursor.key}, next -> {cursor.next()}, prev -> {cursor.prev()}")
+
+    # 6. Bulk-append sorted keys along the rightmost path
+    bulk_tree = BTree(t=3)
+    bulk_tree.insert_many(range(1, 21))
+    print("\n>>> B-Tree built by insert_many(1..20):")
+    bulk_tree.print_tree()
+
+    # 7. A disk-backed B+Tree index over the same keys
+    import tempfile
+    index_path = os.path.join(tempfile.mkdtemp(), "index.bpt")
+    with BPlusTree(index_path, page_size=256) as index:
+        index.bulk_load(((key, key * 10) for key in sorted(values)), fill_factor=0.7)
+        index.insert(42, 420)
+        index.delete(10)
+        print("\n--- B+Tree Index ---")
+        print(f"Height: {index.height()}, entries: {len(index)}")
+        print(f"Keys in [20, 50): {[key for key, _ in index.range(20, 50)]}")
+
+    # Reopen the file: the index persists
+    with BPlusTree(index_path) as index:
+        print(f"Reopened, value for 42: {index.get(42)}")
+
+    # 8. A sorted map with duplicate keys kept in posting lists
+    postings = BTree(t=3, duplicates=True)
+    for row, key in enumerate([30, 10, 30, 20, 10, 30]):
+        postings.put(key, row)
+    print("\n--- Sorted Map with Posting Lists ---")
+    print(f"Rows for 30: {postings.get(30).tolist()}")      # Expected: [0, 2, 5]
+    print(f"All entries: {[(key, rows.tolist()) for key, rows in postings.items()]}")
+    postings.pop(10)
+    print(f"After pop(10): {list(postings)}, {len(postings)} keys")
+    postings.insert(40)                 # a bare key: no posting list yet
+    postings.put(40, 6)
+    print(f"Rows for 40 after insert then put: {postings.get(40).tolist()}")  # Expected: [6]
+
+    print("\n--- Benchmark: Memory per Entry ---")
+    _benchmark_memory()
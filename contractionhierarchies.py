@@ -0,0 +1,319 @@
+import heapq
+import pickle
+
+class ContractionHierarchy:
+    """
+    A preprocessed index for fast repeated shortest-path queries on a static graph
+    with non-negative weights.
+
+    Nodes are contracted one at a time in order of importance. Contracting v removes
+    it from the graph and, for every pair of neighbors u -> v -> w whose shortest
+    connection runs through v, inserts a shortcut edge u -> w. Afterwards every
+    shortest path can be found by a search that only moves "up" the hierarchy from
+    both ends, which touches a tiny fraction of the graph.
+    """
+    def __init__(self, rank, upward, downward, middle):
+        # rank[v]: position of v in the contraction order (higher = more important)
+        self.rank = rank
+        # upward[v]: [(w, weight), ...] for edges v -> w with rank[w] > rank[v]
+        self.upward = upward
+        # downward[v]: [(u, weight), ...] for edges u -> v with rank[u] > rank[v],
+        # i.e. the reversed edges walked by the backward search
+        self.downward = downward
+        # middle[(u, w)]: the contracted node a shortcut u -> w skips over
+        self.middle = middle
+
+    # --- Preprocessing ---
+
+    @classmethod
+    def build(cls, graph, witness_settle_limit=500):
+        """
+        Builds the hierarchy from a graph.
+
+        Args:
+            graph (Graph or dict): A graphs.Graph, or an adjacency list such as
+                      {'A': [('B', 2), ('C', 1)], ...} or {'A': {'B': 2, 'C': 1}, ...}.
+            witness_settle_limit (int, optional): Maximum number of nodes settled by
+                      each witness search. A lower limit preprocesses faster but may
+                      insert a few unnecessary (still correct) shortcuts.
+        """
+        adjacency = graph.graph if hasattr(graph, "graph") else graph
+
+        # Working copy of the remaining graph, in both directions: {u: {v: weight}}
+        out_edges = {}
+        in_edges = {}
+        for u, neighbors in adjacency.items():
+            out_edges.setdefault(u, {})
+            in_edges.setdefault(u, {})
+            if isinstance(neighbors, dict):
+                neighbors = neighbors.items()
+            for v, weight in neighbors:
+                out_edges.setdefault(v, {})
+                in_edges.setdefault(v, {})
+                # Self loops never lie on a shortest path; keep the lightest parallel edge
+                if u != v and weight < out_edges[u].get(v, float('inf')):
+                    out_edges[u][v] = weight
+                    in_edges[v][u] = weight
+
+        rank = {}
+        upward = {}
+        downward = {}
+        middle = {}
+        deleted_neighbors = dict.fromkeys(out_edges, 0)
+
+        def priority(v):
+            # Edge difference, plus a term that spreads contraction evenly over the graph
+            shortcuts = cls._shortcuts_for(out_edges, in_edges, v, witness_settle_limit)
+            return len(shortcuts) - len(in_edges[v]) - len(out_edges[v]) + deleted_neighbors[v]
+
+        queue = [(priority(v), i, v) for i, v in enumerate(out_edges)]
+        heapq.heapify(queue)
+
+        while queue:
+            _, tie, v = heapq.heappop(queue)
+            if v in rank:
+                continue
+
+            # Lazy update: the priority may be stale after neighbors were contracted
+            current = priority(v)
+            if queue and current > queue[0][0]:
+                heapq.heappush(queue, (current, tie, v))
+                continue
+
+            # 1. Freeze v's remaining edges: they all lead to higher-ranked nodes
+            rank[v] = len(rank)
+            upward[v] = list(out_edges[v].items())
+            downward[v] = list(in_edges[v].items())
+
+            # 2. Insert shortcuts around v
+            for u, w, weight in cls._shortcuts_for(out_edges, in_edges, v, witness_settle_limit):
+                if weight < out_edges[u].get(w, float('inf')):
+                    out_edges[u][w] = weight
+                    in_edges[w][u] = weight
+                    middle[(u, w)] = v
+
+            # 3. Remove v from the remaining graph
+            for u in in_edges[v]:
+                del out_edges[u][v]
+                deleted_neighbors[u] += 1
+            for w in out_edges[v]:
+                del in_edges[w][v]
+                deleted_neighbors[w] += 1
+            del out_edges[v], in_edges[v]
+
+        # Only shortcuts that survived on a frozen edge are needed for unpacking
+        kept = {(v, w) for v, edges in upward.items() for w, _ in edges}
+        kept.update((u, v) for v, edges in downward.items() for u, _ in edges)
+        middle = {edge: via for edge, via in middle.items() if edge in kept}
+
+        return cls(rank, upward, downward, middle)
+
+    @staticmethod
+    def _shortcuts_for(out_edges, in_edges, v, settle_limit):
+        """
+        Returns the shortcuts (u, w, weight) needed if v were contracted now:
+        one for every pair u -> v -> w without an equally short witness path avoiding v.
+        """
+        outgoing = out_edges[v]
+        if not outgoing or not in_edges[v]:
+            return []
+        max_outgoing = max(outgoing.values())
+        inf = float('inf')
+
+        shortcuts = []
+        for u, weight_uv in in_edges[v].items():
+            witness = ContractionHierarchy._witness_search(
+                out_edges, u, v, weight_uv + max_outgoing, settle_limit)
+            for w, weight_vw in outgoing.items():
+                if w != u and witness.get(w, inf) > weight_uv + weight_vw:
+                    shortcuts.append((u, w, weight_uv + weight_vw))
+        return shortcuts
+
+    @staticmethod
+    def _witness_search(out_edges, source, excluded, max_distance, settle_limit):
+        """
+        Bounded Dijkstra from source in the remaining graph, skipping node 'excluded'.
+        Every distance returned is the length of a real path, so an early stop
+        can only cause extra shortcuts, never wrong ones.
+        """
+        distances = {source: 0}
+        queue = [(0, source)]
+        settled = 0
+        while queue:
+            current_distance, u = heapq.heappop(queue)
+            if current_distance > distances[u]:
+                continue
+            if current_distance > max_distance or settled >= settle_limit:
+                break
+            settled += 1
+            for x, weight in out_edges[u].items():
+                if x == excluded:
+                    continue
+                distance_through_u = current_distance + weight
+                if distance_through_u < distances.get(x, float('inf')):
+                    distances[x] = distance_through_u
+                    heapq.heappush(queue, (distance_through_u, x))
+        return distances
+
+    # --- Queries ---
+
+    def query(self, source, target):
+        """
+        Finds the shortest path from source to target.
+
+        Returns:
+            float: The shortest distance, or infinity if target is unreachable.
+            dict: A predecessor map along the fully unpacked path (no shortcuts),
+                  usable with djikstrasalgo.reconstruct_path(predecessors, target).
+                  Empty if unreachable.
+        """
+        if source not in self.rank or target not in self.rank:
+            print(f"Error: Node '{source if source not in self.rank else target}' not found in graph.")
+            return float('inf'), {}
+
+        forward_distances, forward_predecessors = self._upward_search(source, self.upward)
+        backward_distances, backward_predecessors = self._upward_search(target, self.downward)
+
+        # The best path peaks at the highest-ranked node both searches reached
+        best = float('inf')
+        meeting_node = None
+        for node, distance in forward_distances.items():
+            total = distance + backward_distances.get(node, float('inf'))
+            if total < best:
+                best = total
+                meeting_node = node
+        if meeting_node is None:
+            return best, {}
+
+        # Hierarchy path: source .. meeting_node .. target, possibly over shortcuts
+        path = []
+        node = meeting_node
+        while node is not None:
+            path.append(node)
+            node = forward_predecessors[node]
+        path.reverse()
+        node = backward_predecessors[meeting_node]
+        while node is not None:
+            path.append(node)
+            node = backward_predecessors[node]
+
+        # Unpack shortcuts into original-graph nodes. With zero-weight edges the
+        # unpacked walk can revisit a node; cut any such loop back to its first visit.
+        nodes = [source]
+        position = {source: 0}
+        for u, w in zip(path, path[1:]):
+            for node in self._unpack_edge(u, w):
+                if node in position:
+                    for dropped in nodes[position[node] + 1:]:
+                        del position[dropped]
+                    del nodes[position[node] + 1:]
+                else:
+                    position[node] = len(nodes)
+                    nodes.append(node)
+
+        predecessors = {source: None}
+        for previous, node in zip(nodes, nodes[1:]):
+            predecessors[node] = previous
+        return best, predecessors
+
+    def distance(self, source, target):
+        """Returns only the shortest distance from source to target."""
+        return self.query(source, target)[0]
+
+    def _upward_search(self, start, edges):
+        """Dijkstra restricted to edges leading to higher-ranked nodes."""
+        distances = {start: 0}
+        predecessors = {start: None}
+        queue = [(0, start)]
+        while queue:
+            current_distance, u = heapq.heappop(queue)
+            if current_distance > distances[u]:
+                continue
+            for v, weight in edges[u]:
+                distance_through_u = current_distance + weight
+                if distance_through_u < distances.get(v, float('inf')):
+                    distances[v] = distance_through_u
+                    predecessors[v] = u
+                    heapq.heappush(queue, (distance_through_u, v))
+        return distances, predecessors
+
+    def _unpack_edge(self, u, w):
+        """Yields the original-graph nodes after u on the edge u -> w, expanding shortcuts."""
+        stack = [(u, w)]
+        while stack:
+            a, b = stack.pop()
+            via = self.middle.get((a, b))
+            if via is None:
+                yield b
+            else:
+                # Expand a -> via first, then via -> b
+                stack.append((via, b))
+                stack.append((a, via))
+
+    def num_shortcuts(self):
+        """Returns the number of shortcut edges kept in the search graphs."""
+        return len(self.middle)
+
+    # --- Persistence ---
+
+    def save(self, path):
+        """Writes the index to a file."""
+        with open(path, "wb") as f:
+            pickle.dump((self.rank, self.upward, self.downward, self.middle), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path):
+        """Reads an index written by save()."""
+        with open(path, "rb") as f:
+            rank, upward, downward, middle = pickle.load(f)
+        return cls(rank, upward, downward, middle)
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    from djikstrasalgo import reconstruct_path
+
+    # A small directed road network
+    graph_example = {
+        'A': [('B', 2), ('C', 1)],
+        'B': [('D', 1), ('E', 5)],
+        'C': [('D', 3), ('E', 9)],
+        'D': [('F', 2)],
+        'E': [('F', 4)],
+        'F': [('A', 7)]
+    }
+
+    # 1. Preprocess once
+    hierarchy = ContractionHierarchy.build(graph_example)
+    order = sorted(hierarchy.rank, key=hierarchy.rank.get)
+    print(f"Contraction order: {order}")
+    print(f"Shortcuts added: {hierarchy.num_shortcuts()}")
+
+    # 2. Save the index and load it back
+    index_path = os.path.join(tempfile.gettempdir(), "contraction_hierarchy.pkl")
+    hierarchy.save(index_path)
+    hierarchy = ContractionHierarchy.load(index_path)
+
+    # 3. Answer many queries against the same index
+    print("\n--- Queries ---")
+    for source, target in [('A', 'F'), ('C', 'B'), ('E', 'D')]:
+        distance, predecessors = hierarchy.query(source, target)
+        print(f"{source} -> {target}: distance {distance}, path {reconstruct_path(predecessors, target)}")
+    # Expected: A -> F = 5 (A -> B -> D -> F), C -> B = 14, E -> D = 14
+
+    os.remove(index_path)
+
+    # 4. Zero-weight edges: the unpacked path must not loop back on itself
+    zero_weight_graph = {
+        'X': [('Y', 0)],
+        'Y': [('X', 0), ('Z', 0)],
+        'Z': [('Y', 0)]
+    }
+    zero_hierarchy = ContractionHierarchy.build(zero_weight_graph)
+    distance, predecessors = zero_hierarchy.query('X', 'Y')
+    print(f"\nZero-weight X -> Y: distance {distance}, path {reconstruct_path(predecessors, 'Y')}")
+    # Expected: distance 0, path X -> Y
@@ -0,0 +1,306 @@
+from array import array
+
+from graphs import CSRGraph
+
+# Event kinds produced by dfs_events
+ENTER = "enter"
+EXIT = "exit"
+NON_TREE_EDGE = "non_tree_edge"
+
+def _compile(graph):
+    """
+    Returns (csr, labels): the graph as a CSRGraph, and the labels to translate
+    vertex ids back with, or None when the caller passed a CSRGraph (results
+    are then reported as vertex ids).
+    """
+    if isinstance(graph, CSRGraph):
+        return graph, None
+    if hasattr(graph, "to_csr"):
+        csr = graph.to_csr()
+    else:
+        csr = CSRGraph.from_adjacency(graph)
+    return csr, csr.labels
+
+def _events(csr, roots=None):
+    """
+    The DFS engine: an explicit stack of (vertex, parent, neighbor iterator).
+    The top entry's iterator is resumed where it stopped, so every edge is
+    looked at exactly once and no recursion is involved. Neighbors are taken
+    in stored order; nothing is sorted.
+
+    Yields (ENTER, v, parent), (NON_TREE_EDGE, u, v) and (EXIT, v, parent)
+    on vertex ids. Parent is -1 for the root of each DFS tree.
+    """
+    offsets, targets = csr.offsets, csr.targets
+    n = len(csr.labels)
+    visited = bytearray(n)
+
+    for root in (range(n) if roots is None else roots):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        yield ENTER, root, -1
+        stack = [(root, -1, iter(targets[offsets[root]:offsets[root + 1]]))]
+
+        while stack:
+            u, parent, neighbors = stack[-1]
+            for v in neighbors:
+                if not visited[v]:
+                    visited[v] = 1
+                    yield ENTER, v, u
+                    stack.append((v, u, iter(targets[offsets[v]:offsets[v + 1]])))
+                    break
+                yield NON_TREE_EDGE, u, v
+            else:
+                # Iterator exhausted: every edge out of u has been explored
+                stack.pop()
+                yield EXIT, u, parent
+
+def dfs_events(graph, sources=None):
+    """
+    Performs an iterative Depth-First Search and yields its events.
+
+    Args:
+        graph (dict, Graph or CSRGraph): An adjacency list such as {'A': ['B', 'C'], ...},
+                      a graphs.Graph, or a compiled graphs.CSRGraph.
+        sources (list, optional): Roots to start from, in order. Defaults to every
+                      vertex, which visits the whole graph (a DFS forest).
+
+    Yields:
+        tuple: (ENTER, node, parent) when a node is discovered, parent is None for a root;
+               (NON_TREE_EDGE, u, v) when the edge u -> v leads to an already discovered node;
+               (EXIT, node, parent) when all of node's edges are explored.
+        For a CSRGraph, nodes are vertex ids (see graph.labels).
+    """
+    csr, labels = _compile(graph)
+    roots = None
+    if sources is not None:
+        roots = [csr.index[s] for s in sources] if labels is not None else sources
+
+    for kind, u, v in _events(csr, roots):
+        if kind == NON_TREE_EDGE:
+            yield (kind, u, v) if labels is None else (kind, labels[u], labels[v])
+        else:
+            parent = None if v < 0 else (v if labels is None else labels[v])
+            yield kind, (u if labels is None else labels[u]), parent
+
+def discovery_finish_times(graph):
+    """
+    Returns two dictionaries, discovery[v] and finish[v], with the DFS clock
+    value when each node was entered and exited (one shared counter).
+    """
+    csr, labels = _compile(graph)
+    n = len(csr.labels)
+    discovery = array('q', [-1]) * n
+    finish = array('q', [-1]) * n
+    clock = 0
+    for kind, u, _ in _events(csr):
+        if kind == ENTER:
+            discovery[u] = clock
+            clock += 1
+        elif kind == EXIT:
+            finish[u] = clock
+            clock += 1
+    names = labels if labels is not None else range(n)
+    return dict(zip(names, discovery)), dict(zip(names, finish))
+
+def strongly_connected_components(graph):
+    """
+    Finds the strongly connected components of a directed graph with Tarjan's
+    algorithm, in O(V + E).
+
+    Returns:
+        list: A list of components (lists of nodes). Components come out in
+              reverse topological order of the condensation graph.
+    """
+    csr, labels = _compile(graph)
+    n = len(csr.labels)
+    index = array('q', [-1]) * n
+    low = array('q', [0]) * n
+    on_stack = bytearray(n)
+    stack = []
+    counter = 0
+    components = []
+
+    for kind, u, v in _events(csr):
+        if kind == ENTER:
+            index[u] = low[u] = counter
+            counter += 1
+            stack.append(u)
+            on_stack[u] = 1
+        elif kind == NON_TREE_EDGE:
+            # Only edges back into the current stack can shrink the low-link
+            if on_stack[v] and index[v] < low[u]:
+                low[u] = index[v]
+        else:
+            parent = v
+            if low[u] == index[u]:
+                # u is the root of a component: pop it off the stack
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = 0
+                    component.append(w)
+                    if w == u:
+                        break
+                components.append(component)
+            if parent >= 0 and low[u] < low[parent]:
+                low[parent] = low[u]
+
+    if labels is not None:
+        components = [[labels[w] for w in component] for component in components]
+    return components
+
+def find_cycle(graph):
+    """
+    Returns the nodes of a directed cycle, in edge order, or None if the graph
+    is acyclic. An edge to a node that is entered but not yet exited (a back
+    edge) closes the cycle.
+    """
+    csr, labels = _compile(graph)
+    n = len(csr.labels)
+    parent_of = array('q', [-1]) * n
+    # 0 = unvisited, 1 = on the current DFS path, 2 = finished
+    state = bytearray(n)
+
+    for kind, u, v in _events(csr):
+        if kind == ENTER:
+            state[u] = 1
+            parent_of[u] = v
+        elif kind == EXIT:
+            state[u] = 2
+        elif state[v] == 1:
+            # Back edge u -> v: the tree path v .. u plus this edge is a cycle
+            cycle = [u]
+            while cycle[-1] != v:
+                cycle.append(parent_of[cycle[-1]])
+            cycle.reverse()
+            return cycle if labels is None else [labels[w] for w in cycle]
+    return None
+
+def has_cycle(graph):
+    """Returns True if the directed graph contains a cycle."""
+    return find_cycle(graph) is not None
+
+def topological_sort(graph):
+    """
+    Orders the nodes of a directed acyclic graph so every edge points forward,
+    using reverse DFS finishing order.
+
+    Returns:
+        list: The nodes in topological order, or None if the graph has a cycle.
+    """
+    csr, labels = _compile(graph)
+    state = bytearray(len(csr.labels))
+    order = []
+    for kind, u, v in _events(csr):
+        if kind == ENTER:
+            state[u] = 1
+        elif kind == EXIT:
+            state[u] = 2
+            order.append(u)
+        elif state[v] == 1:
+            return None
+    order.reverse()
+    return order if labels is None else [labels[w] for w in order]
+
+def bridges_and_articulation_points(graph):
+    """
+    Finds the bridges (edges whose removal disconnects the graph) and the
+    articulation points (nodes whose removal does) of an undirected graph,
+    using DFS low-link values in O(V + E).
+
+    The adjacency list must hold both directions of every edge, as graphs.Graph
+    does for undirected graphs. Parallel edges are handled: only one copy of the
+    edge back to the DFS parent is ignored.
+
+    Returns:
+        list: The bridges as (parent, child) tuples of the DFS tree.
+        list: The articulation points.
+    """
+    csr, labels = _compile(graph)
+    n = len(csr.labels)
+    discovery = array('q', [-1]) * n
+    low = array('q', [0]) * n
+    parent_of = array('q', [-1]) * n
+    parent_edge_skipped = bytearray(n)
+    root_children = array('q', [0]) * n
+    is_articulation = bytearray(n)
+    bridges = []
+    clock = 0
+
+    for kind, u, v in _events(csr):
+        if kind == ENTER:
+            discovery[u] = low[u] = clock
+            clock += 1
+            parent_of[u] = v
+            if v >= 0 and parent_of[v] < 0:
+                root_children[v] += 1
+        elif kind == NON_TREE_EDGE:
+            if v == parent_of[u] and not parent_edge_skipped[u]:
+                # The reverse copy of the tree edge that led to u
+                parent_edge_skipped[u] = 1
+            elif discovery[v] < low[u]:
+                low[u] = discovery[v]
+        else:
+            parent = v
+            if parent < 0:
+                # A DFS root is a cut vertex only if it has several tree children
+                if root_children[u] > 1:
+                    is_articulation[u] = 1
+                continue
+            if low[u] < low[parent]:
+                low[parent] = low[u]
+            if low[u] > discovery[parent]:
+                bridges.append((parent, u))
+            if low[u] >= discovery[parent] and parent_of[parent] >= 0:
+                is_articulation[parent] = 1
+
+    articulation_points = [w for w in range(n) if is_articulation[w]]
+    if labels is not None:
+        bridges = [(labels[a], labels[b]) for a, b in bridges]
+        articulation_points = [labels[w] for w in articulation_points]
+    return bridges, articulation_points
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+    # Directed graph with two cycles
+    directed_example = {
+        'A': ['B'],
+        'B': ['C', 'E'],
+        'C': ['A', 'D'],
+        'D': [],
+        'E': ['F'],
+        'F': ['E']
+    }
+    print(f"Directed graph: {directed_example}")
+    print(f"DFS events from A: {list(dfs_events(directed_example, ['A']))[:4]} ...")
+    discovery, finish = discovery_finish_times(directed_example)
+    print(f"Discovery times: {discovery}")
+    print(f"Finish times: {finish}")
+    print(f"Strongly connected components: {strongly_connected_components(directed_example)}")
+    # Expected: [['D'], ['F', 'E'], ['C', 'B', 'A']] (reverse topological order)
+    print(f"A cycle: {find_cycle(directed_example)}")
+
+    # Directed acyclic graph (task dependencies)
+    tasks = {
+        'wake up': ['shower', 'coffee'],
+        'shower': ['dress'],
+        'coffee': ['breakfast'],
+        'breakfast': ['leave'],
+        'dress': ['leave'],
+        'leave': []
+    }
+    print(f"\nTopological order: {topological_sort(tasks)}")
+
+    # Undirected graph: two triangles joined by the edge C - D
+    undirected_example = {
+        'A': ['B', 'C'], 'B': ['A', 'C'], 'C': ['A', 'B', 'D'],
+        'D': ['C', 'E', 'F'], 'E': ['D', 'F'], 'F': ['D', 'E']
+    }
+    bridges, cut_vertices = bridges_and_articulation_points(undirected_example)
+    print(f"\nBridges: {bridges}")
+    print(f"Articulation points: {cut_vertices}")
+    # Expected: Bridges [('C', 'D')], Articulation points ['C', 'D']
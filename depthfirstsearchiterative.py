@@ -1,3 +1,5 @@
+from graphs import CSRGraph
+
 def depth_first_search_iterative(graph, start_node):
     """
     Performs the Depth-First Search (DFS) algorithm iteratively 
@@ -5,11 +7,16 @@ def depth_first_search_iterative(graph, start_node):
 
     Args:
         graph (dict): The graph represented as an adjacency list.
+                      A compiled graphs.CSRGraph is also accepted; its neighbors
+                      are visited in stored order instead of sorted order.
         start_node (str): The node to start the traversal from.
 
     Returns:
         list: A list of nodes in the order they were visited.
     """
+    if isinstance(graph, CSRGraph):
+        return _depth_first_search_iterative_csr(graph, start_node)
+
     if start_node not in graph:
         return [] # Return empty list if start node isn't in the graph
 
@@ -42,23 +49,52 @@ def depth_first_search_iterative(graph, start_node):
 
     return traversal_order
 
+def _depth_first_search_iterative_csr(graph, start_node):
+    """
+    Iterative DFS over the dense integer ids of a CSRGraph.
+    Each row is pushed in reverse so neighbors pop in stored order, without sorting.
+    """
+    source = graph.index.get(start_node)
+    if source is None:
+        return []
+
+    offsets, targets = graph.offsets, graph.targets
+    visited = bytearray(len(graph.labels))
+    visited[source] = 1
+    stack = [source]
+    order = []
+
+    while stack:
+        current_node = stack.pop()
+        order.append(current_node)
+        for k in range(offsets[current_node + 1] - 1, offsets[current_node] - 1, -1):
+            neighbor = targets[k]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                stack.append(neighbor)
+
+    labels = graph.labels
+    return [labels[i] for i in order]
+
 # --- Example Usage ---
 
-# Define a sample graph (Adjacency List)
-graph_example = {
-    'A': ['B', 'C'],
-    'B': ['D', 'E'],
-    'C': ['F'],
-    'D': [],
-    'E': ['F'],
-    'F': []
-}
-
-start_node = 'A'
-dfs_result = depth_first_search_iterative(graph_example, start_node)
-
-print(f"Graph: {graph_example}")
-print(f"Starting Node: {start_node}")
-print(f"DFS Traversal Order (Iterative): {dfs_result}")
-# Expected Output: ['A', 'C', 'F', 'B', 'E', 'D'] (The exact order can vary 
-# depending on neighbor processing, but this is typical when sorting neighbors in reverse before push)
+if __name__ == "__main__":
+
+    # Define a sample graph (Adjacency List)
+    graph_example = {
+        'A': ['B', 'C'],
+        'B': ['D', 'E'],
+        'C': ['F'],
+        'D': [],
+        'E': ['F'],
+        'F': []
+    }
+
+    start_node = 'A'
+    dfs_result = depth_first_search_iterative(graph_example, start_node)
+
+    print(f"Graph: {graph_example}")
+    print(f"Starting Node: {start_node}")
+    print(f"DFS Traversal Order (Iterative): {dfs_result}")
+    # Expected Output: ['A', 'C', 'F', 'B', 'E', 'D'] (The exact order can vary 
+    # depending on neighbor processing, but this is typical when sorting neighbors in reverse before push)
@@ -1,20 +1,86 @@
 import heapq
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 
-def dijkstra(graph, start_node):
+from graphs import CSRGraph
+from priorityqueue import IndexedPriorityQueue, RadixHeap
+
+STRATEGIES = ("priority_queue", "radix", "dial", "delta")
+
+# Smallest delta-stepping frontier worth shipping to the worker processes
+_PARALLEL_FRONTIER = 4096
+
+def dijkstra(graph, start_node, heap=None, stats=None, strategy="priority_queue", delta=None, workers=1,
+             targets=None, max_distance=None, k_nearest=None):
     """
     Finds the shortest path distance from a start_node to all other nodes 
     in a graph with non-negative weights using Dijkstra's algorithm.
 
     Args:
-        graph (dict): The graph represented as an adjacency list.
+        graph (dict or CSRGraph): The graph represented as an adjacency list.
                       Example: {'A': [('B', 2), ('C', 1)], 'B': [('D', 1)], ...}
+                      A compiled graphs.CSRGraph is also accepted.
         start_node (str): The node to start the shortest path calculation from.
+        heap (str, optional): The binary heap used by strategy "priority_queue".
+                      "lazy" (default) pushes a new (distance, node) entry into heapq on
+                      every relaxation and skips outdated entries when they are popped.
+                      "indexed" keeps each node at most once in an IndexedPriorityQueue
+                      and lowers its key in place, so the heap never exceeds V entries.
+                      Passing it with another strategy raises ValueError.
+        stats (dict, optional): If given, filled with the number of heap 'pushes',
+                      'pops' and the 'max_heap_size' reached during the search
+                      (delta-stepping reports 'pushes', 'pops' and 'phases').
+        strategy (str, optional): The search algorithm.
+                      "priority_queue" (default) is Dijkstra's algorithm with the
+                      binary 'heap' above.
+                      "radix" uses a RadixHeap (monotone integer priority queue).
+                      "dial" uses Dial's circular array of C + 1 buckets, where C is
+                      the largest edge weight; best when C is small.
+                      "delta" is delta-stepping: buckets of width 'delta', with the
+                      edges out of each bucket relaxed in bulk.
+                      "radix" and "dial" require integer weights.
+        delta (int or float, optional): Bucket width for "delta". Defaults to the
+                      largest weight divided by the average out-degree.
+        workers (int, optional): Worker processes for "delta". 1 (default) relaxes
+                      in this process; None uses one per CPU. Large buckets are
+                      split across the workers.
+        targets (set, optional): Stop as soon as every one of these nodes is settled.
+        max_distance (optional): Stop before settling any node farther than this.
+        k_nearest (int, optional): Stop once k nodes are settled: k of the targets
+                      if targets is given, otherwise the k nearest nodes other
+                      than start_node.
+                      With any of these three, the search stops at the first
+                      condition met and only the nodes settled by then (whose
+                      distances are final) appear in the returned dicts.
 
     Returns:
         dict: A dictionary containing the shortest distance from the start_node 
               to every reachable node.
         dict: A dictionary storing the predecessor of each node on the shortest path.
     """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy: {strategy!r}")
+    if heap is None:
+        heap = "lazy"
+    elif heap not in ("lazy", "indexed"):
+        raise ValueError(f"Unknown heap strategy: {heap!r}")
+    elif strategy != "priority_queue":
+        raise ValueError(f"heap={heap!r} only applies to strategy='priority_queue', not {strategy!r}")
+
+    if targets is not None or max_distance is not None or k_nearest is not None:
+        if strategy != "priority_queue":
+            raise ValueError("targets, max_distance and k_nearest need strategy='priority_queue'")
+        if heap != "lazy":
+            raise ValueError("targets, max_distance and k_nearest use the lazy heap")
+        return _dijkstra_bounded(graph, start_node, targets, max_distance, k_nearest, stats)
+
+    if strategy != "priority_queue":
+        return _dijkstra_buckets(graph, start_node, strategy, stats, delta, workers)
+
+    if isinstance(graph, CSRGraph):
+        return _dijkstra_csr(graph, start_node, heap, stats)
+
     if start_node not in graph:
         print(f"Error: Start node '{start_node}' not found in graph.")
         return {}, {}
@@ -29,14 +95,24 @@ def dijkstra(graph, start_node):
     # Predecessor map: Stores the optimal preceding node on the shortest path.
     predecessors = {node: None for node in graph}
 
+    if heap == "indexed":
+        _dijkstra_indexed(graph, start_node, distances, predecessors, stats)
+        return distances, predecessors
+
     # Priority Queue (Min-Heap): Stores elements as (distance, node)
     # Start with the initial node.
     priority_queue = [(0, start_node)]
+    pushes, pops, max_heap_size = 1, 0, 1
 
     # 2. Main loop: Process nodes in order of increasing distance
     while priority_queue:
+        # The heap only grows between pops, so its peak is seen just before one
+        if len(priority_queue) > max_heap_size:
+            max_heap_size = len(priority_queue)
+
         # Extract the node 'u' with the minimum distance 'd' from the priority queue
         current_distance, u = heapq.heappop(priority_queue)
+        pops += 1
 
         # Optimization: If the extracted distance is greater than the best known 
         # distance, skip processing (it's an outdated entry).
@@ -57,38 +133,467 @@ def dijkstra(graph, start_node):
                 # Push the updated distance to the priority queue
                 # This automatically handles the "set of unvisited nodes" concept
                 heapq.heappush(priority_queue, (distance_through_u, v))
+                pushes += 1
+
+    if stats is not None:
+        stats.update(pushes=pushes, pops=pops, max_heap_size=max_heap_size)
 
     return distances, predecessors
 
-# --- Example Usage ---
+def _dijkstra_indexed(graph, start_node, distances, predecessors, stats):
+    """
+    Main loop of Dijkstra's algorithm using decrease-key instead of lazy deletion.
+    Fills the given distances and predecessors maps in place.
+    """
+    priority_queue = IndexedPriorityQueue()
+    priority_queue.push(start_node, 0)
+    pushes, pops, max_heap_size = 1, 0, 1
+
+    while not priority_queue.is_empty():
+        if priority_queue.size() > max_heap_size:
+            max_heap_size = priority_queue.size()
+
+        # Every pop settles a node for good: there are no outdated entries
+        current_distance, u = priority_queue.pop()
+        pops += 1
+
+        for v, weight in graph.get(u, []):
+            distance_through_u = current_distance + weight
+            if distance_through_u < distances[v]:
+                distances[v] = distance_through_u
+                predecessors[v] = u
+                if v in priority_queue:
+                    priority_queue.decrease_key(v, distance_through_u)
+                else:
+                    priority_queue.push(v, distance_through_u)
+                    pushes += 1
+
+    if stats is not None:
+        stats.update(pushes=pushes, pops=pops, max_heap_size=max_heap_size)
+
+def _dijkstra_csr(graph, start_node, heap="lazy", stats=None):
+    """
+    Dijkstra's algorithm over the dense integer ids of a CSRGraph.
+    Distances and predecessors are kept in flat lists indexed by vertex id and
+    only converted back to label-keyed dicts once the search is finished.
+    """
+    source = graph.index.get(start_node)
+    if source is None:
+        print(f"Error: Start node '{start_node}' not found in graph.")
+        return {}, {}
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph.labels)
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    dist[source] = 0
+    pushes, pops, max_heap_size = 1, 0, 1
+
+    if heap == "indexed":
+        priority_queue = IndexedPriorityQueue()
+        priority_queue.push(source, 0)
+        while not priority_queue.is_empty():
+            if priority_queue.size() > max_heap_size:
+                max_heap_size = priority_queue.size()
+            current_distance, u = priority_queue.pop()
+            pops += 1
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                distance_through_u = current_distance + weights[k]
+                if distance_through_u < dist[v]:
+                    dist[v] = distance_through_u
+                    pred[v] = u
+                    if v in priority_queue:
+                        priority_queue.decrease_key(v, distance_through_u)
+                    else:
+                        priority_queue.push(v, distance_through_u)
+                        pushes += 1
+    else:
+        priority_queue = [(0, source)]
+        while priority_queue:
+            if len(priority_queue) > max_heap_size:
+                max_heap_size = len(priority_queue)
+            current_distance, u = heapq.heappop(priority_queue)
+            pops += 1
+            if current_distance > dist[u]:
+                continue
+
+            # The out-edges of u are one contiguous slice of targets/weights
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                distance_through_u = current_distance + weights[k]
+                if distance_through_u < dist[v]:
+                    dist[v] = distance_through_u
+                    pred[v] = u
+                    heapq.heappush(priority_queue, (distance_through_u, v))
+                    pushes += 1
+
+    if stats is not None:
+        stats.update(pushes=pushes, pops=pops, max_heap_size=max_heap_size)
+
+    return _labelled(graph, dist, pred)
+
+def _labelled(graph, dist, pred):
+    """Converts id-indexed distance and predecessor lists back to label-keyed dicts."""
+    labels = graph.labels
+    distances = dict(zip(labels, dist))
+    predecessors = {labels[i]: (labels[p] if p >= 0 else None) for i, p in enumerate(pred)}
+    return distances, predecessors
+
+# --- Integer Weight Strategies ---
+
+def _dijkstra_buckets(graph, start_node, strategy, stats, delta, workers):
+    """
+    Runs one of the bucket-based strategies on the CSR form of the graph.
+    Dictionary graphs are compiled first; results are keyed by label as usual.
+    """
+    if not isinstance(graph, CSRGraph):
+        if start_node not in graph:
+            print(f"Error: Start node '{start_node}' not found in graph.")
+            return {}, {}
+        graph = CSRGraph.from_adjacency(graph)
+
+    source = graph.index.get(start_node)
+    if source is None:
+        print(f"Error: Start node '{start_node}' not found in graph.")
+        return {}, {}
+
+    weights = graph.weights
+    # Weight buffers are homogeneous: 'q' (int) or 'd' (float)
+    if strategy in ("radix", "dial") and len(weights) and not isinstance(weights[0], int):
+        raise ValueError(f"The {strategy!r} strategy requires integer edge weights")
+    if len(weights) and min(weights) < 0:
+        raise ValueError("Edge weights must be non-negative")
+
+    if strategy == "radix":
+        dist, pred = _dijkstra_radix(graph, source, stats)
+    elif strategy == "dial":
+        dist, pred = _dijkstra_dial(graph, source, stats)
+    else:
+        dist, pred = _delta_stepping(graph, source, delta, workers, stats)
+    return _labelled(graph, dist, pred)
+
+def _dijkstra_radix(graph, source, stats):
+    """Lazy-deletion Dijkstra with a RadixHeap in place of heapq."""
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph.labels)
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    dist[source] = 0
+
+    priority_queue = RadixHeap()
+    priority_queue.push(source, 0)
+    pushes, pops, max_heap_size = 1, 0, 1
+    while not priority_queue.is_empty():
+        if priority_queue.size() > max_heap_size:
+            max_heap_size = priority_queue.size()
+        current_distance, u = priority_queue.pop()
+        pops += 1
+        if current_distance > dist[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            distance_through_u = current_distance + weights[k]
+            if distance_through_u < dist[v]:
+                dist[v] = distance_through_u
+                pred[v] = u
+                priority_queue.push(v, distance_through_u)
+                pushes += 1
+
+    if stats is not None:
+        stats.update(pushes=pushes, pops=pops, max_heap_size=max_heap_size)
+    return dist, pred
+
+def _dijkstra_dial(graph, source, stats):
+    """
+    Dial's algorithm: bucket d % (C + 1) holds the vertices at tentative
+    distance d. Every pending distance lies in [current, current + C], so the
+    circular array never mixes two distances in one bucket. O(E + V * C).
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph.labels)
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    dist[source] = 0
+
+    size = max(weights, default=0) + 1
+    buckets = [[] for _ in range(size)]
+    buckets[0].append(source)
+    pending = 1
+    pushes, pops, max_heap_size = 1, 0, 1
+    current = 0
+    while pending:
+        bucket = buckets[current % size]
+        # Zero-weight edges append to the bucket being drained, which is fine
+        while bucket:
+            u = bucket.pop()
+            pending -= 1
+            pops += 1
+            if dist[u] != current:
+                # Outdated entry: u was already reached by a shorter path
+                continue
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                distance_through_u = current + weights[k]
+                if distance_through_u < dist[v]:
+                    dist[v] = distance_through_u
+                    pred[v] = u
+                    buckets[distance_through_u % size].append(v)
+                    pending += 1
+                    pushes += 1
+            if pending > max_heap_size:
+                max_heap_size = pending
+        current += 1
+
+    if stats is not None:
+        stats.update(pushes=pushes, pops=pops, max_heap_size=max_heap_size)
+    return dist, pred
+
+def _relax_requests(offsets, targets, weights, delta, frontier, light):
+    """
+    Scans the edges out of frontier [(u, dist_u), ...] and returns the relaxation
+    requests [(v, distance, u), ...], keeping only the best request per target.
+    light selects the edges of weight <= delta, otherwise the heavier ones.
+    """
+    best = {}
+    for u, distance_u in frontier:
+        for k in range(offsets[u], offsets[u + 1]):
+            weight = weights[k]
+            if (weight <= delta) != light:
+                continue
+            v = targets[k]
+            candidate = distance_u + weight
+            previous = best.get(v)
+            if previous is None or candidate < previous[0]:
+                best[v] = (candidate, u)
+    return [(v, candidate, u) for v, (candidate, u) in best.items()]
+
+# Per-process state, set once by _init_worker so the graph is not re-sent per task
+_worker_state = {}
+
+def _init_worker(offsets, targets, weights, delta):
+    _worker_state["graph"] = (offsets, targets, weights, delta)
+
+def _worker_requests(frontier, light):
+    offsets, targets, weights, delta = _worker_state["graph"]
+    return _relax_requests(offsets, targets, weights, delta, frontier, light)
+
+def _delta_stepping(graph, source, delta, workers, stats):
+    """
+    Delta-stepping (Meyer and Sanders). Bucket i holds the vertices with
+    tentative distance in [i * delta, (i + 1) * delta). The lowest bucket is
+    emptied repeatedly by relaxing the light edges out of all of its vertices
+    at once, since those can refill it; then the heavy edges of every vertex
+    removed from it are relaxed once. Each bulk scan is independent per vertex,
+    so large frontiers are split across a process pool.
+    """
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph.labels)
+    dist = [float('inf')] * n
+    pred = [-1] * n
+    dist[source] = 0
+
+    if delta is None:
+        average_degree = max(1, round(len(targets) / max(1, n)))
+        delta = max(1, max(weights, default=1) // average_degree)
+    if delta <= 0:
+        raise ValueError("delta must be positive")
+
+    executor = None
+    if workers != 1:
+        # Loaded graphs hold memoryviews, which cannot be pickled
+        buffers = [buffer if isinstance(buffer, array) else array(buffer.format, buffer)
+                   for buffer in (offsets, targets, weights)]
+        num_workers = workers or os.cpu_count() or 1
+        executor = ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                                       initargs=(*buffers, delta))
+
+    def requests(frontier, light):
+        if executor is None or len(frontier) < _PARALLEL_FRONTIER:
+            return _relax_requests(offsets, targets, weights, delta, frontier, light)
+        step = -(-len(frontier) // num_workers)
+        parts = [frontier[i:i + step] for i in range(0, len(frontier), step)]
+        merged = []
+        for part in executor.map(_worker_requests, parts, [light] * len(parts)):
+            merged.extend(part)
+        return merged
+
+    buckets = {0: {source}}
+    pushes, pops, phases = 1, 0, 0
+
+    def relax(v, candidate, u):
+        nonlocal pushes
+        if candidate < dist[v]:
+            if dist[v] != float('inf'):
+                old = buckets.get(int(dist[v] // delta))
+                if old is not None:
+                    old.discard(v)
+            dist[v] = candidate
+            pred[v] = u
+            buckets.setdefault(int(candidate // delta), set()).add(v)
+            pushes += 1
+
+    try:
+        while buckets:
+            i = min(buckets)
+            phases += 1
+            removed = set()
+            # Light edges can land back in bucket i, so repeat until it stays empty
+            while buckets.get(i):
+                frontier = buckets.pop(i)
+                removed |= frontier
+                pops += len(frontier)
+                for v, candidate, u in requests([(u, dist[u]) for u in frontier], True):
+                    relax(v, candidate, u)
+            buckets.pop(i, None)
+            # Heavy edges always leave bucket i, so one pass suffices
+            for v, candidate, u in requests([(u, dist[u]) for u in removed], False):
+                relax(v, candidate, u)
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
-# Graph representation: Nodes are strings, weights are positive integers.
-graph_example = {
-    'A': [('B', 2), ('C', 1)],
-    'B': [('D', 1), ('E', 5)],
-    'C': [('D', 3), ('E', 9)],
-    'D': [('F', 2)],
-    'E': [('F', 4)],
-    'F': [] # Terminal node
-}
+    if stats is not None:
+        stats.update(pushes=pushes, pops=pops, phases=phases)
+    return dist, pred
 
-start_node = 'A'
-shortest_distances, path_predecessors = dijkstra(graph_example, start_node)
+class DijkstraSearch:
+    """
+    A Dijkstra search that can be paused and resumed.
+
+    Nodes are settled one at a time by settle_next(), so a caller can stop as
+    soon as it has what it needs and continue later from the same state
+    (e.g. run_until('B') and then run_until('F') without starting over).
+    Nodes in blocked_nodes are never entered and edges (u, v) in
+    blocked_edges are never used, which is what spur searches in
+    k-shortest-path algorithms need.
+    """
+    def __init__(self, graph, source, blocked_nodes=(), blocked_edges=()):
+        """
+        Args:
+            graph (dict or CSRGraph): An adjacency list such as
+                      {'A': [('B', 2), ('C', 1)], ...}, or a compiled graphs.CSRGraph.
+            source: The node to start from.
+            blocked_nodes (set, optional): Nodes the search must avoid.
+            blocked_edges (set, optional): (u, v) pairs the search must not use.
+        """
+        if isinstance(graph, CSRGraph):
+            labels, index = graph.labels, graph.index
+            offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+
+            def neighbors(u):
+                i = index[u]
+                return [(labels[targets[k]], weights[k]) for k in range(offsets[i], offsets[i + 1])]
+            self._neighbors = neighbors
+        else:
+            self._neighbors = lambda u: graph.get(u, ())
+
+        self.source = source
+        self.blocked_nodes = blocked_nodes
+        self.blocked_edges = blocked_edges
+        # Tentative distances of every reached node, and their predecessors
+        self.distances = {source: 0}
+        self.predecessors = {source: None}
+        # Settled nodes with their final distances, in settling order
+        self.settled = {}
+        self._queue = [(0, 0, source)]
+        # Tie breaker, so nodes themselves are never compared
+        self._counter = 1
+        self.pushes, self.pops, self.max_heap_size = 1, 0, 1
+
+    def settle_next(self, max_distance=None):
+        """
+        Settles the next closest node and returns (node, distance), or None when
+        no node is left within max_distance. A node beyond max_distance stays
+        queued, so a later call with a larger bound continues from it.
+        """
+        queue, distances = self._queue, self.distances
+        while queue:
+            if len(queue) > self.max_heap_size:
+                self.max_heap_size = len(queue)
+            current_distance, _, u = queue[0]
+            if u in self.settled:
+                # Outdated entry
+                heapq.heappop(queue)
+                self.pops += 1
+                continue
+            if max_distance is not None and current_distance > max_distance:
+                return None
+            heapq.heappop(queue)
+            self.pops += 1
+            self.settled[u] = current_distance
+
+            blocked_nodes, blocked_edges = self.blocked_nodes, self.blocked_edges
+            for v, weight in self._neighbors(u):
+                if v in blocked_nodes or (blocked_edges and (u, v) in blocked_edges):
+                    continue
+                distance_through_u = current_distance + weight
+                if distance_through_u < distances.get(v, float('inf')):
+                    distances[v] = distance_through_u
+                    self.predecessors[v] = u
+                    heapq.heappush(queue, (distance_through_u, self._counter, v))
+                    self._counter += 1
+                    self.pushes += 1
+            return u, current_distance
+        return None
+
+    def run_until(self, target, max_distance=None):
+        """
+        Settles nodes until target is settled and returns its distance, or
+        infinity if target cannot be reached (within max_distance).
+        """
+        while target not in self.settled:
+            if self.settle_next(max_distance) is None:
+                return float('inf')
+        return self.settled[target]
+
+    def path_to(self, target):
+        """Returns the node list [source, ..., target] for a settled target."""
+        path = []
+        node = target
+        while node is not None:
+            path.append(node)
+            node = self.predecessors[node]
+        path.reverse()
+        return path
+
+def _dijkstra_bounded(graph, start_node, targets, max_distance, k_nearest, stats):
+    """dijkstra with early stopping: settles nodes until a stopping condition is met."""
+    if start_node not in graph:
+        print(f"Error: Start node '{start_node}' not found in graph.")
+        return {}, {}
 
-print(f"Graph Structure: {graph_example}")
-print(f"Starting Node: {start_node}")
+    search = DijkstraSearch(graph, start_node)
+    remaining = set(targets) if targets is not None else None
+    found = 0
+    while remaining is None or remaining:
+        if k_nearest is not None and found >= k_nearest:
+            break
+        step = search.settle_next(max_distance)
+        if step is None:
+            break
+        node = step[0]
+        if remaining is not None:
+            if node in remaining:
+                remaining.discard(node)
+                found += 1
+        elif node != start_node:
+            found += 1
 
-print("\n--- Shortest Distances from Start Node ---")
-for node, distance in shortest_distances.items():
-    # Only print reachable nodes (non-infinity)
-    if distance != float('inf'):
-        print(f"Shortest distance to {node}: {distance}")
+    if stats is not None:
+        stats.update(pushes=search.pushes, pops=search.pops, max_heap_size=search.max_heap_size)
 
-print("\n--- Shortest Path Predecessors ---")
-print(path_predecessors)
+    settled = search.settled
+    return dict(settled), {node: search.predecessors[node] for node in settled}
 
-# Example to reconstruct the path to 'F'
 def reconstruct_path(predecessors, end_node):
+    """
+    Rebuilds the shortest path to end_node by following the predecessor map
+    produced by dijkstra back to the start node.
+
+    Returns:
+        str: The path formatted as "A -> C -> ... -> end_node".
+    """
     path = []
     current = end_node
     while current is not None:
@@ -96,6 +601,100 @@ def reconstruct_path(predecessors, end_node):
         current = predecessors.get(current)
     return " -> ".join(path[::-1])
 
-end_node = 'F'
-path_to_f = reconstruct_path(path_predecessors, end_node)
-print(f"\nShortest Path to {end_node}: {path_to_f}")
+def _benchmark_heaps(num_nodes=2000, edges_per_node=200, seed=0):
+    """
+    Compares the lazy-deletion heap with the indexed decrease-key heap on a
+    random dense graph, printing the time, heap operations and peak heap size.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    graph = {
+        u: [(rng.randrange(num_nodes), rng.randint(1, 1000)) for _ in range(edges_per_node)]
+        for u in range(num_nodes)
+    }
+    print(f"{num_nodes} nodes, {num_nodes * edges_per_node} edges")
+    for heap in ("lazy", "indexed"):
+        stats = {}
+        started = time.perf_counter()
+        dijkstra(graph, 0, heap=heap, stats=stats)
+        elapsed = time.perf_counter() - started
+        print(f"  {heap:>7}: {elapsed:.3f}s, pushes={stats['pushes']}, "
+              f"pops={stats['pops']}, max_heap_size={stats['max_heap_size']}")
+
+def _benchmark_strategies(num_nodes=20000, edges_per_node=8, max_weight=60, seed=0):
+    """
+    Compares the search strategies on a random graph with small integer weights
+    (e.g. travel times in seconds), printing the time each one takes.
+    """
+    import random
+    import time
+
+    rng = random.Random(seed)
+    graph = CSRGraph.from_adjacency({
+        u: [(rng.randrange(num_nodes), rng.randint(1, max_weight)) for _ in range(edges_per_node)]
+        for u in range(num_nodes)
+    })
+    print(f"{num_nodes} nodes, {graph.num_edges()} edges, weights 1..{max_weight}")
+    for strategy in STRATEGIES:
+        started = time.perf_counter()
+        dijkstra(graph, 0, strategy=strategy)
+        elapsed = time.perf_counter() - started
+        print(f"  {strategy:>14}: {elapsed:.3f}s")
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+
+    # Graph representation: Nodes are strings, weights are positive integers.
+    graph_example = {
+        'A': [('B', 2), ('C', 1)],
+        'B': [('D', 1), ('E', 5)],
+        'C': [('D', 3), ('E', 9)],
+        'D': [('F', 2)],
+        'E': [('F', 4)],
+        'F': [] # Terminal node
+    }
+
+    start_node = 'A'
+    shortest_distances, path_predecessors = dijkstra(graph_example, start_node)
+
+    print(f"Graph Structure: {graph_example}")
+    print(f"Starting Node: {start_node}")
+
+    print("\n--- Shortest Distances from Start Node ---")
+    for node, distance in shortest_distances.items():
+        # Only print reachable nodes (non-infinity)
+        if distance != float('inf'):
+            print(f"Shortest distance to {node}: {distance}")
+
+    print("\n--- Shortest Path Predecessors ---")
+    print(path_predecessors)
+
+    # Example to reconstruct the path to 'F'
+    end_node = 'F'
+    path_to_f = reconstruct_path(path_predecessors, end_node)
+    print(f"\nShortest Path to {end_node}: {path_to_f}")
+
+    # The same search with the indexed decrease-key heap gives identical results
+    indexed_distances, _ = dijkstra(graph_example, start_node, heap="indexed")
+    print(f"Indexed heap agrees: {indexed_distances == shortest_distances}")
+
+    # Early stopping: the two nearest of a set of facilities
+    facilities = {'D', 'E', 'F'}
+    nearest, _ = dijkstra(graph_example, start_node, targets=facilities, k_nearest=2)
+    print(f"Two nearest facilities: {[node for node in nearest if node in facilities]}")
+    # Expected: ['D', 'F'] (distances 3 and 5)
+
+    print("\n--- Benchmark: Lazy Deletion vs. Decrease-Key ---")
+    _benchmark_heaps()
+
+    # Integer weights: the bucket-based strategies give the same distances
+    for strategy in ("radix", "dial", "delta"):
+        strategy_distances, _ = dijkstra(graph_example, start_node, strategy=strategy)
+        print(f"Strategy {strategy!r} agrees: {strategy_distances == shortest_distances}")
+
+    print("\n--- Benchmark: Search Strategies on Integer Weights ---")
+    _benchmark_strategies()
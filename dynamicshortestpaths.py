@@ -0,0 +1,212 @@
+import heapq
+
+from djikstrasalgo import dijkstra, reconstruct_path
+
+class DynamicShortestPaths:
+    """
+    Single-source shortest paths that stay up to date while edges change,
+    in the style of Ramalingam and Reps.
+
+    The initial distances and predecessors come from dijkstra. After that,
+    each edge change only repairs the vertices it can affect:
+    - a cheaper or new edge u -> v starts a Dijkstra from v that stops
+      wherever distances do not improve;
+    - a dearer or removed tree edge u -> v only re-evaluates the subtree of v
+      in the shortest path tree, reconnecting it through its cheapest
+      in-edges from unaffected vertices;
+    - a change to a non-tree edge that does not create a shorter path costs O(1).
+
+    Every update returns how many vertices it touched (also kept in last_touched),
+    so the work can be checked against the size of the change.
+    """
+    def __init__(self, graph, source):
+        """
+        Args:
+            graph (dict): The graph represented as an adjacency list.
+                          Example: {'A': [('B', 2), ('C', 1)], 'B': [('D', 1)], ...}
+                          Weights must be non-negative.
+            source: The node distances are measured from.
+        """
+        self.source = source
+        # Own copy of the graph in both directions: {u: {v: weight}}
+        self.out_edges = {}
+        self.in_edges = {}
+        for u, neighbors in graph.items():
+            self._ensure_node(u)
+            for v, weight in neighbors:
+                self._ensure_node(v)
+                if weight < self.out_edges[u].get(v, float('inf')):
+                    self.out_edges[u][v] = weight
+                    self.in_edges[v][u] = weight
+
+        adjacency = {u: list(edges.items()) for u, edges in self.out_edges.items()}
+        self.distances, self.predecessors = dijkstra(adjacency, source)
+
+        # Children in the shortest path tree, to find the subtree below an edge
+        self.children = {node: set() for node in self.out_edges}
+        for node, parent in self.predecessors.items():
+            if parent is not None:
+                self.children[parent].add(node)
+
+        self.last_touched = 0
+
+    def _ensure_node(self, node):
+        if node not in self.out_edges:
+            self.out_edges[node] = {}
+            self.in_edges[node] = {}
+            if hasattr(self, "distances"):
+                self.distances[node] = float('inf')
+                self.predecessors[node] = None
+                self.children[node] = set()
+
+    def _set_predecessor(self, node, parent):
+        old = self.predecessors[node]
+        if old is not None:
+            self.children[old].discard(node)
+        self.predecessors[node] = parent
+        if parent is not None:
+            self.children[parent].add(node)
+
+    # --- Updates ---
+
+    def update_edge(self, u, v, new_weight):
+        """
+        Sets the weight of edge u -> v (adding it if missing) and repairs the
+        shortest paths. Returns the number of vertices touched.
+        """
+        old_weight = self.out_edges.get(u, {}).get(v)
+        if old_weight is None:
+            return self.add_edge(u, v, new_weight)
+
+        self.out_edges[u][v] = new_weight
+        self.in_edges[v][u] = new_weight
+
+        if new_weight < old_weight:
+            touched = self._decrease(u, v, new_weight)
+        elif new_weight > old_weight and self.predecessors[v] == u:
+            touched = self._increase(v)
+        else:
+            touched = 0
+        self.last_touched = touched
+        return touched
+
+    def add_edge(self, u, v, weight):
+        """
+        Adds edge u -> v (new nodes are created as needed); an existing edge
+        is updated instead. Returns the number of vertices touched.
+        """
+        self._ensure_node(u)
+        self._ensure_node(v)
+        if v in self.out_edges[u]:
+            return self.update_edge(u, v, weight)
+
+        self.out_edges[u][v] = weight
+        self.in_edges[v][u] = weight
+        touched = self._decrease(u, v, weight)
+        self.last_touched = touched
+        return touched
+
+    def remove_edge(self, u, v):
+        """Removes edge u -> v. Returns the number of vertices touched."""
+        del self.out_edges[u][v]
+        del self.in_edges[v][u]
+        touched = self._increase(v) if self.predecessors[v] == u else 0
+        self.last_touched = touched
+        return touched
+
+    # --- Repair Steps ---
+
+    def _decrease(self, u, v, weight):
+        """A path through u -> v may have become shorter: propagate from v."""
+        distances = self.distances
+        if distances[u] + weight >= distances[v]:
+            return 0
+
+        distances[v] = distances[u] + weight
+        self._set_predecessor(v, u)
+        touched = set()
+        queue = [(distances[v], v)]
+        while queue:
+            current_distance, x = heapq.heappop(queue)
+            if current_distance > distances[x]:
+                continue
+            touched.add(x)
+            for y, w in self.out_edges[x].items():
+                distance_through_x = current_distance + w
+                if distance_through_x < distances[y]:
+                    distances[y] = distance_through_x
+                    self._set_predecessor(y, x)
+                    heapq.heappush(queue, (distance_through_x, y))
+        return len(touched)
+
+    def _increase(self, v):
+        """The tree edge into v got longer or vanished: rebuild v's subtree."""
+        distances = self.distances
+        inf = float('inf')
+
+        # 1. Every vertex whose tree path runs through v may now be too short
+        affected = set()
+        stack = [v]
+        while stack:
+            x = stack.pop()
+            affected.add(x)
+            stack.extend(self.children[x])
+
+        # 2. Reconnect each affected vertex through its best unaffected in-neighbor
+        queue = []
+        for x in affected:
+            best, best_parent = inf, None
+            for y, w in self.in_edges[x].items():
+                if y not in affected and distances[y] + w < best:
+                    best, best_parent = distances[y] + w, y
+            distances[x] = best
+            self._set_predecessor(x, best_parent)
+            if best < inf:
+                queue.append((best, x))
+        heapq.heapify(queue)
+
+        # 3. Dijkstra restricted to the affected vertices settles the rest
+        while queue:
+            current_distance, x = heapq.heappop(queue)
+            if current_distance > distances[x]:
+                continue
+            for y, w in self.out_edges[x].items():
+                if y in affected and current_distance + w < distances[y]:
+                    distances[y] = current_distance + w
+                    self._set_predecessor(y, x)
+                    heapq.heappush(queue, (distances[y], y))
+        return len(affected)
+
+    def path_to(self, target):
+        """Returns the current shortest path to target, formatted by reconstruct_path."""
+        return reconstruct_path(self.predecessors, target)
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+    # Road network; weights are travel times
+    roads = {
+        'A': [('B', 2), ('C', 1)],
+        'B': [('D', 1), ('E', 5)],
+        'C': [('D', 3), ('E', 9)],
+        'D': [('F', 2)],
+        'E': [('F', 4)],
+        'F': []
+    }
+    live = DynamicShortestPaths(roads, 'A')
+    print(f"Initial distances: {live.distances}")
+    print(f"Path to F: {live.path_to('F')}")
+
+    # Traffic jam on B -> D: the subtree below D is repaired
+    touched = live.update_edge('B', 'D', 10)
+    print(f"\nB -> D now 10 (touched {touched} vertices): {live.distances}")
+    print(f"Path to F: {live.path_to('F')}")
+
+    # A new express road A -> F
+    touched = live.add_edge('A', 'F', 3)
+    print(f"\nAdded A -> F = 3 (touched {touched} vertices): {live.distances}")
+
+    # Closing a road that no shortest path uses costs nothing
+    touched = live.remove_edge('C', 'E')
+    print(f"\nRemoved C -> E (touched {touched} vertices): {live.distances}")
@@ -0,0 +1,185 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up building from a NumPy array
+    np = None
+
+class FenwickTree:
+    """
+    A Fenwick tree (binary indexed tree) for prefix sums over a sequence that
+    changes: point updates and prefix or range sums in O(log n), in one flat
+    buffer of n + 1 slots.
+
+    Slot i (1-based) holds the sum of the i & -i elements ending at element
+    i - 1, so a prefix sum adds up one slot per set bit of its length and an
+    update touches one slot per level above it.
+    """
+    def __init__(self, values, typecode=None):
+        """
+        Builds the tree in O(n).
+
+        Args:
+            values (int, list or NumPy array): The initial sequence, or a length for
+                          an all-zero sequence.
+            typecode (str, optional): Keep the tree in array(typecode), e.g. 'q' or 'd',
+                          instead of a list.
+        """
+        if isinstance(values, int):
+            values = [0] * values
+        n = self.n = len(values)
+
+        if np is not None and isinstance(values, np.ndarray):
+            # Vectorized: slot i = prefix[i] - prefix[i - (i & -i)]
+            prefix = np.zeros(n + 1, dtype=values.dtype)
+            np.cumsum(values, out=prefix[1:])
+            i = np.arange(n + 1)
+            tree = (prefix - prefix[i - (i & -i)]).tolist()
+        else:
+            tree = [0]
+            tree.extend(values)
+            self._build(tree)
+        self.tree = tree if typecode is None else array(typecode, tree)
+
+    @staticmethod
+    def _build(tree):
+        """Turns raw values in tree[1..n] into Fenwick slots, in place, in O(n)."""
+        n = len(tree) - 1
+        for i in range(1, n + 1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] += tree[i]
+
+    @staticmethod
+    def _unbuild(tree):
+        """The inverse of _build: recovers the raw values in tree[1..n], in O(n)."""
+        n = len(tree) - 1
+        for i in range(n, 0, -1):
+            parent = i + (i & -i)
+            if parent <= n:
+                tree[parent] -= tree[i]
+
+    def __len__(self):
+        return self.n
+
+    # --- Updates ---
+
+    def add(self, i, delta):
+        """Adds delta to element i."""
+        if not 0 <= i < self.n:
+            raise IndexError("fenwick tree index out of range")
+        tree, n = self.tree, self.n
+        i += 1
+        while i <= n:
+            tree[i] += delta
+            i += i & -i
+
+    def __setitem__(self, i, value):
+        self.add(i, value - self[i])
+
+    def add_many(self, updates):
+        """
+        Applies a batch of (i, delta) point updates. A batch larger than
+        n / log2(n) is cheaper as one pass over the raw values: the tree is
+        unbuilt, updated and rebuilt in O(n + batch).
+        """
+        updates = list(updates)
+        # Check the whole batch first so a bad index leaves the tree untouched
+        for i, _ in updates:
+            if not 0 <= i < self.n:
+                raise IndexError("fenwick tree index out of range")
+        if len(updates) * max(self.n.bit_length(), 1) <= self.n:
+            for i, delta in updates:
+                self.add(i, delta)
+            return
+        tree = self.tree
+        self._unbuild(tree)
+        for i, delta in updates:
+            tree[i + 1] += delta
+        self._build(tree)
+
+    # --- Queries ---
+
+    def prefix_sum(self, i):
+        """Returns the sum of the first i elements (0 .. i - 1)."""
+        if not 0 <= i <= self.n:
+            raise IndexError("prefix length out of range")
+        tree = self.tree
+        total = 0
+        while i:
+            total += tree[i]
+            i &= i - 1
+        return total
+
+    def range_sum(self, lo, hi):
+        """Returns the sum of the elements lo .. hi - 1."""
+        if lo > hi:
+            raise IndexError("range start after range end")
+        return self.prefix_sum(hi) - self.prefix_sum(lo)
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.n:
+            raise IndexError("fenwick tree index out of range")
+        return self.range_sum(i, i + 1)
+
+    def prefix_sums(self, lengths):
+        """Answers a batch of prefix_sum queries and returns the results as a list."""
+        prefix_sum = self.prefix_sum
+        return [prefix_sum(i) for i in lengths]
+
+    def range_sums(self, ranges):
+        """
+        Answers a batch of (lo, hi) range sums and returns the results as a list.
+        A batch at least as long as the sequence is answered from one O(n)
+        table of all prefix sums instead of O(log n) work per query.
+        """
+        ranges = list(ranges)
+        if len(ranges) < self.n:
+            return [self.range_sum(lo, hi) for lo, hi in ranges]
+        raw = list(self.tree)
+        self._unbuild(raw)
+        # raw[i] becomes the sum of the first i elements
+        for i in range(1, self.n + 1):
+            raw[i] += raw[i - 1]
+        results = []
+        for lo, hi in ranges:
+            if not 0 <= lo <= hi <= self.n:
+                raise IndexError(f"range [{lo}, {hi}) out of bounds for length {self.n}")
+            results.append(raw[hi] - raw[lo])
+        return results
+
+    def tolist(self):
+        """Returns the current sequence as a list."""
+        raw = list(self.tree)
+        self._unbuild(raw)
+        return raw[1:]
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+    # Requests per minute
+    requests = [12, 7, 30, 5, 18, 9, 24, 11]
+    counts = FenwickTree(requests)
+
+    print("--- Fenwick Tree Prefix Sums ---")
+    print(f"Requests: {requests}")
+    print(f"First 4 minutes: {counts.prefix_sum(4)}")        # Expected: 54
+    print(f"Minutes 2..5: {counts.range_sum(2, 6)}")          # Expected: 62
+
+    counts.add(3, 100)      # a burst in minute 3
+    counts[7] = 0           # minute 7 is dropped
+    print(f"\nAfter a burst in minute 3 and dropping minute 7: {counts.tolist()}")
+    print(f"Running totals: {counts.prefix_sums(range(1, len(counts) + 1))}")
+
+    # Batches: many updates are folded in with one O(n) rebuild
+    counts.add_many([(i, 1) for i in range(len(counts))] * 2)
+    print(f"Two requests more per minute: {counts.tolist()}")
+    print(f"Batch of range sums: {counts.range_sums([(0, 2), (2, 4), (4, 8)])}")
+
+    # A batch with a bad index is rejected before any update is applied
+    try:
+        counts.add_many([(0, 1), (1, 1), (2, 1), (len(counts) + 1, 1)] * 4)
+    except IndexError as e:
+        print(f"\nError: {e}")
+    print(f"Unchanged after the rejected batch: {counts.tolist()}")
@@ -1,4 +1,10 @@
+import csv
+import mmap
+import struct
+import sys
+from array import array
 from collections import defaultdict
+from itertools import islice
 
 class Graph:
     """
@@ -16,6 +22,38 @@ class Graph:
         self.graph = defaultdict(dict)
         self.directed = directed
 
+    @classmethod
+    def from_edge_list(cls, path, *, directed, delimiter=None, numeric_labels=False,
+                       skip_header=False, chunk_size=100000):
+        """
+        Builds a graph from an edge list file, streaming it in chunks.
+
+        Each line holds "u v" or "u v weight" (whitespace separated by default,
+        or any delimiter such as ',' for CSV). Blank lines and lines starting
+        with '#' or '%' are skipped. Equal labels share one interned object.
+
+        Args:
+            path (str): The edge list file.
+            directed (bool): Whether the graph is directed. Required, so that
+                          Graph and CSRGraph never read the same file differently.
+            delimiter (str, optional): Field separator; None splits on whitespace.
+            numeric_labels (bool, optional): Convert vertex labels to int.
+            skip_header (bool, optional): Ignore the first line (e.g. a CSV header).
+            chunk_size (int, optional): Number of lines parsed per chunk.
+        """
+        graph = cls(directed=directed)
+        adjacency = graph.graph
+        interned = {}
+        for chunk in _read_edge_chunks(path, delimiter, numeric_labels, skip_header, chunk_size):
+            # Bulk insert: direct dictionary writes instead of one add_edge call per edge
+            for u, v, weight in chunk:
+                u = interned.setdefault(u, u)
+                v = interned.setdefault(v, v)
+                adjacency[u][v] = weight
+                if not directed:
+                    adjacency[v][u] = weight
+        return graph
+
     def add_edge(self, u, v, weight=1):
         """
         Adds an edge between vertex u and vertex v.
@@ -40,6 +78,13 @@ class Graph:
         """Returns a list of all vertices in the graph."""
         return list(self.graph.keys())
 
+    def to_csr(self):
+        """
+        Compiles the graph into a frozen CSRGraph.
+        Later changes to this Graph are not reflected in the returned object.
+        """
+        return CSRGraph.from_adjacency(self.graph, directed=self.directed)
+
     def __str__(self):
         """Provides a user-friendly string representation of the graph."""
         if not self.graph:
@@ -52,45 +97,441 @@ class Graph:
             representation += f"{u} -> {{{neighbors or ' '}}}\n"
         return representation
 
+class CSRGraph:
+    """
+    A frozen, compressed sparse row (CSR) representation of a graph.
+
+    Vertices are interned to dense integer ids 0..n-1. The out-edges of
+    vertex i are targets[offsets[i]:offsets[i + 1]], with the matching
+    weights at the same positions. offsets, targets and weights are
+    array.array buffers, so they can be shared with NumPy through
+    numpy.frombuffer without copying. A graph opened with CSRGraph.load()
+    holds memoryviews of the file mapping instead, which index the same way.
+    """
+    __slots__ = ("labels", "index", "offsets", "targets", "weights", "directed")
+
+    def __init__(self, labels, offsets, targets, weights, directed=True, index=None):
+        # labels[i] is the original vertex for id i; index is the reverse map.
+        self.labels = labels
+        self.index = index if index is not None else {label: i for i, label in enumerate(labels)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self.directed = directed
+
+    @classmethod
+    def from_adjacency(cls, adjacency, directed=True):
+        """
+        Builds a CSRGraph from an adjacency mapping.
+
+        Args:
+            adjacency (dict): Maps each vertex to its neighbors, given either as
+                              a dict {neighbor: weight} (as in Graph.graph), a list
+                              of (neighbor, weight) tuples, or a list of plain
+                              neighbors (weight 1).
+            directed (bool, optional): Recorded on the result. Edges are copied
+                                       as given; undirected inputs are expected
+                                       to already hold both directions.
+        """
+        labels = list(adjacency)
+        index = {label: i for i, label in enumerate(labels)}
+        offsets = array('q', [0])
+        targets = array('q')
+        # Integer weights stay integers; the buffer is widened to doubles
+        # the first time a non-integer weight is seen.
+        weights = array('q')
+
+        # Neighbors that are never used as keys are interned on first sight,
+        # which appends to labels, so iterate by position.
+        i = 0
+        while i < len(labels):
+            neighbors = adjacency.get(labels[i], ())
+            if isinstance(neighbors, dict):
+                neighbors = neighbors.items()
+            for item in neighbors:
+                if isinstance(item, tuple):
+                    v, weight = item
+                else:
+                    v, weight = item, 1
+                j = index.get(v)
+                if j is None:
+                    j = index[v] = len(labels)
+                    labels.append(v)
+                targets.append(j)
+                try:
+                    weights.append(weight)
+                except TypeError:
+                    weights = array('d', weights)
+                    weights.append(weight)
+            offsets.append(len(targets))
+            i += 1
+
+        return cls(labels, offsets, targets, weights, directed, index)
+
+    @classmethod
+    def from_edge_list(cls, path, *, directed, delimiter=None, numeric_labels=False,
+                       skip_header=False, chunk_size=100000):
+        """
+        Builds a CSRGraph straight from an edge list file, never creating a Graph.
+
+        Takes the same file format and arguments as Graph.from_edge_list. Edges
+        are streamed in chunks into flat source/target/weight arrays, with labels
+        interned to ids on the way, and then placed into CSR order by a counting
+        sort. Parallel edges are kept. For an undirected graph both directions
+        are stored.
+        """
+        index = {}
+        labels = []
+        sources = array('q')
+        targets = array('q')
+        weights = array('q')
+        for chunk in _read_edge_chunks(path, delimiter, numeric_labels, skip_header, chunk_size):
+            for u, v, weight in chunk:
+                i = index.get(u)
+                if i is None:
+                    i = index[u] = len(labels)
+                    labels.append(u)
+                j = index.get(v)
+                if j is None:
+                    j = index[v] = len(labels)
+                    labels.append(v)
+                sources.append(i)
+                targets.append(j)
+                try:
+                    weights.append(weight)
+                except TypeError:
+                    weights = array('d', weights)
+                    weights.append(weight)
+
+        if not directed:
+            sources, targets = sources + targets, targets + sources
+            weights = weights + weights
+
+        # Counting sort by source id
+        n = len(labels)
+        offsets = array('q', bytes(8 * (n + 1)))
+        for i in sources:
+            offsets[i + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        position = offsets[:n]
+        csr_targets = array('q', bytes(8 * len(targets)))
+        csr_weights = array(weights.typecode, bytes(weights.itemsize * len(weights)))
+        for k, i in enumerate(sources):
+            p = position[i]
+            csr_targets[p] = targets[k]
+            csr_weights[p] = weights[k]
+            position[i] = p + 1
+
+        return cls(labels, offsets, csr_targets, csr_weights, directed, index)
+
+    # --- Binary File Format ---
+    #
+    # A 64-byte header, then 8-byte aligned sections, all little-endian:
+    #   vertex table  - nothing if the labels are exactly 0..n-1, n int64 labels,
+    #                   or (n + 1) int64 offsets into a UTF-8 blob of string labels
+    #   offsets       - (n + 1) int64
+    #   targets       - m int64
+    #   weights       - m int64 or m float64
+
+    def save(self, path):
+        """Writes the graph in the binary CSR format read by CSRGraph.load()."""
+        if sys.byteorder != "little":
+            raise ValueError("CSR graph files can only be written on little-endian machines")
+
+        n = len(self.labels)
+        flags = 0
+        if self.directed:
+            flags |= _FLAG_DIRECTED
+        if _typecode(self.weights) == 'd':
+            flags |= _FLAG_FLOAT_WEIGHTS
+
+        vertex_table = []
+        if all(type(label) is int and label == i for i, label in enumerate(self.labels)):
+            flags |= _FLAG_IDENTITY_LABELS
+        elif all(type(label) is int for label in self.labels):
+            flags |= _FLAG_INT_LABELS
+            vertex_table.append(array('q', self.labels).tobytes())
+        elif all(type(label) is str for label in self.labels):
+            flags |= _FLAG_STR_LABELS
+            encoded = [label.encode("utf-8") for label in self.labels]
+            label_offsets = array('q', [0])
+            for label in encoded:
+                label_offsets.append(label_offsets[-1] + len(label))
+            blob = b"".join(encoded)
+            vertex_table += [label_offsets.tobytes(), blob, bytes(-len(blob) % 8)]
+        else:
+            raise TypeError("only int or str vertex labels can be saved")
+
+        with open(path, "wb") as f:
+            header = _HEADER.pack(_MAGIC, _VERSION, flags, n, len(self.targets))
+            f.write(header.ljust(_HEADER_SIZE, b"\0"))
+            for part in vertex_table:
+                f.write(part)
+            for buffer in (self.offsets, self.targets, self.weights):
+                f.write(memoryview(buffer).cast('B'))
+
+    @classmethod
+    def load(cls, path):
+        """
+        Opens a file written by save() through mmap. offsets, targets and weights
+        become zero-copy memoryviews of the mapping, so nothing is parsed or read
+        up front; pages are loaded by the operating system on first access.
+        Integer labels 0..n-1 are not stored at all. Other labels are read from
+        the vertex table.
+        """
+        if sys.byteorder != "little":
+            raise ValueError("CSR graph files can only be read on little-endian machines")
+
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapping)
+
+        magic, version, flags, n, m = _HEADER.unpack_from(view)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError(f"{path} is not a CSR graph file")
+
+        position = _HEADER_SIZE
+
+        def section(count, fmt):
+            nonlocal position
+            part = view[position:position + 8 * count].cast(fmt)
+            position += 8 * count
+            return part
+
+        if flags & _FLAG_IDENTITY_LABELS:
+            labels = range(n)
+            index = _IdentityIndex(n)
+        elif flags & _FLAG_INT_LABELS:
+            labels = section(n, 'q').tolist()
+            index = None
+        else:
+            label_offsets = section(n + 1, 'q')
+            blob = bytes(view[position:position + label_offsets[n]])
+            position += label_offsets[n] + (-label_offsets[n] % 8)
+            labels = [blob[label_offsets[i]:label_offsets[i + 1]].decode("utf-8") for i in range(n)]
+            index = None
+
+        offsets = section(n + 1, 'q')
+        targets = section(m, 'q')
+        weights = section(m, 'd' if flags & _FLAG_FLOAT_WEIGHTS else 'q')
+        return cls(labels, offsets, targets, weights, bool(flags & _FLAG_DIRECTED), index)
+
+    def __len__(self):
+        """Returns the number of vertices."""
+        return len(self.labels)
+
+    def __contains__(self, vertex):
+        return vertex in self.index
+
+    def num_edges(self):
+        """Returns the number of stored (directed) edges."""
+        return len(self.targets)
+
+    def neighbors(self, i):
+        """Yields (target_id, weight) pairs for the vertex with id i."""
+        targets = self.targets
+        weights = self.weights
+        for k in range(self.offsets[i], self.offsets[i + 1]):
+            yield targets[k], weights[k]
+
+    def transpose(self):
+        """
+        Returns the CSRGraph with every edge reversed, built in O(V + E) by a
+        counting pass over targets. Vertex ids are shared with this graph.
+        """
+        n = len(self.labels)
+        offsets = [0] * (n + 1)
+        for v in self.targets:
+            offsets[v + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        m = len(self.targets)
+        targets = array('q', bytes(8 * m))
+        weights = array(_typecode(self.weights), bytes(self.weights.itemsize * m))
+        # Next free slot in each reversed row
+        position = offsets[:n]
+        for u in range(n):
+            for k in range(self.offsets[u], self.offsets[u + 1]):
+                v = self.targets[k]
+                targets[position[v]] = u
+                weights[position[v]] = self.weights[k]
+                position[v] += 1
+
+        return CSRGraph(self.labels, array('q', offsets), targets, weights, self.directed, self.index)
+
+    def get_neighbors(self, vertex):
+        """Returns the neighbors of a given vertex as {neighbor: weight}, like Graph."""
+        i = self.index.get(vertex)
+        if i is None:
+            return {}
+        labels = self.labels
+        return {labels[j]: w for j, w in self.neighbors(i)}
+
+    def get_vertices(self):
+        """Returns a list of all vertices in the graph."""
+        return list(self.labels)
+
+    def nbytes(self):
+        """Returns the size in bytes of the offsets, targets and weights buffers."""
+        return sum(buf.itemsize * len(buf) for buf in (self.offsets, self.targets, self.weights))
+
+    def __str__(self):
+        if not self.labels:
+            return "Graph is empty."
+        return f"CSRGraph({len(self.labels)} vertices, {len(self.targets)} edges)"
+
+_MAGIC = b"CSRG"
+_VERSION = 1
+_HEADER = struct.Struct("<4sIIQQ")
+_HEADER_SIZE = 64
+_FLAG_DIRECTED = 1
+_FLAG_FLOAT_WEIGHTS = 2
+_FLAG_IDENTITY_LABELS = 4
+_FLAG_INT_LABELS = 8
+_FLAG_STR_LABELS = 16
+
+def _typecode(buffer):
+    """Returns the element type of an array.array or a memoryview ('q' or 'd')."""
+    return getattr(buffer, "typecode", None) or buffer.format
+
+class _IdentityIndex:
+    """
+    The label -> id map of a graph whose labels are exactly 0..n-1.
+    Answers lookups arithmetically instead of storing a dict of n entries.
+    """
+    __slots__ = ("n",)
+
+    def __init__(self, n):
+        self.n = n
+
+    def get(self, label, default=None):
+        if type(label) is int and 0 <= label < self.n:
+            return label
+        return default
+
+    def __getitem__(self, label):
+        i = self.get(label)
+        if i is None:
+            raise KeyError(label)
+        return i
+
+    def __contains__(self, label):
+        return self.get(label) is not None
+
+    def __len__(self):
+        return self.n
+
+    def __iter__(self):
+        return iter(range(self.n))
+
+def _parse_weight(text):
+    try:
+        return int(text)
+    except ValueError:
+        return float(text)
+
+def _read_edge_chunks(path, delimiter, numeric_labels, skip_header, chunk_size):
+    """
+    Yields lists of (u, v, weight) tuples parsed from an edge list file,
+    chunk_size lines at a time, so the file is never held in memory.
+    Raises ValueError for a line with fewer than two fields.
+    """
+    with open(path, newline="") as f:
+        lines = iter(f)
+        if skip_header:
+            next(lines, None)
+        if delimiter is not None:
+            rows = csv.reader(lines, delimiter=delimiter)
+        else:
+            rows = (line.split() for line in lines)
+
+        line_number = 1 if skip_header else 0
+        while True:
+            # islice reads at most chunk_size lines; an empty slice means end of file
+            block = list(islice(rows, chunk_size))
+            if not block:
+                return
+            chunk = []
+            for fields in block:
+                line_number += 1
+                if not fields or fields[0].startswith(("#", "%")):
+                    continue
+                if len(fields) < 2:
+                    raise ValueError(f"{path}, line {line_number}: expected 'u v [weight]', got {fields!r}")
+                u, v = fields[0].strip(), fields[1].strip()
+                if numeric_labels:
+                    u, v = int(u), int(v)
+                weight = _parse_weight(fields[2]) if len(fields) > 2 and fields[2].strip() else 1
+                chunk.append((u, v, weight))
+            if chunk:
+                yield chunk
+
 '''### How to Use It
 Here’s a simple example demonstrating how to create and interact with the `Graph` class.
 
 #### Example 1: Undirected & Unweighted Graph
 Let's create a simple social network. '''
 
-# 1. Create an undirected graph
-social_network = Graph(directed=False)
-
-# 2. Add edges (friendships)
-social_network.add_edge("Alice", "Bob")
-social_network.add_edge("Alice", "Carol")
-social_network.add_edge("Bob", "David")
-social_network.add_edge("Carol", "David")
-social_network.add_edge("Eve", "Frank") # A separate group
-
-# 3. Print the graph to see its structure
-print("--- Social Network (Undirected) ---")
-print(social_network)
-
-# 4. Get specific information
-print(f"Alice's friends: {social_network.get_neighbors('Alice').keys()}")
-print(f"All people in the network: {social_network.get_vertices()}")
-
-# 1. Create a directed graph
-flight_routes = Graph(directed=True)
-
-# 2. Add routes with costs (weights)
-flight_routes.add_edge("New York", "London", weight=450)
-flight_routes.add_edge("London", "Paris", weight=50)
-flight_routes.add_edge("Paris", "Tokyo", weight=800)
-flight_routes.add_edge("New York", "Tokyo", weight=1100) # Direct flight
-flight_routes.add_edge("London", "New York", weight=430) # Return flight
-
-# 3. Print the graph
-print("\n--- Flight Routes (Directed & Weighted) ---")
-print(flight_routes)
-
-# 4. Get specific information
-ny_destinations = flight_routes.get_neighbors("New York")
-print(f"Flights from New York: {ny_destinations}")
-print(f"Cost from New York to London: ${ny_destinations.get('London')}")
+if __name__ == "__main__":
+
+    # 1. Create an undirected graph
+    social_network = Graph(directed=False)
+
+    # 2. Add edges (friendships)
+    social_network.add_edge("Alice", "Bob")
+    social_network.add_edge("Alice", "Carol")
+    social_network.add_edge("Bob", "David")
+    social_network.add_edge("Carol", "David")
+    social_network.add_edge("Eve", "Frank") # A separate group
+
+    # 3. Print the graph to see its structure
+    print("--- Social Network (Undirected) ---")
+    print(social_network)
+
+    # 4. Get specific information
+    print(f"Alice's friends: {social_network.get_neighbors('Alice').keys()}")
+    print(f"All people in the network: {social_network.get_vertices()}")
+
+    # 1. Create a directed graph
+    flight_routes = Graph(directed=True)
+
+    # 2. Add routes with costs (weights)
+    flight_routes.add_edge("New York", "London", weight=450)
+    flight_routes.add_edge("London", "Paris", weight=50)
+    flight_routes.add_edge("Paris", "Tokyo", weight=800)
+    flight_routes.add_edge("New York", "Tokyo", weight=1100) # Direct flight
+    flight_routes.add_edge("London", "New York", weight=430) # Return flight
+
+    # 3. Print the graph
+    print("\n--- Flight Routes (Directed & Weighted) ---")
+    print(flight_routes)
+
+    # 4. Get specific information
+    ny_destinations = flight_routes.get_neighbors("New York")
+    print(f"Flights from New York: {ny_destinations}")
+    print(f"Cost from New York to London: ${ny_destinations.get('London')}")
+
+    # 5. Compile to a frozen CSR graph for fast, compact neighbor scans
+    compiled_routes = flight_routes.to_csr()
+    print("\n--- Flight Routes (CSR) ---")
+    print(compiled_routes)
+    print(f"Flights from New York: {compiled_routes.get_neighbors('New York')}")
+    print(f"CSR buffer size: {compiled_routes.nbytes()} bytes")
+
+    # 6. Stream an edge list file, then save it in the binary CSR format and reopen it
+    import os
+    import tempfile
+    directory = tempfile.mkdtemp()
+    edge_file = os.path.join(directory, "routes.csv")
+    with open(edge_file, "w") as f:
+        f.write("source,target,cost\n")
+        f.write("New York,London,450\nLondon,Paris,50\nParis,Tokyo,800\n")
+    streamed_routes = CSRGraph.from_edge_list(edge_file, directed=True, delimiter=",",
+                                              skip_header=True)
+    binary_file = os.path.join(directory, "routes.csr")
+    streamed_routes.save(binary_file)
+    reopened_routes = CSRGraph.load(binary_file)
+    print(f"\nReopened from disk: {reopened_routes}")
+    print(f"Flights from London: {reopened_routes.get_neighbors('London')}")
@@ -0,0 +1,191 @@
+import mmap
+import os
+import tempfile
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from bellmanford import bellman_ford
+from djikstrasalgo import dijkstra
+from graphs import CSRGraph
+
+class DistanceMatrix:
+    """
+    A V x V matrix of shortest distances stored row by row in a memory-mapped file.
+
+    Each row holds V doubles (unreachable pairs are infinity), in the order of
+    'vertices'. Rows are paged in by the operating system on access, so the
+    matrix never has to fit in RAM.
+    """
+    def __init__(self, path, vertices, writable=False):
+        self.path = path
+        self.vertices = list(vertices)
+        self.index = {vertex: i for i, vertex in enumerate(self.vertices)}
+        self._row_bytes = len(self.vertices) * 8
+        size = self._row_bytes * len(self.vertices)
+
+        self._file = open(path, "r+b" if writable else "rb")
+        if writable:
+            self._file.truncate(size)
+        # mmap cannot map an empty file
+        self._mmap = mmap.mmap(self._file.fileno(), size,
+                               access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ) if size else None
+
+    def write_row(self, i, row):
+        """Stores row i from an array('d') of V distances."""
+        start = i * self._row_bytes
+        self._mmap[start:start + self._row_bytes] = row.tobytes()
+
+    def row(self, vertex):
+        """Returns the distances from vertex to every vertex, as an array('d')."""
+        start = self.index[vertex] * self._row_bytes
+        return array('d', self._mmap[start:start + self._row_bytes])
+
+    def distance(self, u, v):
+        """Returns the shortest distance from u to v."""
+        offset = self.index[u] * self._row_bytes + self.index[v] * 8
+        return array('d', self._mmap[offset:offset + 8])[0]
+
+    def flush(self):
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Per-process state, set once by _init_worker so the graph is not re-sent per task
+_worker_state = {}
+
+def _init_worker(graph, potentials, vertices):
+    _worker_state["graph"] = graph
+    _worker_state["potentials"] = potentials
+    _worker_state["vertices"] = vertices
+
+def _distance_rows(sources):
+    """
+    Runs Dijkstra on the reweighted graph from every source index in 'sources'
+    and undoes the reweighting: d(s, v) = d'(s, v) - h(s) + h(v).
+    Returns [(source index, row bytes), ...].
+    """
+    graph = _worker_state["graph"]
+    h = _worker_state["potentials"]
+    vertices = _worker_state["vertices"]
+
+    rows = []
+    for i in sources:
+        s = vertices[i]
+        distances, _ = dijkstra(graph, s)
+        h_s = h[i]
+        row = array('d', [distances[v] - h_s + h[j] for j, v in enumerate(vertices)])
+        rows.append((i, row.tobytes()))
+    return rows
+
+def johnson(vertices, edges, output_path=None, workers=None, chunk_size=16, engine="classic"):
+    """
+    Computes all-pairs shortest paths with Johnson's algorithm, which handles
+    negative edge weights (but not negative cycles) on sparse graphs.
+
+    1. One Bellman-Ford run from a virtual source joined to every vertex by a
+       0-weight edge gives a potential h(v) for every vertex.
+    2. Every edge is reweighted to w(u, v) + h(u) - h(v), which is never negative.
+    3. V independent Dijkstra runs on the reweighted graph are spread over a
+       ProcessPoolExecutor, and each distance row is written to a memory-mapped
+       file as soon as it arrives.
+
+    Args:
+        vertices (list): A list of all vertex IDs (e.g., [0, 1, 2, 3]).
+        edges (list): A list of all edges as tuples (u, v, weight).
+        output_path (str, optional): File for the distance matrix. Defaults to a
+                      new temporary file, which the caller should delete when done.
+        workers (int, optional): Number of worker processes. None uses one per CPU;
+                      1 runs every Dijkstra in this process.
+        chunk_size (int, optional): Number of sources handed to a worker per task.
+        engine (str, optional): The bellman_ford engine used for step 1.
+
+    Returns:
+        DistanceMatrix: The opened (read-only) distance matrix, if there is no
+                        negative cycle.
+        tuple: (False, cycle) as returned by bellman_ford if a negative cycle exists.
+        bool: False if the graph is empty.
+    """
+    if not vertices:
+        return False
+    vertices = list(vertices)
+
+    # 1. Bellman-Ford from a virtual source (a fresh object can never clash with a vertex)
+    virtual_source = object()
+    augmented_edges = list(edges) + [(virtual_source, v, 0) for v in vertices]
+    result = bellman_ford(vertices + [virtual_source], augmented_edges, virtual_source, engine=engine)
+    if result[0] is False:
+        return result
+    potentials, _ = result
+
+    # 2. Reweight, and compile to CSR so every worker receives one compact copy
+    adjacency = {v: [] for v in vertices}
+    for u, v, weight in edges:
+        adjacency[u].append((v, weight + potentials[u] - potentials[v]))
+    graph = CSRGraph.from_adjacency(adjacency, directed=True)
+    h = [potentials[v] for v in vertices]
+
+    # 3. Stream rows into the memory-mapped matrix
+    if output_path is None:
+        fd, output_path = tempfile.mkstemp(suffix=".dist")
+        os.close(fd)
+    else:
+        open(output_path, "wb").close()
+
+    chunks = [range(i, min(i + chunk_size, len(vertices))) for i in range(0, len(vertices), chunk_size)]
+    with DistanceMatrix(output_path, vertices, writable=True) as matrix:
+        if workers == 1:
+            _init_worker(graph, h, vertices)
+            results = map(_distance_rows, chunks)
+            for rows in results:
+                for i, row_bytes in rows:
+                    matrix.write_row(i, array('d', row_bytes))
+            _worker_state.clear()
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(graph, h, vertices)) as executor:
+                for rows in executor.map(_distance_rows, chunks):
+                    for i, row_bytes in rows:
+                        matrix.write_row(i, array('d', row_bytes))
+        matrix.flush()
+
+    return DistanceMatrix(output_path, vertices)
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+    # Sparse directed graph with negative edges but no negative cycle
+    vertices_example = ['A', 'B', 'C', 'D', 'E']
+    edges_example = [
+        ('A', 'B', 3), ('A', 'C', 8), ('A', 'E', -4),
+        ('B', 'D', 1), ('B', 'E', 7),
+        ('C', 'B', 4),
+        ('D', 'A', 2), ('D', 'C', -5),
+        ('E', 'D', 6)
+    ]
+
+    print(f"Vertices: {vertices_example}")
+    print(f"Edges: {edges_example}")
+
+    matrix = johnson(vertices_example, edges_example, workers=2, chunk_size=2)
+
+    print("\n--- All-Pairs Shortest Distances (Johnson) ---")
+    print("     " + "".join(f"{v:>6}" for v in vertices_example))
+    for u in vertices_example:
+        print(f"{u:>5}" + "".join(f"{d:>6g}" for d in matrix.row(u)))
+    print(f"\nDistance A -> C: {matrix.distance('A', 'C')}")
+    # Expected: A -> C = -3 via A -> E -> D -> C
+
+    matrix.close()
+    os.remove(matrix.path)
@@ -1,46 +1,125 @@
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for mode="boruvka"
+    np = None
+
 class DisjointSet:
     """
     Implements the Disjoint Set Union (DSU) data structure
-    with path compression and union by rank for efficiency.
+    with path halving and union by size for efficiency.
+
+    Elements are the integers 0..n-1. Parents and set sizes live in flat
+    array('q') buffers (8 bytes per entry, no boxed ints), and find is
+    iterative, so even a long chain never hits the recursion limit.
+    The universe can grow at any time with add() or grow().
     """
     def __init__(self, vertices):
         # Initialize each vertex as its own parent (representative)
-        self.parent = list(range(vertices))
-        # Initialize the rank (or height) of each tree to 0
-        self.rank = [0] * vertices
+        self.parent = array('q', range(vertices))
+        # Size of the set rooted at each representative (meaningless for non-roots)
+        self.size = array('q', [1]) * vertices
+        # Number of disjoint sets
+        self.components = vertices
+
+    def __len__(self):
+        """Returns the number of elements."""
+        return len(self.parent)
+
+    def add(self):
+        """Adds a new singleton element and returns its id."""
+        i = len(self.parent)
+        self.parent.append(i)
+        self.size.append(1)
+        self.components += 1
+        return i
+
+    def grow(self, vertices):
+        """Extends the universe with singletons so it holds at least 'vertices' elements."""
+        n = len(self.parent)
+        if vertices > n:
+            self.parent.extend(range(n, vertices))
+            self.size.extend(array('q', [1]) * (vertices - n))
+            self.components += vertices - n
 
     def find(self, i):
         """
         Finds the representative (root) of the set containing element i.
-        Uses Path Compression.
+        Uses Path Halving: every node on the way up is pointed at its grandparent.
         """
-        if self.parent[i] == i:
-            return i
-        # Path compression: make the current node's parent the root
-        self.parent[i] = self.find(self.parent[i])
-        return self.parent[i]
+        parent = self.parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
 
     def union(self, u, v):
         """
         Unites the sets containing elements u and v.
-        Uses Union by Rank.
+        Uses Union by Size.
         """
         root_u = self.find(u)
         root_v = self.find(v)
 
         if root_u != root_v:
-            # Attach smaller rank tree under root of high rank tree
-            if self.rank[root_u] < self.rank[root_v]:
-                self.parent[root_u] = root_v
-            elif self.rank[root_u] > self.rank[root_v]:
-                self.parent[root_v] = root_u
-            # If ranks are the same, make one the root and increment its rank
-            else:
-                self.parent[root_v] = root_u
-                self.rank[root_u] += 1
+            # Attach the smaller tree under the root of the larger one
+            if self.size[root_u] < self.size[root_v]:
+                root_u, root_v = root_v, root_u
+            self.parent[root_v] = root_u
+            self.size[root_u] += self.size[root_v]
+            self.components -= 1
             return True  # Union successful
         return False # Already in the same set (cycle detected)
 
+    def union_many(self, pairs):
+        """
+        Unites the sets of every (u, v) pair, e.g. a stream of edges.
+        Elements beyond the current universe are added on the fly.
+
+        Returns:
+            int: The number of pairs that merged two different sets.
+        """
+        parent, size = self.parent, self.size
+        merged = 0
+        for u, v in pairs:
+            if u >= len(parent) or v >= len(parent):
+                self.grow(max(u, v) + 1)
+
+            # Inlined find with path halving for both ends
+            while parent[u] != u:
+                parent[u] = parent[parent[u]]
+                u = parent[u]
+            while parent[v] != v:
+                parent[v] = parent[parent[v]]
+                v = parent[v]
+
+            if u != v:
+                if size[u] < size[v]:
+                    u, v = v, u
+                parent[v] = u
+                size[u] += size[v]
+                merged += 1
+
+        self.components -= merged
+        return merged
+
+    def connected(self, u, v):
+        """Returns True if u and v are in the same set."""
+        return self.find(u) == self.find(v)
+
+    def component_size(self, i):
+        """Returns the number of elements in the set containing i."""
+        return self.size[self.find(i)]
+
+    def component_sizes(self):
+        """Returns {representative: set size} for every set."""
+        parent, size = self.parent, self.size
+        return {i: size[i] for i in range(len(parent)) if parent[i] == i}
+
 class Graph:
     def __init__(self, vertices):
         self.V = vertices  # Number of vertices
@@ -50,19 +129,37 @@ class Graph:
         """Adds an edge to the graph."""
         self.graph.append([u, v, w])
 
-    def kruskal_mst(self):
+    def kruskal_mst(self, mode="sort", workers=None):
         """
         Computes the Minimum Spanning Tree (MST) using Kruskal's algorithm.
 
+        Args:
+            mode (str, optional): "sort" (default) sorts every edge up front.
+                      "filter" uses Filter-Kruskal: edges are partitioned around a
+                      sampled pivot weight, the light part is processed first and
+                      edges of the heavy part that already lie inside one component
+                      are dropped before they are ever sorted.
+                      "boruvka" uses Boruvka's algorithm, with each round's
+                      cheapest-edge-per-component scan vectorized in NumPy.
+            workers (int, optional): For "boruvka", the number of processes the
+                      edge scan is split across. None or 1 scans in this process.
+
         Returns:
             tuple: A tuple containing:
                    - mst_cost (int): The total weight of the MST.
                    - result (list): A list of edges in the MST: [[u, v, weight], ...]
         """
+        if mode == "filter":
+            return self._filter_kruskal_mst()
+        if mode == "boruvka":
+            return self._boruvka_mst(workers)
+        if mode != "sort":
+            raise ValueError(f"Unknown MST mode: {mode!r}")
+
         result = []
         
         # 1. Sort all edges in non-decreasing order of their weight (the greedy step)
-        self.graph.sort(key=lambda item: item[2])
+        self.graph.sort(key=itemgetter(2))
         
         ds = DisjointSet(self.V)
 
@@ -91,27 +188,160 @@ class Graph:
         
         return mst_cost, result
 
+    def _filter_kruskal_mst(self):
+        """
+        Filter-Kruskal (Osipov, Sanders and Singler).
+        Pending edge groups are kept on an explicit stack, lightest group on top.
+        """
+        ds = DisjointSet(self.V)
+        result = []
+        target = self.V - 1
+        # Sorting is done in C, so groups are only split while they are clearly
+        # larger than the spanning tree they can contribute to
+        threshold = max(_FILTER_KRUSKAL_THRESHOLD, 2 * self.V)
+
+        # Each entry is (edges, needs_filter); the input itself needs no filtering
+        stack = [(self.graph, False)]
+        while stack and len(result) < target:
+            edges, needs_filter = stack.pop()
+            if needs_filter:
+                find = ds.find
+                edges = [e for e in edges if find(e[0]) != find(e[1])]
+
+            if len(edges) > threshold:
+                # Partition around a sampled pivot weight, chosen so that the
+                # lighter group is expected to hold about 'threshold' edges
+                sample = sorted(e[2] for e in random.sample(edges, _PIVOT_SAMPLE_SIZE))
+                pivot = sample[_PIVOT_SAMPLE_SIZE * threshold // len(edges)]
+                heavier = [e for e in edges if e[2] > pivot]
+                if heavier:
+                    # Pushed first so the lighter group is processed before it
+                    stack.append((heavier, True))
+                    stack.append(([e for e in edges if e[2] <= pivot], False))
+                    continue
+
+            # Small enough (or every weight <= pivot): plain Kruskal on this group
+            for u, v, weight in sorted(edges, key=itemgetter(2)):
+                if ds.union(u, v):
+                    result.append([u, v, weight])
+                    if len(result) == target:
+                        break
+
+        return sum(edge[2] for edge in result), result
+
+    def _boruvka_mst(self, workers=None):
+        """
+        Boruvka's algorithm: every round, each component picks its cheapest
+        outgoing edge and all of them are added at once, at least halving the
+        number of components. Ties are broken by edge position so the picks
+        never form a cycle.
+        """
+        if np is None:
+            raise ImportError("mode='boruvka' requires NumPy to be installed")
+
+        m = len(self.graph)
+        ds = DisjointSet(self.V)
+        result = []
+        if m == 0:
+            return 0, result
+
+        edge_u = np.fromiter((e[0] for e in self.graph), dtype=np.int64, count=m)
+        edge_v = np.fromiter((e[1] for e in self.graph), dtype=np.int64, count=m)
+        weight = np.fromiter((e[2] for e in self.graph), dtype=np.float64, count=m)
+        # An edge's rank in (weight, position) order is its tie-broken priority
+        edge_of_rank = np.lexsort((np.arange(m), weight))
+        rank = np.empty(m, dtype=np.int64)
+        rank[edge_of_rank] = np.arange(m)
+        component = np.arange(self.V, dtype=np.int64)
+
+        executor = ProcessPoolExecutor(max_workers=workers) if workers and workers > 1 else None
+        try:
+            while len(result) < self.V - 1:
+                comp_u = component[edge_u]
+                comp_v = component[edge_v]
+                # Edges inside one component can never be picked again: drop them
+                crossing = comp_u != comp_v
+                if not crossing.any():
+                    break
+                edge_u, edge_v, rank = edge_u[crossing], edge_v[crossing], rank[crossing]
+                comp_u, comp_v = comp_u[crossing], comp_v[crossing]
+
+                best = _cheapest_edges(comp_u, comp_v, rank, self.V, executor, workers)
+
+                # Map each winning rank back to its edge and add it
+                winners = np.unique(best[best < m])
+                for i in edge_of_rank[winners].tolist():
+                    u, v, w = self.graph[i]
+                    if ds.union(u, v):
+                        result.append([u, v, w])
+
+                component = np.fromiter((ds.find(x) for x in range(self.V)), dtype=np.int64, count=self.V)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return sum(edge[2] for edge in result), result
+
+# Edge groups at or below this size are sorted directly by Filter-Kruskal
+_FILTER_KRUSKAL_THRESHOLD = 1024
+# Number of edge weights sampled to pick each Filter-Kruskal pivot
+_PIVOT_SAMPLE_SIZE = 256
+
+def _cheapest_edge_scan(comp_u, comp_v, rank, num_components):
+    """For every component, the smallest rank among the given edges touching it (int64 max if none)."""
+    best = np.full(num_components, np.iinfo(np.int64).max, dtype=np.int64)
+    np.minimum.at(best, comp_u, rank)
+    np.minimum.at(best, comp_v, rank)
+    return best
+
+def _cheapest_edges(comp_u, comp_v, rank, num_components, executor, workers):
+    """Runs _cheapest_edge_scan, split into one shard per worker if an executor is given."""
+    if executor is None or len(rank) < 2 * workers:
+        best = _cheapest_edge_scan(comp_u, comp_v, rank, num_components)
+    else:
+        shards = np.array_split(np.arange(len(rank)), workers)
+        partials = executor.map(
+            _cheapest_edge_scan,
+            [comp_u[s] for s in shards], [comp_v[s] for s in shards],
+            [rank[s] for s in shards], [num_components] * len(shards))
+        best = np.minimum.reduce(list(partials))
+    return best
+
 # --- Example Usage ---
 
-# Graph with 4 vertices (labeled 0, 1, 2, 3)
-g = Graph(4)
-g.add_edge(0, 1, 10)
-g.add_edge(0, 2, 6)
-g.add_edge(0, 3, 5)
-g.add_edge(1, 3, 15)
-g.add_edge(2, 3, 4)
+if __name__ == "__main__":
+
+    # Graph with 4 vertices (labeled 0, 1, 2, 3)
+    g = Graph(4)
+    g.add_edge(0, 1, 10)
+    g.add_edge(0, 2, 6)
+    g.add_edge(0, 3, 5)
+    g.add_edge(1, 3, 15)
+    g.add_edge(2, 3, 4)
+
+    # Edges: (0, 3, 5), (0, 2, 6), (0, 1, 10), (1, 3, 15), (2, 3, 4)
+    # Sorted Edges: (2, 3, 4), (0, 3, 5), (0, 2, 6), (0, 1, 10), (1, 3, 15)
+
+    total_cost, mst = g.kruskal_mst()
 
-# Edges: (0, 3, 5), (0, 2, 6), (0, 1, 10), (1, 3, 15), (2, 3, 4)
-# Sorted Edges: (2, 3, 4), (0, 3, 5), (0, 2, 6), (0, 1, 10), (1, 3, 15)
+    print(f"Number of Vertices (V): {g.V}")
+    print(f"Graph Edges: {g.graph}")
+    print("\n--- Minimum Spanning Tree (MST) ---")
+    print(f"Edges in MST (u, v, weight): {mst}")
+    print(f"Total MST Cost: {total_cost}")
 
-total_cost, mst = g.kruskal_mst()
+    # Expected Output:
+    # Edges: [ [2, 3, 4], [0, 3, 5], [0, 1, 10] ]
+    # Total Cost: 4 + 5 + 10 = 19
 
-print(f"Number of Vertices (V): {g.V}")
-print(f"Graph Edges: {g.graph}")
-print("\n--- Minimum Spanning Tree (MST) ---")
-print(f"Edges in MST (u, v, weight): {mst}")
-print(f"Total MST Cost: {total_cost}")
+    # The other modes return the same MST cost
+    print(f"\nFilter-Kruskal cost: {g.kruskal_mst(mode='filter')[0]}")
+    if np is not None:
+        print(f"Boruvka cost: {g.kruskal_mst(mode='boruvka')[0]}")
 
-# Expected Output:
-# Edges: [ [2, 3, 4], [0, 3, 5], [0, 1, 10] ]
-# Total Cost: 4 + 5 + 10 = 19
+    # Streaming connectivity with the disjoint set
+    ds = DisjointSet(4)
+    ds.union_many([(0, 1), (2, 3), (5, 6)])  # 5 and 6 are new: the universe grows to 7
+    print(f"\nElements: {len(ds)}, Components: {ds.components}")
+    print(f"0 ~ 1: {ds.connected(0, 1)}, 1 ~ 2: {ds.connected(1, 2)}")
+    print(f"Component sizes: {ds.component_sizes()}")
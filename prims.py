@@ -1,24 +1,101 @@
 import heapq
 
-def prim_mst(graph, start_node):
+from graphs import CSRGraph
+from priorityqueue import IndexedPriorityQueue
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up the dense O(V^2) method
+    np = None
+
+# method="auto" switches to the dense O(V^2) method at or above this edge density
+_DENSE_THRESHOLD = 0.25
+
+def prim_mst(graph, start_node, method="auto", forest=False):
     """
     Computes the Minimum Spanning Tree (MST) using Prim's algorithm.
 
     Args:
         graph (dict): The graph represented as an adjacency list.
                       Example: {'A': [('B', 2), ('C', 1)], ...}
+                      A graphs.Graph or compiled graphs.CSRGraph is also accepted, as
+                      is a distance matrix (list of lists or NumPy array, float('inf')
+                      for missing edges), whose vertices are the row indices.
         start_node (str): The node to start the MST construction from.
+        method (str, optional): "lazy" pushes every incident edge into a heap and
+                      skips cycle-forming ones when popped. "eager" keeps only the best
+                      known crossing edge per vertex in an IndexedPriorityQueue, so the
+                      heap never exceeds V entries. "dense" scans an array of best
+                      crossing edges in O(V^2), which wins on dense or complete graphs.
+                      "auto" (default) uses "dense" for distance matrices and graphs
+                      whose edge density is at least _DENSE_THRESHOLD, else "eager".
+                      A distance matrix only supports "auto" and "dense".
+        forest (bool, optional): If True, keep going from the next unreached vertex
+                      whenever a component is finished, producing a minimum spanning
+                      forest of a disconnected graph.
 
     Returns:
         tuple: A tuple containing:
                - mst_cost (int): The total weight of the MST.
                - mst_edges (list): A list of edges in the MST: [(u, v, weight), ...]
     """
+    if method not in ("auto", "lazy", "eager", "dense"):
+        raise ValueError(f"Unknown Prim's method: {method!r}")
+
+    if hasattr(graph, "graph"):
+        # A graphs.Graph: {u: {v: weight}} becomes {u: [(v, weight), ...]}
+        graph = {u: list(neighbors.items()) for u, neighbors in graph.graph.items()}
+
+    is_matrix = not isinstance(graph, (dict, CSRGraph))
+    if is_matrix:
+        if method not in ("auto", "dense"):
+            raise ValueError(f"A distance matrix needs method 'auto' or 'dense', not {method!r}")
+        n = len(graph)
+        if not isinstance(start_node, int) or not 0 <= start_node < n:
+            return 0, []
+        return _prim_mst_dense(graph, start_node, forest)
+
     if start_node not in graph:
         return 0, []
 
+    if method == "auto":
+        n = len(graph)
+        if isinstance(graph, CSRGraph):
+            num_edges = graph.num_edges()
+        else:
+            num_edges = sum(len(neighbors) for neighbors in graph.values())
+        method = "dense" if n > 1 and num_edges >= _DENSE_THRESHOLD * n * (n - 1) else "eager"
+
+    if method == "dense":
+        labels, matrix = _adjacency_matrix(graph)
+        cost, edges = _prim_mst_dense(matrix, labels.index(start_node), forest)
+        return cost, [(labels[u], labels[v], weight) for u, v, weight in edges]
+
+    if isinstance(graph, CSRGraph):
+        if method == "eager":
+            return _prim_mst_eager_csr(graph, start_node, forest)
+        return _prim_mst_csr(graph, start_node, forest)
+
+    roots = [start_node]
+    if forest:
+        roots.extend(graph)
+
     # Set to keep track of nodes already included in the MST
-    visited = {start_node}
+    visited = set()
+    grow = _prim_eager_component if method == "eager" else _prim_lazy_component
+    mst_cost = 0
+    mst_edges = []
+    for root in roots:
+        if root not in visited:
+            mst_cost += grow(graph, root, visited, mst_edges)
+    return mst_cost, mst_edges
+
+def _prim_lazy_component(graph, start_node, visited, mst_edges):
+    """
+    Lazy Prim's algorithm for the component of start_node.
+    Adds its nodes to visited and its edges to mst_edges; returns its cost.
+    """
+    visited.add(start_node)
 
     # Priority Queue (Min-Heap): Stores edges as (weight, neighbor, current_node)
     # The current_node is the one already in the MST.
@@ -30,7 +107,6 @@ def prim_mst(graph, start_node):
         heapq.heappush(pq, (weight, start_node, neighbor))
 
     mst_cost = 0
-    mst_edges = []
 
     # 2. Main Loop: Continue until all nodes are visited or the PQ is empty
     # For a connected graph, this loop runs V-1 times (where V is the number of vertices).
@@ -53,26 +129,259 @@ def prim_mst(graph, start_node):
             if neighbor not in visited:
                 heapq.heappush(pq, (new_weight, v, neighbor))
 
+    return mst_cost
+
+def _prim_eager_component(graph, start_node, visited, mst_edges):
+    """
+    Eager Prim's algorithm for the component of start_node.
+    Every vertex outside the tree is in the heap at most once, keyed by the
+    lightest edge connecting it to the tree; a lighter edge lowers its key.
+    """
+    pq = IndexedPriorityQueue()
+    pq.push(start_node, 0)
+    # Tree endpoint of each vertex's best crossing edge
+    parent = {start_node: None}
+    mst_cost = 0
+
+    while not pq.is_empty():
+        weight, v = pq.pop()
+        visited.add(v)
+        if parent[v] is not None:
+            mst_cost += weight
+            mst_edges.append((parent[v], v, weight))
+
+        for neighbor, new_weight in graph.get(v, []):
+            if neighbor in visited:
+                continue
+            if neighbor not in pq:
+                pq.push(neighbor, new_weight)
+                parent[neighbor] = v
+            elif new_weight < pq.priority(neighbor):
+                pq.decrease_key(neighbor, new_weight)
+                parent[neighbor] = v
+
+    return mst_cost
+
+def _prim_mst_csr(graph, start_node, forest=False):
+    """
+    Lazy Prim's algorithm over the dense integer ids of a CSRGraph.
+    A bytearray replaces the visited set; labels are restored on the result edges.
+    """
+    source = graph.index.get(start_node)
+    if source is None:
+        return 0, []
+
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph.labels)
+    visited = bytearray(n)
+    visited_count = 0
+    mst_cost = 0
+    tree_edges = []
+
+    for root in ([source] + list(range(n)) if forest else [source]):
+        if visited[root]:
+            continue
+        visited[root] = 1
+        visited_count += 1
+
+        pq = [(weights[k], root, targets[k]) for k in range(offsets[root], offsets[root + 1])]
+        heapq.heapify(pq)
+
+        while pq and visited_count < n:
+            weight, u, v = heapq.heappop(pq)
+            if visited[v]:
+                continue
+
+            visited[v] = 1
+            visited_count += 1
+            mst_cost += weight
+            tree_edges.append((u, v, weight))
+
+            for k in range(offsets[v], offsets[v + 1]):
+                neighbor = targets[k]
+                if not visited[neighbor]:
+                    heapq.heappush(pq, (weights[k], v, neighbor))
+
+    labels = graph.labels
+    return mst_cost, [(labels[u], labels[v], w) for u, v, w in tree_edges]
+
+def _prim_mst_eager_csr(graph, start_node, forest=False):
+    """Eager Prim's algorithm over the dense integer ids of a CSRGraph."""
+    source = graph.index[start_node]
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    n = len(graph.labels)
+    visited = bytearray(n)
+    parent = [-1] * n
+    mst_cost = 0
+    tree_edges = []
+
+    for root in ([source] + list(range(n)) if forest else [source]):
+        if visited[root]:
+            continue
+        pq = IndexedPriorityQueue()
+        pq.push(root, 0)
+        parent[root] = -1
+        while not pq.is_empty():
+            weight, v = pq.pop()
+            visited[v] = 1
+            if parent[v] >= 0:
+                mst_cost += weight
+                tree_edges.append((parent[v], v, weight))
+            for k in range(offsets[v], offsets[v + 1]):
+                neighbor = targets[k]
+                if visited[neighbor]:
+                    continue
+                if neighbor not in pq:
+                    pq.push(neighbor, weights[k])
+                    parent[neighbor] = v
+                elif weights[k] < pq.priority(neighbor):
+                    pq.decrease_key(neighbor, weights[k])
+                    parent[neighbor] = v
+
+    labels = graph.labels
+    return mst_cost, [(labels[u], labels[v], w) for u, v, w in tree_edges]
+
+def _adjacency_matrix(graph):
+    """
+    Converts an adjacency list or CSRGraph into (labels, matrix), where
+    matrix[i][j] is the lightest edge weight from labels[i] to labels[j]
+    (float('inf') if there is none).
+    """
+    if isinstance(graph, CSRGraph):
+        labels = list(graph.labels)
+        rows = [graph.neighbors(i) for i in range(len(labels))]
+    else:
+        labels = list(graph)
+        index = {label: i for i, label in enumerate(labels)}
+        rows = []
+        for u in list(labels):
+            row = []
+            for v, weight in graph[u]:
+                if v not in index:
+                    index[v] = len(labels)
+                    labels.append(v)
+                row.append((index[v], weight))
+            rows.append(row)
+
+    n = len(labels)
+    inf = float('inf')
+    matrix = [[inf] * n for _ in range(n)]
+    for i, row in enumerate(rows):
+        matrix_row = matrix[i]
+        for j, weight in row:
+            if weight < matrix_row[j]:
+                matrix_row[j] = weight
+    return labels, matrix
+
+def _prim_mst_dense(matrix, start, forest=False):
+    """
+    O(V^2) Prim's algorithm on a distance matrix, with no heap at all.
+    best[v] holds the lightest edge from the tree to v; each step picks the
+    minimum entry and updates every entry from the new vertex's row. With
+    NumPy both steps are single vectorized operations.
+    """
+    n = len(matrix)
+    inf = float('inf')
+    mst_cost = 0
+    mst_edges = []
+    if n == 0:
+        return mst_cost, mst_edges
+
+    if np is not None:
+        weights = np.asarray(matrix, dtype=np.float64)
+        best = np.full(n, np.inf)
+        parent = np.full(n, -1, dtype=np.int64)
+        in_tree = np.zeros(n, dtype=bool)
+        best[start] = 0.0
+        next_root = 0
+        for _ in range(n):
+            candidates = np.where(in_tree, np.inf, best)
+            v = int(np.argmin(candidates))
+            if candidates[v] == np.inf:
+                if not forest:
+                    break
+                # Start a new tree at the next vertex not reached so far
+                while in_tree[next_root]:
+                    next_root += 1
+                v = next_root
+                parent[v] = -1
+            in_tree[v] = True
+            if parent[v] >= 0:
+                u = int(parent[v])
+                mst_cost += matrix[u][v]
+                mst_edges.append((u, v, matrix[u][v]))
+            row = weights[v]
+            closer = (row < best) & ~in_tree
+            closer[v] = False
+            best[closer] = row[closer]
+            parent[closer] = v
+        return mst_cost, mst_edges
+
+    best = [inf] * n
+    parent = [-1] * n
+    in_tree = [False] * n
+    best[start] = 0
+    next_root = 0
+    for _ in range(n):
+        v = -1
+        for i in range(n):
+            if not in_tree[i] and (v < 0 or best[i] < best[v]):
+                v = i
+        if best[v] == inf:
+            if not forest:
+                break
+            while in_tree[next_root]:
+                next_root += 1
+            v = next_root
+            parent[v] = -1
+        in_tree[v] = True
+        if parent[v] >= 0:
+            mst_cost += matrix[parent[v]][v]
+            mst_edges.append((parent[v], v, matrix[parent[v]][v]))
+        row = matrix[v]
+        for i in range(n):
+            if not in_tree[i] and i != v and row[i] < best[i]:
+                best[i] = row[i]
+                parent[i] = v
     return mst_cost, mst_edges
 
 # --- Example Usage ---
 
-# Graph representation: Adjacency List with weights
-graph_example = {
-    'A': [('B', 2), ('C', 3)],
-    'B': [('A', 2), ('C', 4), ('D', 1)],
-    'C': [('A', 3), ('B', 4), ('D', 5), ('E', 6)],
-    'D': [('B', 1), ('C', 5), ('E', 7)],
-    'E': [('C', 6), ('D', 7)]
-}
-
-start_node = 'A'
-total_cost, mst = prim_mst(graph_example, start_node)
-
-print(f"Graph: {graph_example}")
-print(f"Starting Node: {start_node}")
-print("\n--- Minimum Spanning Tree (MST) ---")
-print(f"Total MST Cost: {total_cost}")
-print(f"MST Edges (u, v, weight): {mst}")
-# Expected MST Edges: [('A', 'B', 2), ('B', 'D', 1), ('A', 'C', 3), ('C', 'E', 6)]
-# Total Cost: 2 + 1 + 3 + 6 = 12
+if __name__ == "__main__":
+
+    # Graph representation: Adjacency List with weights
+    graph_example = {
+        'A': [('B', 2), ('C', 3)],
+        'B': [('A', 2), ('C', 4), ('D', 1)],
+        'C': [('A', 3), ('B', 4), ('D', 5), ('E', 6)],
+        'D': [('B', 1), ('C', 5), ('E', 7)],
+        'E': [('C', 6), ('D', 7)]
+    }
+
+    start_node = 'A'
+    total_cost, mst = prim_mst(graph_example, start_node)
+
+    print(f"Graph: {graph_example}")
+    print(f"Starting Node: {start_node}")
+    print("\n--- Minimum Spanning Tree (MST) ---")
+    print(f"Total MST Cost: {total_cost}")
+    print(f"MST Edges (u, v, weight): {mst}")
+    # Expected MST Edges: [('A', 'B', 2), ('B', 'D', 1), ('A', 'C', 3), ('C', 'E', 6)]
+    # Total Cost: 2 + 1 + 3 + 6 = 12
+
+    # The eager and dense methods build an MST of the same cost
+    for method in ("lazy", "eager", "dense"):
+        print(f"{method.capitalize()} Prim's cost: {prim_mst(graph_example, start_node, method=method)[0]}")
+
+    # A complete graph given as a distance matrix uses the O(V^2) method
+    distance_matrix = [
+        [0, 4, 1, 3],
+        [4, 0, 2, 5],
+        [1, 2, 0, 6],
+        [3, 5, 6, 0]
+    ]
+    print(f"Distance matrix MST: {prim_mst(distance_matrix, 0)}")
+
+    # A disconnected graph gives a minimum spanning forest
+    two_islands = {'A': [('B', 1)], 'B': [('A', 1)], 'X': [('Y', 2)], 'Y': [('X', 2)]}
+    print(f"Spanning forest: {prim_mst(two_islands, 'A', forest=True)}")
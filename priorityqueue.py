@@ -35,3 +35,179 @@ class PriorityQueue:
 
     def size(self):
         return len(self._heap)
+
+class IndexedPriorityQueue:
+    """
+    An addressable min-priority queue backed by a d-ary heap (4-ary by default).
+
+    Each item can be in the queue at most once. A position index maps every
+    item to its slot in the heap, which gives decrease_key in O(log n) without
+    pushing duplicate entries. Priorities and items are kept in two parallel
+    lists, so items never have to be comparable.
+    """
+    def __init__(self, arity=4):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self._arity = arity
+        self._items = []
+        self._priorities = []
+        # Maps item -> index of that item in _items/_priorities
+        self._position = {}
+
+    # Insertion
+    # The complexity is O(log n)
+    def push(self, item, priority):
+        """Adds a new item with the given priority."""
+        if item in self._position:
+            raise ValueError(f"{item!r} is already in the priority queue")
+        self._items.append(item)
+        self._priorities.append(priority)
+        self._sift_up(len(self._items) - 1)
+
+    # Decrease-Key
+    # The complexity is O(log n)
+    def decrease_key(self, item, priority):
+        """Lowers the priority of an item that is already in the queue."""
+        i = self._position[item]
+        if priority > self._priorities[i]:
+            raise ValueError("decrease_key cannot increase a priority")
+        self._priorities[i] = priority
+        self._sift_up(i)
+
+    # Deletion (Dequeue)
+    # The complexity is O(d log n / log d)
+    def pop(self):
+        """Removes and returns the (priority, item) pair with the smallest priority."""
+        if self.is_empty():
+            return None
+        items, priorities = self._items, self._priorities
+        top = (priorities[0], items[0])
+        del self._position[items[0]]
+
+        last_item = items.pop()
+        last_priority = priorities.pop()
+        if items:
+            items[0] = last_item
+            priorities[0] = last_priority
+            self._sift_down(0)
+        return top
+
+    # Peek
+    # The complexity is O(1)
+    def peek(self):
+        """Returns the (priority, item) pair with the smallest priority without removing it."""
+        if self.is_empty():
+            return None
+        return self._priorities[0], self._items[0]
+
+    def priority(self, item):
+        """Returns the current priority of an item in the queue."""
+        return self._priorities[self._position[item]]
+
+    def is_empty(self):
+        return not self._items
+
+    def size(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._position
+
+    def _sift_up(self, i):
+        """Moves the entry at slot i towards the root until the heap order holds."""
+        items, priorities, position, d = self._items, self._priorities, self._position, self._arity
+        item, priority = items[i], priorities[i]
+        while i > 0:
+            parent = (i - 1) // d
+            if priorities[parent] <= priority:
+                break
+            items[i] = items[parent]
+            priorities[i] = priorities[parent]
+            position[items[i]] = i
+            i = parent
+        items[i] = item
+        priorities[i] = priority
+        position[item] = i
+
+    def _sift_down(self, i):
+        """Moves the entry at slot i towards the leaves until the heap order holds."""
+        items, priorities, position, d = self._items, self._priorities, self._position, self._arity
+        n = len(items)
+        item, priority = items[i], priorities[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            # Pick the smallest of up to d children
+            best = first
+            best_priority = priorities[first]
+            for child in range(first + 1, min(first + d, n)):
+                if priorities[child] < best_priority:
+                    best = child
+                    best_priority = priorities[child]
+            if best_priority >= priority:
+                break
+            items[i] = items[best]
+            priorities[i] = best_priority
+            position[items[i]] = i
+            i = best
+        items[i] = item
+        priorities[i] = priority
+        position[item] = i
+
+class RadixHeap:
+    """
+    A monotone min-priority queue for non-negative integer priorities.
+
+    Every pushed priority must be at least the last popped one, as in Dijkstra's
+    algorithm. Bucket i holds the entries whose priority first differs from the
+    last popped priority in bit i - 1 (bucket 0 holds exact ties). Popping from
+    an empty bucket 0 redistributes the lowest non-empty bucket, and each entry
+    can only move to a lower bucket, so a pop costs O(log C) amortized, where C
+    is the largest priority. Keys are only compared with ints, never with tuples.
+    """
+    def __init__(self):
+        self._buckets = [[]]
+        self._last = 0
+        self._size = 0
+
+    # Insertion
+    # The complexity is O(1)
+    def push(self, item, priority):
+        """Adds an item; priority must be an int no smaller than the last popped one."""
+        if priority < self._last:
+            raise ValueError("RadixHeap priorities must not decrease below the last popped one")
+        i = (priority ^ self._last).bit_length()
+        buckets = self._buckets
+        while len(buckets) <= i:
+            buckets.append([])
+        buckets[i].append((priority, item))
+        self._size += 1
+
+    # Deletion (Dequeue)
+    # The complexity is O(log C) amortized
+    def pop(self):
+        """Removes and returns a (priority, item) pair with the smallest priority."""
+        if not self._size:
+            return None
+        buckets = self._buckets
+        if not buckets[0]:
+            i = 1
+            while not buckets[i]:
+                i += 1
+            # The new minimum becomes the reference point; every entry of
+            # bucket i now shares more leading bits with it and moves down
+            entries = buckets[i]
+            buckets[i] = []
+            last = min(entry[0] for entry in entries)
+            self._last = last
+            for entry in entries:
+                buckets[(entry[0] ^ last).bit_length()].append(entry)
+        self._size -= 1
+        return buckets[0].pop()
+
+    def is_empty(self):
+        return not self._size
+
+    def size(self):
+        return self._size
@@ -0,0 +1,228 @@
+from binarysearchtree import BinarySearchTree
+
+class RedBlackNode:
+    """
+    A single Node in the Red-Black Tree.
+    Besides the BST fields it keeps its colour and a pointer to its parent,
+    which the fix-up loops walk up instead of recursing.
+    __slots__ keeps every node small: no per-instance __dict__.
+    """
+    __slots__ = ("value", "data", "left", "right", "parent", "red")
+
+    def __init__(self, value, parent=None):
+        # The key the tree is ordered by, and the data mapped to it
+        self.value = value
+        self.data = None
+        self.left = None
+        self.right = None
+        self.parent = parent
+        # New nodes are red; missing children (None) count as black
+        self.red = True
+
+class RedBlackTree(BinarySearchTree):
+    """
+    A Red-Black Tree with the same interface as BinarySearchTree
+    (insert/delete/search, floor/ceiling, put/get/pop/setdefault, traversals).
+
+    The red-black rules (no red node has a red child, and every path from a
+    node down to a leaf passes the same number of black nodes) keep the height
+    below 2 log2(n + 1). Rebalancing mostly recolours: an insert performs at
+    most two rotations and a delete at most three, fewer than AVL deletions,
+    which can rotate at every level.
+    """
+
+    # --- Rotation Methods ---
+
+    def _replace_child(self, parent, old, new):
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def _left_rotate(self, x):
+        """Performs a left rotation on node x."""
+        y = x.right
+        x.right = y.left
+        if y.left is not None:
+            y.left.parent = x
+        y.parent = x.parent
+        self._replace_child(x.parent, x, y)
+        y.left = x
+        x.parent = y
+
+    def _right_rotate(self, y):
+        """Performs a right rotation on node y."""
+        x = y.left
+        y.left = x.right
+        if x.right is not None:
+            x.right.parent = y
+        x.parent = y.parent
+        self._replace_child(y.parent, y, x)
+        x.right = y
+        y.parent = x
+
+    # --- Insertion and Deletion ---
+
+    def _add(self, key):
+        parent = None
+        node = self.root
+        while node is not None:
+            if key == node.value:
+                return node, False
+            parent = node
+            node = node.left if key < node.value else node.right
+
+        node = RedBlackNode(key, parent)
+        self._size += 1
+        if parent is None:
+            self.root = node
+        elif key < parent.value:
+            parent.left = node
+        else:
+            parent.right = node
+        self._insert_fixup(node)
+        return node, True
+
+    def _insert_fixup(self, node):
+        """Restores the red-black rules after attaching the red leaf node."""
+        while True:
+            parent = node.parent
+            if parent is None or not parent.red:
+                break
+            # parent is red, so it is not the root and grandparent exists
+            grandparent = parent.parent
+            uncle = grandparent.right if parent is grandparent.left else grandparent.left
+            if uncle is not None and uncle.red:
+                # Red uncle: push the blackness down from the grandparent and continue above
+                parent.red = uncle.red = False
+                grandparent.red = True
+                node = grandparent
+                continue
+            if parent is grandparent.left:
+                if node is parent.right:
+                    # Left Right: rotate into the Left Left shape first
+                    self._left_rotate(parent)
+                    parent = node
+                self._right_rotate(grandparent)
+            else:
+                if node is parent.left:
+                    # Right Left: rotate into the Right Right shape first
+                    self._right_rotate(parent)
+                    parent = node
+                self._left_rotate(grandparent)
+            parent.red = False
+            grandparent.red = True
+            break
+        self.root.red = False
+
+    def _remove(self, node, parent):
+        data = node.data
+        if node.left is not None and node.right is not None:
+            # Two children: move the in-order successor's entry here and
+            # unlink the successor instead (it has no left child)
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.value, node.data = successor.value, successor.data
+            node = successor
+
+        # node has at most one child, which takes its place
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        if child is not None:
+            child.parent = parent
+        self._replace_child(parent, node, child)
+        self._size -= 1
+        if not node.red:
+            # A black node left the path: child's side is one black short
+            self._delete_fixup(child, parent)
+        return data
+
+    def _delete_fixup(self, node, parent):
+        """
+        Restores equal black heights after a black node was removed above node
+        (which may be None, a black leaf position, with the given parent).
+        """
+        while node is not self.root and (node is None or not node.red):
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.red:
+                    # Red sibling: rotate so the sibling is black
+                    sibling.red = False
+                    parent.red = True
+                    self._left_rotate(parent)
+                    sibling = parent.right
+                if ((sibling.left is None or not sibling.left.red)
+                        and (sibling.right is None or not sibling.right.red)):
+                    # Black sibling with black children: recolour and move the problem up
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                    continue
+                if sibling.right is None or not sibling.right.red:
+                    # Only the near nephew is red: rotate it to the far side
+                    sibling.left.red = False
+                    sibling.red = True
+                    self._right_rotate(sibling)
+                    sibling = parent.right
+                sibling.red = parent.red
+                parent.red = False
+                sibling.right.red = False
+                self._left_rotate(parent)
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self._right_rotate(parent)
+                    sibling = parent.left
+                if ((sibling.left is None or not sibling.left.red)
+                        and (sibling.right is None or not sibling.right.red)):
+                    sibling.red = True
+                    node, parent = parent, parent.parent
+                    continue
+                if sibling.left is None or not sibling.left.red:
+                    sibling.right.red = False
+                    sibling.red = True
+                    self._left_rotate(sibling)
+                    sibling = parent.left
+                sibling.red = parent.red
+                parent.red = False
+                sibling.left.red = False
+                self._right_rotate(parent)
+            node = self.root
+            break
+        if node is not None:
+            node.red = False
+
+    def black_height(self):
+        """Returns the number of black nodes on every root-to-leaf path."""
+        height = 0
+        node = self.root
+        while node is not None:
+            height += not node.red
+            node = node.left
+        return height
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+    rb_tree = RedBlackTree()
+
+    # Sorted input would turn a plain BST into a chain; here it stays balanced
+    for val in range(1, 16):
+        rb_tree.put(val, f"item {val}")
+
+    print("--- Red-Black Tree ---")
+    rb_tree.inorder_traversal()
+    rb_tree.preorder_traversal()
+    print(f"Black height: {rb_tree.black_height()}, root: {rb_tree.root.value}")
+
+    print(f"\nValue at 7: {rb_tree[7]}")
+    print(f"Floor of 7.5: {rb_tree.floor(7.5)}, successor of 7: {rb_tree.successor(7)}")
+
+    for val in (8, 4, 12):
+        rb_tree.delete(val)
+    print(f"After deleting 8, 4 and 12: {list(rb_tree)}, black height {rb_tree.black_height()}")
@@ -0,0 +1,325 @@
+import math
+import operator
+from array import array
+from itertools import accumulate
+
+try:
+    import numpy as np
+except ImportError:  # NumPy only speeds up building from a NumPy array
+    np = None
+
+# Lazy tags: what is pending for the children of an internal node
+_NONE = 0
+_ADD = 1
+_ASSIGN = 2
+
+def _minimum(a, b):
+    return a if a <= b else b
+
+def _maximum(a, b):
+    return a if a >= b else b
+
+# name: (operator, identity, NumPy ufunc for bulk builds)
+_OPERATORS = {
+    "sum": (operator.add, 0, "add"),
+    "min": (_minimum, math.inf, "minimum"),
+    "max": (_maximum, -math.inf, "maximum"),
+    "gcd": (math.gcd, 0, "gcd"),
+}
+
+class SegmentTree:
+    """
+    A segment tree over a fixed-length sequence, for any associative operator,
+    with range queries and lazy range updates, both in O(log n).
+
+    The tree lives in one flat buffer of 2 * size slots (size = n rounded up to
+    a power of two): the leaves are at size .. size + n - 1 and node k covers
+    the ranges of its children 2k and 2k + 1. Queries and updates walk up
+    from the leaf boundaries in a loop (no recursion). Range updates leave a
+    lazy tag on the O(log n) nodes that cover the range; a tag is pushed down
+    to the children only when a later operation needs to go below it.
+
+    Two kinds of range update are supported:
+    - assign(lo, hi, value) for every operator (a segment of length L
+      aggregates to value combined with itself L times);
+    - add(lo, hi, delta) for "sum", "min" and "max", where adding to every
+      element shifts the aggregate by delta * L or by delta.
+    """
+    def __init__(self, values, op="sum", identity=None, typecode=None):
+        """
+        Builds the tree bottom-up in O(n).
+
+        Args:
+            values (list or NumPy array): The initial sequence.
+            op (str or callable): "sum", "min", "max", "gcd", or any associative
+                          function of two arguments.
+            identity: The neutral element of op (op(identity, x) == x). Required for
+                          a custom op; defaults to 0, inf, -inf or 0 for named ones.
+            typecode (str, optional): Keep the tree in array(typecode) instead of a list,
+                          e.g. 'd' or 'q'. With 'q', min and max use the largest and
+                          smallest 64-bit values as identity.
+        """
+        ufunc = None
+        if isinstance(op, str):
+            if op not in _OPERATORS:
+                raise ValueError(f"Unknown operator '{op}'. Use one of {sorted(_OPERATORS)} or a function.")
+            self.op_name = op
+            op, default_identity, ufunc = _OPERATORS[op]
+            if identity is None:
+                identity = default_identity
+        else:
+            self.op_name = None
+            if identity is None:
+                raise ValueError("A custom operator needs its identity element")
+        if typecode is not None and isinstance(identity, float) and math.isinf(identity) and typecode not in "fd":
+            bound = (1 << (8 * array(typecode).itemsize - 1)) - 1
+            identity = bound if identity > 0 else -bound
+        self.op = op
+        self.identity = identity
+
+        n = self.n = len(values)
+        size = self.size = 1 << max(n - 1, 0).bit_length()
+        self.log = size.bit_length() - 1
+
+        if np is not None and isinstance(values, np.ndarray) and ufunc is not None:
+            # Vectorized build: every level is one ufunc call over the level below
+            combine = getattr(np, ufunc)
+            # Padding leaves never lie inside a queried or updated range, so any
+            # value works; repeating the last element keeps the dtype
+            level = np.empty(size, dtype=values.dtype)
+            level[:n] = values
+            level[n:] = values[n - 1] if n else 0
+            levels = [level]
+            while len(level) > 1:
+                level = combine(level[0::2], level[1::2])
+                levels.append(level)
+            # Root level first, so node k lands at index k
+            tree = [identity]
+            for level in reversed(levels):
+                tree.extend(level.tolist())
+        else:
+            tree = [identity] * size
+            tree.extend(values)
+            tree.extend([identity] * (size - n))
+            for k in range(size - 1, 0, -1):
+                tree[k] = op(tree[2 * k], tree[2 * k + 1])
+        self.tree = tree if typecode is None else array(typecode, tree)
+
+        # Pending tags of the internal nodes 1 .. size - 1
+        self._tag_kind = bytearray(size)
+        self._tag_value = [None] * size
+
+    # --- Lazy Tags ---
+
+    def _repeat(self, value, length):
+        """Returns value combined with itself length times."""
+        if self.op_name == "sum":
+            return value * length
+        if self.op_name is not None:
+            # min, max and gcd are idempotent
+            return value
+        result, power = self.identity, value
+        while length:
+            if length & 1:
+                result = self.op(result, power)
+            power = self.op(power, power)
+            length >>= 1
+        return result
+
+    def _apply(self, k, kind, value):
+        """Applies an update to the whole segment of node k and tags it for its children."""
+        if kind == _ASSIGN:
+            self.tree[k] = self._repeat(value, self.size >> (k.bit_length() - 1))
+        elif self.op_name == "sum":
+            self.tree[k] += value * (self.size >> (k.bit_length() - 1))
+        else:
+            self.tree[k] += value
+        if k < self.size:
+            tag_kind = self._tag_kind
+            if kind == _ASSIGN or tag_kind[k] == _NONE:
+                tag_kind[k] = kind
+                self._tag_value[k] = value
+            else:
+                # An add on top of a pending add or assign only shifts its value
+                self._tag_value[k] += value
+
+    def _push(self, k):
+        """Moves the pending tag of node k down to its two children."""
+        kind = self._tag_kind[k]
+        if kind != _NONE:
+            value = self._tag_value[k]
+            self._apply(2 * k, kind, value)
+            self._apply(2 * k + 1, kind, value)
+            self._tag_kind[k] = _NONE
+            self._tag_value[k] = None
+
+    def _push_boundaries(self, lo, hi):
+        """Pushes the tags above the leaf boundaries lo and hi (already offset by size)."""
+        tag_kind = self._tag_kind
+        for i in range(self.log, 0, -1):
+            if ((lo >> i) << i) != lo and tag_kind[lo >> i]:
+                self._push(lo >> i)
+            if ((hi >> i) << i) != hi and tag_kind[(hi - 1) >> i]:
+                self._push((hi - 1) >> i)
+
+    def _check_range(self, lo, hi):
+        if not 0 <= lo <= hi <= self.n:
+            raise IndexError(f"range [{lo}, {hi}) out of bounds for length {self.n}")
+
+    # --- Queries ---
+
+    def query(self, lo, hi):
+        """Returns the aggregate of the elements lo .. hi - 1 (identity if empty)."""
+        self._check_range(lo, hi)
+        op, tree = self.op, self.tree
+        lo += self.size
+        hi += self.size
+        self._push_boundaries(lo, hi)
+        left = right = self.identity
+        while lo < hi:
+            if lo & 1:
+                left = op(left, tree[lo])
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                right = op(tree[hi], right)
+            lo >>= 1
+            hi >>= 1
+        return op(left, right)
+
+    def query_many(self, ranges):
+        """
+        Answers a batch of (lo, hi) range queries and returns the results as a list.
+        For "sum" with a batch at least as long as the sequence, all tags are
+        pushed to the leaves once and every query becomes a prefix-sum
+        difference: O(n + q) instead of O(q log n).
+        """
+        ranges = list(ranges)
+        if self.op_name == "sum" and len(ranges) >= self.n:
+            for k in range(1, self.size):
+                self._push(k)
+            prefix = [0]
+            prefix.extend(accumulate(self.tree[self.size:self.size + self.n]))
+            results = []
+            for lo, hi in ranges:
+                self._check_range(lo, hi)
+                results.append(prefix[hi] - prefix[lo])
+            return results
+        return [self.query(lo, hi) for lo, hi in ranges]
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.n:
+            raise IndexError("segment tree index out of range")
+        i += self.size
+        for shift in range(self.log, 0, -1):
+            self._push(i >> shift)
+        return self.tree[i]
+
+    def __len__(self):
+        return self.n
+
+    def tolist(self):
+        """Returns the current sequence as a list, pushing every pending tag down."""
+        for k in range(1, self.size):
+            self._push(k)
+        return list(self.tree[self.size:self.size + self.n])
+
+    # --- Updates ---
+
+    def __setitem__(self, i, value):
+        if not 0 <= i < self.n:
+            raise IndexError("segment tree index out of range")
+        i += self.size
+        for shift in range(self.log, 0, -1):
+            self._push(i >> shift)
+        self.tree[i] = value
+        op, tree = self.op, self.tree
+        i >>= 1
+        while i:
+            tree[i] = op(tree[2 * i], tree[2 * i + 1])
+            i >>= 1
+
+    def _update_range(self, lo, hi, kind, value):
+        self._check_range(lo, hi)
+        if lo == hi:
+            return
+        op, tree = self.op, self.tree
+        lo += self.size
+        hi += self.size
+        self._push_boundaries(lo, hi)
+
+        # Tag the O(log n) nodes that exactly cover [lo, hi)
+        l, h = lo, hi
+        while l < h:
+            if l & 1:
+                self._apply(l, kind, value)
+                l += 1
+            if h & 1:
+                h -= 1
+                self._apply(h, kind, value)
+            l >>= 1
+            h >>= 1
+
+        # Recompute the ancestors of the two boundaries
+        for i in range(1, self.log + 1):
+            if ((lo >> i) << i) != lo:
+                k = lo >> i
+                tree[k] = op(tree[2 * k], tree[2 * k + 1])
+            if ((hi >> i) << i) != hi:
+                k = (hi - 1) >> i
+                tree[k] = op(tree[2 * k], tree[2 * k + 1])
+
+    def assign(self, lo, hi, value):
+        """Sets every element lo .. hi - 1 to value, in O(log n)."""
+        self._update_range(lo, hi, _ASSIGN, value)
+
+    def add(self, lo, hi, delta):
+        """Adds delta to every element lo .. hi - 1, in O(log n). Needs op "sum", "min" or "max"."""
+        if self.op_name not in ("sum", "min", "max"):
+            raise ValueError("Range add is only defined for the 'sum', 'min' and 'max' operators")
+        self._update_range(lo, hi, _ADD, delta)
+
+    def update_many(self, updates):
+        """
+        Applies a batch of updates in order. Each update is (kind, lo, hi, value)
+        with kind "add" or "assign".
+        """
+        for kind, lo, hi, value in updates:
+            if kind == "add":
+                self.add(lo, hi, value)
+            elif kind == "assign":
+                self.assign(lo, hi, value)
+            else:
+                raise ValueError(f"Unknown update '{kind}'. Use 'add' or 'assign'.")
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+    # Request latencies (ms) of one endpoint, one per minute
+    latencies = [120, 95, 310, 87, 150, 99, 240, 130]
+
+    totals = SegmentTree(latencies, op="sum")
+    peaks = SegmentTree(latencies, op="max")
+    print("--- Segment Tree Range Queries ---")
+    print(f"Latencies: {latencies}")
+    print(f"Total of minutes 2..5: {totals.query(2, 6)}")       # Expected: 646
+    print(f"Peak of minutes 2..5: {peaks.query(2, 6)}")         # Expected: 310
+
+    # Range updates are lazy: O(log n) however long the range is
+    totals.add(0, 4, 10)
+    peaks.add(0, 4, 10)
+    totals.assign(6, 8, 100)
+    peaks.assign(6, 8, 100)
+    print(f"\nAfter +10 on minutes 0..3 and 100 on minutes 6..7: {totals.tolist()}")
+    print(f"Total of all minutes: {totals.query(0, 8)}, peak: {peaks.query(0, 8)}")
+
+    # Any associative operator works, e.g. gcd or string concatenation
+    divisors = SegmentTree([12, 18, 24, 36, 60], op="gcd")
+    print(f"\ngcd of [12, 18, 24, 36, 60][1:4]: {divisors.query(1, 4)}")   # Expected: 6
+    words = SegmentTree(["seg", "ment", " ", "tree"], op=operator.add, identity="")
+    words.assign(2, 3, "_")
+    print(f"Concatenation: {words.query(0, 4)!r}")
+
+    # Batched queries
+    print(f"Batch of sums: {totals.query_many([(0, 2), (2, 4), (4, 8)])}")
@@ -0,0 +1,381 @@
+import heapq
+import math
+
+from djikstrasalgo import DijkstraSearch, dijkstra, reconstruct_path
+
+def reverse_graph(graph):
+    """
+    Builds the reverse of a directed adjacency list: every edge (u, v, w) becomes (v, u, w).
+    Every node of the original graph is a key of the result, even without in-edges.
+
+    For an undirected graph (each edge stored in both directions) the graph
+    is its own reverse and this step can be skipped.
+    """
+    reverse = {node: [] for node in graph}
+    for u, neighbors in graph.items():
+        for v, weight in neighbors:
+            reverse.setdefault(v, []).append((u, weight))
+    return reverse
+
+def _path_predecessors(path):
+    """Turns a node list [source, ..., target] into a predecessor map for reconstruct_path."""
+    predecessors = {path[0]: None}
+    for prev, node in zip(path, path[1:]):
+        predecessors[node] = prev
+    return predecessors
+
+def bidirectional_dijkstra(graph, source, target, reverse=None):
+    """
+    Finds the shortest path from source to target by running Dijkstra's algorithm
+    forward from the source and backward from the target at the same time.
+
+    The search stops as soon as the two smallest tentative distances add up to
+    at least the best source-target distance seen so far, so only the area
+    around the two end points is explored instead of the whole graph.
+
+    Args:
+        graph (dict): The graph represented as an adjacency list.
+                      Example: {'A': [('B', 2), ('C', 1)], 'B': [('D', 1)], ...}
+        source: The node to start from.
+        target: The node to reach.
+        reverse (dict, optional): The reversed graph, as built by reverse_graph().
+                      Pass it in when running many queries on the same graph; pass
+                      the graph itself when it is undirected.
+
+    Returns:
+        float: The shortest distance, or infinity if target is unreachable.
+        dict: A predecessor map covering the nodes of the path, usable with
+              reconstruct_path(predecessors, target). Empty if unreachable.
+    """
+    if source not in graph or target not in graph:
+        print(f"Error: Node '{source if source not in graph else target}' not found in graph.")
+        return float('inf'), {}
+    if source == target:
+        return 0, {source: None}
+    if reverse is None:
+        reverse = reverse_graph(graph)
+
+    inf = float('inf')
+    # Index 0 is the forward search, index 1 the backward search.
+    adjacency = (graph, reverse)
+    distances = ({source: 0}, {target: 0})
+    predecessors = ({source: None}, {target: None})
+    queues = ([(0, source)], [(0, target)])
+
+    best = inf
+    meeting_node = None
+
+    while queues[0] and queues[1]:
+        # Stopping rule: no path through unsettled nodes can beat 'best'
+        if queues[0][0][0] + queues[1][0][0] >= best:
+            break
+
+        # Expand the side whose frontier is closer to its end point
+        side = 0 if queues[0][0][0] <= queues[1][0][0] else 1
+        dist, other_dist = distances[side], distances[1 - side]
+        pred, queue = predecessors[side], queues[side]
+
+        current_distance, u = heapq.heappop(queue)
+        if current_distance > dist[u]:
+            continue
+
+        for v, weight in adjacency[side].get(u, []):
+            distance_through_u = current_distance + weight
+            if distance_through_u < dist.get(v, inf):
+                dist[v] = distance_through_u
+                pred[v] = u
+                heapq.heappush(queue, (distance_through_u, v))
+
+            # Every edge that touches the other search closes a candidate path
+            if v in other_dist and distance_through_u + other_dist[v] < best:
+                best = distance_through_u + other_dist[v]
+                meeting_node = v
+
+    if meeting_node is None:
+        return inf, {}
+
+    # Forward half: meeting_node back to source; backward half: meeting_node on to target
+    path = []
+    node = meeting_node
+    while node is not None:
+        path.append(node)
+        node = predecessors[0].get(node)
+    path.reverse()
+    node = predecessors[1].get(meeting_node)
+    while node is not None:
+        path.append(node)
+        node = predecessors[1].get(node)
+
+    return best, _path_predecessors(path)
+
+def astar(graph, source, target, heuristic=None):
+    """
+    Finds the shortest path from source to target using the A* search algorithm.
+
+    A* is Dijkstra's algorithm with nodes ordered by distance-so-far plus an
+    estimate of the remaining distance, which steers the search towards the
+    target. With an admissible heuristic (one that never overestimates) the
+    result is exact.
+
+    Args:
+        graph (dict): The graph represented as an adjacency list.
+        source: The node to start from.
+        target: The node to reach.
+        heuristic (callable, optional): heuristic(node, target) returning a lower
+                      bound on the remaining distance, e.g. from euclidean_heuristic()
+                      or landmark_heuristic(). Defaults to 0, i.e. plain Dijkstra.
+
+    Returns:
+        float: The shortest distance, or infinity if target is unreachable.
+        dict: A predecessor map usable with reconstruct_path(predecessors, target).
+              Empty if unreachable.
+    """
+    if source not in graph or target not in graph:
+        print(f"Error: Node '{source if source not in graph else target}' not found in graph.")
+        return float('inf'), {}
+    if heuristic is None:
+        heuristic = lambda node, goal: 0
+
+    inf = float('inf')
+    distances = {source: 0}
+    predecessors = {source: None}
+    # Entries are (estimated total, distance so far, node)
+    open_set = [(heuristic(source, target), 0, source)]
+
+    while open_set:
+        _, current_distance, u = heapq.heappop(open_set)
+        if current_distance > distances[u]:
+            continue
+        if u == target:
+            return current_distance, predecessors
+
+        for v, weight in graph.get(u, []):
+            distance_through_u = current_distance + weight
+            if distance_through_u < distances.get(v, inf):
+                distances[v] = distance_through_u
+                predecessors[v] = u
+                heapq.heappush(open_set, (distance_through_u + heuristic(v, target), distance_through_u, v))
+
+    return inf, {}
+
+def euclidean_heuristic(coordinates, scale=1):
+    """
+    Returns an A* heuristic based on straight-line distance.
+
+    Args:
+        coordinates (dict): Maps each node to an (x, y) position.
+        scale (float, optional): Multiplier from coordinate units to edge weight
+                      units. The heuristic is admissible as long as no edge is
+                      cheaper than scale times the straight-line distance it covers.
+    """
+    def heuristic(node, target):
+        x1, y1 = coordinates[node]
+        x2, y2 = coordinates[target]
+        return scale * math.hypot(x2 - x1, y2 - y1)
+    return heuristic
+
+def landmark_heuristic(graph, landmarks, reverse=None):
+    """
+    Returns an ALT (A*, Landmarks, Triangle inequality) heuristic.
+
+    Shortest distances to and from every landmark are computed once with dijkstra.
+    For any landmark L the triangle inequality gives two lower bounds:
+        d(v, t) >= d(L, t) - d(L, v)    and    d(v, t) >= d(v, L) - d(t, L)
+    and the heuristic takes the largest bound over all landmarks.
+
+    Args:
+        graph (dict): The graph represented as an adjacency list.
+        landmarks (list): A few well-spread nodes, e.g. on the edge of the map.
+        reverse (dict, optional): The reversed graph, as for bidirectional_dijkstra.
+    """
+    if reverse is None:
+        reverse = reverse_graph(graph)
+    # dijkstra expects every node to be a key of the adjacency list
+    forward = {node: [] for node in reverse}
+    forward.update(graph)
+
+    inf = float('inf')
+    tables = []
+    for landmark in landmarks:
+        from_landmark, _ = dijkstra(forward, landmark)
+        to_landmark, _ = dijkstra(reverse, landmark)
+        tables.append((from_landmark, to_landmark))
+
+    def heuristic(node, target):
+        best = 0
+        for from_landmark, to_landmark in tables:
+            from_node, from_target = from_landmark.get(node, inf), from_landmark.get(target, inf)
+            if from_target != inf and from_node != inf and from_target - from_node > best:
+                best = from_target - from_node
+            to_node, to_target = to_landmark.get(node, inf), to_landmark.get(target, inf)
+            if to_node != inf and to_target != inf and to_node - to_target > best:
+                best = to_node - to_target
+        return best
+    return heuristic
+
+def k_shortest_paths(graph, source, target, k):
+    """
+    Finds the k shortest loopless paths from source to target with Yen's algorithm.
+
+    Every new path is the cheapest "spur" off an already accepted path: it follows
+    an accepted path up to some spur node (the root) and then leaves it, avoiding
+    the root's other nodes and every edge out of the spur node already taken by
+    an accepted path with the same root. Each spur search is a DijkstraSearch that
+    stops at the target.
+
+    Work shared between spur searches is cached per root prefix:
+    - the cost of every prefix of an accepted path, so root costs are lookups;
+    - the next nodes taken after each root by accepted paths (the edges to block),
+      kept up to date as paths are accepted instead of rescanning them;
+    - the number of blocked edges each root was last searched with. A root whose
+      blocked set has not grown would give the same spur path again, so it is
+      skipped; in effect only roots from the deviation point of the latest path on
+      are searched.
+
+    Args:
+        graph (dict or CSRGraph): The graph represented as an adjacency list.
+                      Example: {'A': [('B', 2), ('C', 1)], 'B': [('D', 1)], ...}
+                      Weights must be non-negative.
+        source: The node to start from.
+        target: The node to reach.
+        k (int): The number of paths wanted.
+
+    Returns:
+        list: Up to k (distance, path) pairs in order of increasing distance, each
+              path a list of nodes [source, ..., target]. Empty if target is unreachable.
+    """
+    if source not in graph:
+        print(f"Error: Node '{source}' not found in graph.")
+        return []
+
+    search = DijkstraSearch(graph, source)
+    distance = search.run_until(target)
+    if distance == float('inf') or k <= 0:
+        return []
+
+    accepted = []
+    # Root prefix (tuple of nodes) -> cost of reaching its last node along it
+    prefix_costs = {}
+    # Root prefix -> next nodes taken after it by accepted paths
+    branches = {}
+    # Root prefix -> len(branches[root]) when its spur search last ran
+    searched = {}
+    candidates = []
+    seen = set()
+
+    def accept(distance, path, costs):
+        # costs[i] is the distance from source to path[i] along the path
+        accepted.append((distance, list(path)))
+        for i in range(len(path)):
+            root = path[:i + 1]
+            prefix_costs.setdefault(root, costs[i])
+            if i + 1 < len(path):
+                branches.setdefault(root, set()).add(path[i + 1])
+
+    path = tuple(search.path_to(target))
+    accept(distance, path, [search.settled[node] for node in path])
+    seen.add(path)
+
+    while len(accepted) < k:
+        _, last_path = accepted[-1]
+        for i in range(len(last_path) - 1):
+            root = tuple(last_path[:i + 1])
+            blocked_edges = branches[root]
+            if searched.get(root) == len(blocked_edges):
+                continue
+            searched[root] = len(blocked_edges)
+
+            spur_node = root[-1]
+            spur_search = DijkstraSearch(graph, spur_node, blocked_nodes=set(root[:-1]),
+                                         blocked_edges={(spur_node, v) for v in blocked_edges})
+            spur_distance = spur_search.run_until(target)
+            if spur_distance == float('inf'):
+                continue
+
+            spur_path = spur_search.path_to(target)
+            candidate = root[:-1] + tuple(spur_path)
+            if candidate in seen:
+                continue
+            seen.add(candidate)
+            root_cost = prefix_costs[root]
+            costs = [prefix_costs[root[:j + 1]] for j in range(i)]
+            costs += [root_cost + spur_search.settled[node] for node in spur_path]
+            # len(seen) breaks distance ties, so paths are never compared
+            heapq.heappush(candidates, (root_cost + spur_distance, len(seen), candidate, costs))
+
+        if not candidates:
+            break
+        distance, _, path, costs = heapq.heappop(candidates)
+        accept(distance, path, costs)
+
+    return accepted
+
+def shortest_path(graph, source, target, method="bidirectional", heuristic=None, reverse=None):
+    """
+    Point-to-point shortest path query.
+
+    Args:
+        graph (dict): The graph represented as an adjacency list.
+        source: The node to start from.
+        target: The node to reach.
+        method (str, optional): "bidirectional" (default) for bidirectional_dijkstra,
+                      or "astar" for astar with the given heuristic.
+        heuristic (callable, optional): Only used by "astar".
+        reverse (dict, optional): Only used by "bidirectional".
+
+    Returns:
+        float: The shortest distance, or infinity if target is unreachable.
+        dict: A predecessor map usable with reconstruct_path(predecessors, target).
+    """
+    if method == "bidirectional":
+        return bidirectional_dijkstra(graph, source, target, reverse=reverse)
+    if method == "astar":
+        return astar(graph, source, target, heuristic=heuristic)
+    raise ValueError(f"Unknown shortest path method: {method!r}")
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+    # A small road map: nodes carry (x, y) positions, edge weights are road lengths
+    coordinates = {
+        'A': (0, 0), 'B': (2, 0), 'C': (0, 2),
+        'D': (3, 2), 'E': (1, 4), 'F': (4, 4)
+    }
+    road_map = {
+        'A': [('B', 2), ('C', 2)],
+        'B': [('D', 3)],
+        'C': [('D', 4), ('E', 3)],
+        'D': [('F', 3)],
+        'E': [('F', 3)],
+        'F': []
+    }
+    source, target = 'A', 'F'
+
+    print(f"Graph: {road_map}")
+    print(f"Query: {source} -> {target}")
+
+    # 1. Bidirectional Dijkstra
+    distance, predecessors = shortest_path(road_map, source, target)
+    print("\n--- Bidirectional Dijkstra ---")
+    print(f"Distance: {distance}, Path: {reconstruct_path(predecessors, target)}")
+
+    # 2. A* with a straight-line heuristic
+    distance, predecessors = shortest_path(road_map, source, target, method="astar",
+                                           heuristic=euclidean_heuristic(coordinates))
+    print("\n--- A* (Euclidean) ---")
+    print(f"Distance: {distance}, Path: {reconstruct_path(predecessors, target)}")
+
+    # 3. A* with ALT landmarks
+    alt = landmark_heuristic(road_map, landmarks=['A', 'F'])
+    distance, predecessors = shortest_path(road_map, source, target, method="astar", heuristic=alt)
+    print("\n--- A* (ALT Landmarks) ---")
+    print(f"Distance: {distance}, Path: {reconstruct_path(predecessors, target)}")
+
+    # Expected: Distance 8 via A -> B -> D -> F
+
+    # 4. Alternatives: the three shortest loopless routes
+    print("\n--- K Shortest Paths (Yen) ---")
+    for distance, path in k_shortest_paths(road_map, source, target, 3):
+        print(f"Distance: {distance}, Path: {' -> '.join(path)}")
+    # Expected: 8 (A -> B -> D -> F), 8 (A -> C -> E -> F), 9 (A -> C -> D -> F)
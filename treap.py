@@ -0,0 +1,250 @@
+import random
+
+from binarysearchtree import BinarySearchTree
+
+class TreapNode:
+    """
+    A single Node in the Treap.
+    Keys are in BST order and random priorities in max-heap order, which makes
+    the shape that of a BST built from a random insertion order. 'size' (the
+    number of nodes in this subtree) lets split and join keep len() exact.
+    __slots__ keeps every node small: no per-instance __dict__.
+    """
+    __slots__ = ("value", "data", "left", "right", "priority", "size")
+
+    def __init__(self, value, priority):
+        # The key the tree is ordered by, and the data mapped to it
+        self.value = value
+        self.data = None
+        self.left = None
+        self.right = None
+        self.priority = priority
+        self.size = 1
+
+def _size(node):
+    return node.size if node is not None else 0
+
+def _split(node, key):
+    """
+    Splits the treap rooted at node into (keys < key, keys >= key) in
+    O(log n) expected. The two results are built top-down along the search
+    path; the sizes of the path nodes are recomputed bottom-up afterwards.
+    """
+    # The roots of the two parts hang off these placeholders
+    left_head, right_head = TreapNode(None, 0), TreapNode(None, 0)
+    left_tail, right_tail = left_head, right_head
+    path = []
+    while node is not None:
+        path.append(node)
+        if node.value < key:
+            # node and its left subtree belong left; continue with its right subtree
+            left_tail.right = node
+            left_tail = node
+            node = node.right
+        else:
+            right_tail.left = node
+            right_tail = node
+            node = node.left
+    left_tail.right = None
+    right_tail.left = None
+    for node in reversed(path):
+        node.size = 1 + _size(node.left) + _size(node.right)
+    return left_head.right, right_head.left
+
+def _join(left, right):
+    """
+    Joins two treaps where every key of left is smaller than every key of
+    right, in O(log n) expected: at each step the root with the higher
+    priority stays on top and the join continues in its inner subtree.
+    """
+    head = TreapNode(None, 0)
+    parent, attach_left = head, True
+    path = []
+    while left is not None and right is not None:
+        if left.priority > right.priority:
+            # left's root stays; what remains is joined into its right subtree
+            node, left = left, left.right
+            inner_left = False
+        else:
+            node, right = right, right.left
+            inner_left = True
+        if attach_left:
+            parent.left = node
+        else:
+            parent.right = node
+        path.append(node)
+        parent, attach_left = node, inner_left
+    rest = left if left is not None else right
+    if attach_left:
+        parent.left = rest
+    else:
+        parent.right = rest
+    for node in reversed(path):
+        node.size = 1 + _size(node.left) + _size(node.right)
+    return head.left
+
+class Treap(BinarySearchTree):
+    """
+    A randomized Treap with the same interface as BinarySearchTree
+    (insert/delete/search, floor/ceiling, put/get/pop/setdefault, traversals).
+
+    Every node draws a random priority; keeping priorities in heap order gives
+    an expected height of O(log n) for any insertion order, with no balance
+    information to maintain and no rotations: inserts split the subtree the new
+    node displaces, deletes join the removed node's two subtrees. The same
+    split and join work on whole treaps, so split(), join() and delete_range()
+    cut or glue key ranges in O(log n) expected.
+    """
+    def __init__(self, duplicates=False, typecode='q', seed=None):
+        super().__init__(duplicates, typecode)
+        # Source of node priorities; a seed makes the shapes reproducible
+        self._random = random.Random(seed).random
+
+    def _new_empty(self):
+        treap = Treap(self.duplicates, self.typecode)
+        treap._random = self._random
+        return treap
+
+    # --- Insertion and Deletion ---
+
+    def _add(self, key):
+        node, _ = self._find(key)
+        if node is not None:
+            return node, False
+
+        new_node = TreapNode(key, self._random())
+        # Walk down past the nodes that keep a higher priority; each gains a descendant
+        parent = None
+        node = self.root
+        while node is not None and node.priority > new_node.priority:
+            node.size += 1
+            parent = node
+            node = node.left if key < node.value else node.right
+        # The new node takes node's place, with node's subtree split around key below it
+        new_node.left, new_node.right = _split(node, key)
+        new_node.size = 1 + _size(new_node.left) + _size(new_node.right)
+        if parent is None:
+            self.root = new_node
+        elif key < parent.value:
+            parent.left = new_node
+        else:
+            parent.right = new_node
+        self._size += 1
+        return new_node, True
+
+    def _remove(self, node, parent):
+        # Each ancestor loses one descendant
+        key = node.value
+        ancestor = self.root
+        while ancestor is not node:
+            ancestor.size -= 1
+            ancestor = ancestor.left if key < ancestor.value else ancestor.right
+        merged = _join(node.left, node.right)
+        if parent is None:
+            self.root = merged
+        elif parent.left is node:
+            parent.left = merged
+        else:
+            parent.right = merged
+        self._size -= 1
+        return node.data
+
+    # --- Split and Join ---
+
+    def split(self, key):
+        """
+        Moves every key >= key into a new Treap and returns it; the keys below
+        key stay here. O(log n) expected.
+        """
+        other = self._new_empty()
+        self.root, other.root = _split(self.root, key)
+        self._size, other._size = _size(self.root), _size(other.root)
+        return other
+
+    def join(self, other):
+        """
+        Moves every key of other, which must all be greater than the keys
+        here, into this treap (other is left empty). O(log n) expected.
+        """
+        if self.root is not None and other.root is not None:
+            largest = self.root
+            while largest.right is not None:
+                largest = largest.right
+            smallest = other.root
+            while smallest.left is not None:
+                smallest = smallest.left
+            if not largest.value < smallest.value:
+                raise ValueError("every key of the joined treap must be greater than every key here")
+        self.root = _join(self.root, other.root)
+        self._size += other._size
+        other.root, other._size = None, 0
+
+    def delete_range(self, lo, hi):
+        """
+        Removes every key with lo <= key < hi with two splits and one join, in
+        O(log n) expected however many keys are removed. Returns that number.
+        """
+        below, rest = _split(self.root, lo)
+        removed, above = _split(rest, hi)
+        self.root = _join(below, above)
+        self._size -= _size(removed)
+        return _size(removed)
+
+def _benchmark_trees(num_keys=200_000, seed=0):
+    """
+    Compares insert, lookup and delete throughput of AVLTree, RedBlackTree and
+    Treap on the same random keys, through their shared map interface
+    (tree[key] = value, tree.get(key), del tree[key]).
+    """
+    import time
+
+    from avltree import AVLTree
+    from redblacktree import RedBlackTree
+
+    rng = random.Random(seed)
+    keys = rng.sample(range(num_keys * 10), num_keys)
+    lookups = [rng.choice(keys) for _ in range(num_keys)]
+    deletions = rng.sample(keys, num_keys // 2)
+
+    print(f"{num_keys} random keys, operations per second:")
+    for name, tree in (("AVLTree", AVLTree()), ("RedBlackTree", RedBlackTree()), ("Treap", Treap(seed=seed))):
+        started = time.perf_counter()
+        for key in keys:
+            tree[key] = key
+        inserted = time.perf_counter()
+        get = tree.get
+        for key in lookups:
+            get(key)
+        looked_up = time.perf_counter()
+        for key in deletions:
+            del tree[key]
+        finished = time.perf_counter()
+        print(f"  {name}: insert {num_keys / (inserted - started):,.0f}, "
+              f"lookup {num_keys / (looked_up - inserted):,.0f}, "
+              f"delete {len(deletions) / (finished - looked_up):,.0f}")
+
+# --- Example Usage ---
+
+if __name__ == "__main__":
+
+    treap = Treap(seed=42)
+    for val in [50, 30, 70, 20, 40, 60, 80, 10, 90]:
+        treap.put(val, f"item {val}")
+
+    print("--- Treap ---")
+    treap.inorder_traversal()
+    print(f"Root: {treap.root.value} (priority {treap.root.priority:.3f}), size {len(treap)}")
+    print(f"Ceiling of 55: {treap.ceiling(55)}, value: {treap[treap.ceiling(55)]}")
+
+    # Bulk range delete: two splits and a join, no per-key work
+    removed = treap.delete_range(30, 70)
+    print(f"\nDeleted {removed} keys in [30, 70): {list(treap)}")
+
+    # Split off the upper half and glue it back
+    upper = treap.split(70)
+    print(f"Split at 70: {list(treap)} | {list(upper)}")
+    treap.join(upper)
+    print(f"Joined again: {list(treap)}, {len(treap)} keys")
+
+    print("\n--- Benchmark: AVL vs Red-Black vs Treap ---")
+    _benchmark_trees()